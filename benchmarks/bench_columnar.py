@@ -0,0 +1,96 @@
+"""
+Benchmark the columnar execute_sql result format
+
+Compares the serialized payload size and the conversion + serialization
+time of a wide 10k-row /sqlQuery/execSql result returned as row objects
+and in columnar format.
+
+Run from the repository root:
+    python -m benchmarks.bench_columnar
+"""
+import json
+import time
+from src.models import SQLExecutionResult, SQLExecutionResponse
+from src.utils.columnar import to_columnar
+
+ROWS = 10000
+REPEAT = 5
+
+
+def build_fixture(rows: int) -> tuple:
+    """Build a wide result with long column names, as sent by the backend"""
+    columns = {
+        "invoice_id": "Number",
+        "invoice_number": "String",
+        "invoice_amount_excluding_tax": "Number",
+        "invoice_tax_amount": "Number",
+        "buyer_company_name": "String",
+        "buyer_taxpayer_identification_number": "String",
+        "seller_company_name": "String",
+        "seller_bank_account_name": "String",
+        "invoice_issue_date": "String",
+        "reimbursement_status": "String",
+        "is_red_letter_invoice": "Boolean",
+        "remark": "String",
+    }
+    data = [
+        {
+            "invoice_id": i,
+            "invoice_number": f"INV{i:08d}",
+            "invoice_amount_excluding_tax": str(round(i * 1.37, 2)),
+            "invoice_tax_amount": round(i * 0.08, 2),
+            "buyer_company_name": f"客户{i % 300}有限公司",
+            "buyer_taxpayer_identification_number": f"91110000{i:010d}",
+            "seller_company_name": "北京某某科技有限公司",
+            "seller_bank_account_name": "中国工商银行股份有限公司北京分行",
+            "invoice_issue_date": f"2026-{i % 12 + 1:02d}-{i % 28 + 1:02d}",
+            "reimbursement_status": "APPROVED" if i % 3 else "PENDING",
+            "is_red_letter_invoice": "0" if i % 50 else "1",
+            "remark": None if i % 4 else "差旅费报销",
+        }
+        for i in range(rows)
+    ]
+    schema = [{"name": name, "type": type_name} for name, type_name in columns.items()]
+    return data, schema
+
+
+def serialize(result: SQLExecutionResult) -> str:
+    """Serialize the way the execute_sql tool response is produced"""
+    return json.dumps(SQLExecutionResponse(result=result).model_dump(), ensure_ascii=False)
+
+
+def measure(fn) -> tuple:
+    """Return (best time in ms, output) over REPEAT runs"""
+    best, out = float("inf"), None
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, out
+
+
+def main():
+    data, schema = build_fixture(ROWS)
+
+    rows_ms, rows = measure(lambda: serialize(
+        SQLExecutionResult(success=True, data=data, result_schema=schema)
+    ))
+    columnar_ms, columnar = measure(lambda: serialize(
+        SQLExecutionResult(success=True, columnar=to_columnar(data, schema), result_schema=schema)
+    ))
+
+    rows_bytes = len(rows.encode("utf-8"))
+    columnar_bytes = len(columnar.encode("utf-8"))
+
+    print(f"rows={ROWS} columns={len(schema)}")
+    print(f"{'format':<12}{'bytes':>14}{'time (ms)':>12}")
+    print(f"{'rows':<12}{rows_bytes:>14,}{rows_ms:>12.1f}")
+    print(f"{'columnar':<12}{columnar_bytes:>14,}{columnar_ms:>12.1f}")
+    print(
+        f"payload reduction: {1 - columnar_bytes / rows_bytes:.1%}, "
+        f"time reduction: {1 - columnar_ms / rows_ms:.1%}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark server-side projection of execute_apis results
+
+Compares the serialized payload size and the projection + serialization
+time of a large nested /dataApiInfo/callApi style result with and without
+a field projection.
+
+Run from the repository root:
+    python -m benchmarks.bench_projection
+"""
+import json
+import time
+from src.models import ExecutionResult, ExecutionResponse
+from src.utils.projection import compile_projection
+
+ROWS = 5000
+REPEAT = 5
+FIELDS = ["total", "rows[*].id", "rows[*].invoiceNo", "rows[*].amount"]
+
+
+def build_fixture(rows: int) -> dict:
+    """Build a wide, nested paging response"""
+    return {
+        "total": rows,
+        "cp": 1,
+        "ps": rows,
+        "rows": [
+            {
+                "id": i,
+                "invoiceNo": f"INV{i:08d}",
+                "amount": round(i * 1.37, 2),
+                "accountNumber": f"6222{i:012d}",
+                "bankName": "中国工商银行股份有限公司北京分行",
+                "remark": "差旅费报销-" + "x" * 40,
+                "buyer": {"name": f"客户{i}", "taxNo": f"91110000{i:010d}", "address": "北京市海淀区"},
+                "items": [{"name": "服务费", "qty": 1, "price": 100.0}, {"name": "税费", "qty": 1, "price": 6.0}],
+                **{f"ext_{k}": f"value_{k}_{i}" for k in range(20)},
+            }
+            for i in range(rows)
+        ],
+    }
+
+
+def serialize(data) -> str:
+    """Serialize the way the execute_apis tool response is produced"""
+    response = ExecutionResponse(results=[ExecutionResult(api_name="bench", success=True, data=data)])
+    return json.dumps(response.model_dump(), ensure_ascii=False)
+
+
+def measure(fn) -> tuple:
+    """Return (best time in ms, output) over REPEAT runs"""
+    best, out = float("inf"), None
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, out
+
+
+def main():
+    data = build_fixture(ROWS)
+    projection = compile_projection(FIELDS)
+
+    full_ms, full = measure(lambda: serialize(data))
+    projected_ms, projected = measure(lambda: serialize(projection.apply(data)))
+
+    full_bytes = len(full.encode("utf-8"))
+    projected_bytes = len(projected.encode("utf-8"))
+
+    print(f"rows={ROWS} fields={FIELDS}")
+    print(f"{'mode':<12}{'bytes':>14}{'time (ms)':>12}")
+    print(f"{'full':<12}{full_bytes:>14,}{full_ms:>12.1f}")
+    print(f"{'projected':<12}{projected_bytes:>14,}{projected_ms:>12.1f}")
+    print(
+        f"payload reduction: {1 - projected_bytes / full_bytes:.1%}, "
+        f"time reduction: {1 - projected_ms / full_ms:.1%}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark batched information_schema lookups in get_table_fields
+
+Runs get_table_fields against a stand-in /sqlQuery/execSql backend with a
+fixed round-trip latency and a limited number of concurrent queries, once
+with one query per table (fields_batch_size=1, the previous behavior) and
+once with the batched IN (...) query.
+
+Run from the repository root:
+    python -m benchmarks.bench_table_fields
+"""
+import asyncio
+import re
+import time
+from src.data_access import MockDataProvider
+from src.services import SQLService
+
+TABLES = 30
+COLUMNS = 25
+LATENCY = 0.04  # Seconds per backend round trip
+BACKEND_CONCURRENCY = 4  # Queries the backend runs at the same time
+
+
+class StandInBackend(MockDataProvider):
+    """Answers information_schema.columns queries after a simulated round trip"""
+
+    def __init__(self):
+        super().__init__()
+        self.round_trips = 0
+        self._slots = asyncio.Semaphore(BACKEND_CONCURRENCY)
+
+    async def execute_sql(self, app_id, sql, source_name):
+        async with self._slots:
+            self.round_trips += 1
+            await asyncio.sleep(LATENCY)
+        tables = re.findall(r"'(table_\d+)'", sql)
+        rows = [
+            {"table_name": table, "name": f"col_{i}", "type": "varchar", "comment": f"字段{i}",
+             "nullable": True, "default_value": None, "key_type": "PRI" if i == 0 else ""}
+            for table in sorted(tables) for i in range(COLUMNS)
+        ]
+        return {"data": [{"name": "output_standard_chart", "value": rows}]}
+
+
+async def run(batch_size: int) -> tuple:
+    """Return (round trips, time in ms, tables with fields) for one uncached lookup"""
+    backend = StandInBackend()
+    service = SQLService(backend, fields_batch_size=batch_size)
+    names = [f"table_{i}" for i in range(TABLES)]
+    start = time.perf_counter()
+    result = await service.get_table_fields("bench", "db", names)
+    elapsed = (time.perf_counter() - start) * 1000
+    return backend.round_trips, elapsed, sum(1 for info in result if info.fields)
+
+
+async def main():
+    print(f"tables={TABLES} columns={COLUMNS} latency={LATENCY * 1000:.0f}ms "
+          f"backend_concurrency={BACKEND_CONCURRENCY}")
+    print(f"{'mode':<12}{'round trips':>12}{'time (ms)':>12}{'tables':>8}")
+    per_table = await run(batch_size=1)
+    batched = await run(batch_size=100)
+    for label, (trips, ms, found) in (("per-table", per_table), ("batched", batched)):
+        print(f"{label:<12}{trips:>12}{ms:>12.1f}{found:>8}")
+    print(
+        f"round-trip reduction: {1 - batched[0] / per_table[0]:.1%}, "
+        f"time reduction: {1 - batched[1] / per_table[1]:.1%}"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,4 +1,17 @@
 from .base import CacheProvider
 from .memory_cache import MemoryCache
+from .bounded_cache import BoundedMemoryCache
+from .single_flight import SingleFlight
+from .result_store import ResultStore
+from .access_recorder import AccessRecorder, CountMinSketch, RecordingCache
 
-__all__ = ["CacheProvider", "MemoryCache"]
\ No newline at end of file
+__all__ = [
+    "CacheProvider",
+    "MemoryCache",
+    "BoundedMemoryCache",
+    "SingleFlight",
+    "ResultStore",
+    "AccessRecorder",
+    "CountMinSketch",
+    "RecordingCache",
+]
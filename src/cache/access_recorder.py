@@ -0,0 +1,263 @@
+"""Cache access recording with a decaying Count-Min sketch"""
+import hashlib
+import json
+import logging
+import os
+import time
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+from .base import CacheProvider
+
+logger = logging.getLogger(__name__)
+
+
+class CountMinSketch:
+    """
+    Count-Min sketch with halving for aging
+
+    Estimates never undercount; decay() halves every counter so old traffic
+    fades out and the sketch follows the current hot set.
+    """
+
+    def __init__(self, width: int = 2048, depth: int = 4):
+        """
+        Initialize sketch
+
+        Args:
+            width: Counters per row (more = fewer collisions)
+            depth: Number of hash rows
+        """
+        self._width = width
+        self._depth = depth
+        self._rows = [array("l", [0]) * width for _ in range(depth)]
+
+    def _columns(self, key: str) -> List[int]:
+        """Column of the key in every row, from one 64-bit digest"""
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+        value = int.from_bytes(digest, "little")
+        low, high = value & 0xFFFFFFFF, value >> 32
+        # Double hashing: h_i = h1 + i * h2
+        return [(low + i * high) % self._width for i in range(self._depth)]
+
+    def add(self, key: str, count: int = 1) -> int:
+        """
+        Count a key
+
+        Returns:
+            New estimate for the key
+        """
+        estimate = None
+        for row, column in zip(self._rows, self._columns(key)):
+            row[column] += count
+            estimate = row[column] if estimate is None else min(estimate, row[column])
+        return estimate
+
+    def estimate(self, key: str) -> int:
+        """Estimated count of a key"""
+        return min(row[column] for row, column in zip(self._rows, self._columns(key)))
+
+    def decay(self) -> None:
+        """Halve every counter"""
+        for row in self._rows:
+            for column in range(self._width):
+                row[column] >>= 1
+
+
+class AccessRecorder:
+    """
+    Records cache key accesses and tool calls
+
+    Key popularity is tracked in a Count-Min sketch that is halved every
+    decay_interval seconds, plus a small table of the current top keys.
+    When log_path is set every access and tool call is also appended to a
+    JSON Lines log for offline analysis (see utils.access_log_analyzer).
+    """
+
+    def __init__(
+        self,
+        width: int = 2048,
+        depth: int = 4,
+        decay_interval: int = 300,
+        top_k: int = 100,
+        log_path: Optional[str] = None,
+        max_log_bytes: int = 100 * 1024 * 1024,
+        flush_every: int = 200
+    ):
+        """
+        Initialize access recorder
+
+        Args:
+            width: Count-Min sketch width
+            depth: Count-Min sketch depth
+            decay_interval: Seconds between halvings of all counts
+            top_k: Number of hot keys tracked
+            log_path: JSON Lines access log (None = no log)
+            max_log_bytes: Log size before it is rotated to <log_path>.1
+            flush_every: Buffered log records before writing
+        """
+        self._sketch = CountMinSketch(width, depth)
+        self._decay_interval = decay_interval
+        self._top_k = top_k
+        self._log_path = log_path
+        self._max_log_bytes = max_log_bytes
+        self._flush_every = flush_every
+
+        self._candidates: Dict[str, int] = {}
+        self._last_decay = time.time()
+        self._buffer: List[str] = []
+        self._last_tools: Dict[Optional[str], str] = {}  # Session -> previous tool
+        self._transitions: Dict[Tuple[str, str], int] = {}
+        self._stats = {"accesses": 0, "hits": 0}
+
+        if log_path:
+            os.makedirs(os.path.dirname(os.path.abspath(log_path)), exist_ok=True)
+
+    def record(self, key: str, hit: bool) -> None:
+        """
+        Record a cache access
+
+        Args:
+            key: Cache key
+            hit: Whether the key was served from cache
+        """
+        self._maybe_decay()
+        estimate = self._sketch.add(key)
+        self._stats["accesses"] += 1
+        self._stats["hits"] += hit
+
+        if key in self._candidates or len(self._candidates) < 2 * self._top_k:
+            self._candidates[key] = estimate
+        else:
+            coldest = min(self._candidates, key=self._candidates.get)
+            if estimate > self._candidates[coldest]:
+                del self._candidates[coldest]
+                self._candidates[key] = estimate
+
+        self._log({"t": round(time.time(), 3), "k": key, "h": int(hit)})
+
+    def record_tool(self, tool: str, session: Optional[str] = None, size: Optional[int] = None) -> None:
+        """
+        Record a tool call for call-sequence statistics
+
+        Args:
+            tool: Tool name
+            session: Client session identifier
+            size: Size of the main list argument (e.g. number of api_names)
+        """
+        previous = self._last_tools.get(session)
+        if previous:
+            pair = (previous, tool)
+            self._transitions[pair] = self._transitions.get(pair, 0) + 1
+        if len(self._last_tools) > 10000:
+            self._last_tools.clear()
+        self._last_tools[session] = tool
+
+        record = {"t": round(time.time(), 3), "tool": tool, "s": session}
+        if size is not None:
+            record["n"] = size
+        self._log(record)
+
+    def hot_keys(self, limit: Optional[int] = None) -> List[Tuple[str, int]]:
+        """
+        Hottest keys by decayed access count
+
+        Args:
+            limit: Number of keys (None = top_k)
+
+        Returns:
+            (key, estimated count) pairs, hottest first
+        """
+        ranked = sorted(self._candidates.items(), key=lambda item: -item[1])
+        return ranked[:limit or self._top_k]
+
+    def flush(self) -> None:
+        """Write buffered log records"""
+        if not self._buffer or not self._log_path:
+            self._buffer = []
+            return
+        lines, self._buffer = self._buffer, []
+        try:
+            if os.path.exists(self._log_path) and os.path.getsize(self._log_path) > self._max_log_bytes:
+                os.replace(self._log_path, f"{self._log_path}.1")
+            with open(self._log_path, "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+        except OSError as e:
+            logger.warning(f"Failed to write access log {self._log_path}: {e}")
+
+    def _log(self, record: dict) -> None:
+        """Buffer a log record"""
+        if not self._log_path:
+            return
+        self._buffer.append(json.dumps(record, ensure_ascii=False))
+        if len(self._buffer) >= self._flush_every:
+            self.flush()
+
+    def _maybe_decay(self) -> None:
+        """Age all counts once per decay interval"""
+        now = time.time()
+        if now - self._last_decay < self._decay_interval:
+            return
+        self._last_decay = now
+        self._sketch.decay()
+        self._candidates = {
+            key: count >> 1 for key, count in self._candidates.items() if count > 1
+        }
+
+    def get_stats(self) -> dict:
+        """Get access statistics"""
+        accesses = self._stats["accesses"]
+        transitions = sorted(self._transitions.items(), key=lambda item: -item[1])[:10]
+        return {
+            **self._stats,
+            "hit_rate": round(self._stats["hits"] / accesses, 3) if accesses else None,
+            "hot_keys": self.hot_keys(10),
+            "tool_transitions": [f"{a} -> {b}: {n}" for (a, b), n in transitions]
+        }
+
+
+class RecordingCache(CacheProvider):
+    """
+    Cache wrapper recording every lookup and the expiry of every entry
+
+    The expiry table lets the refresh-ahead scheduler reload hot entries
+    shortly before they expire.
+    """
+
+    def __init__(self, cache: CacheProvider, recorder: AccessRecorder, default_ttl: int = 3600):
+        """
+        Initialize recording cache
+
+        Args:
+            cache: Wrapped cache
+            recorder: Access recorder
+            default_ttl: TTL the wrapped cache applies when set() gets none
+        """
+        self._cache = cache
+        self._recorder = recorder
+        self._default_ttl = default_ttl
+        self._expiry: Dict[str, float] = {}
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get value from cache and record the access"""
+        value = await self._cache.get(key)
+        self._recorder.record(key, value is not None)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: int = None) -> None:
+        """Set value in cache and remember its expiry"""
+        await self._cache.set(key, value, ttl)
+        self._expiry[key] = time.time() + (ttl or self._default_ttl)
+
+    async def delete(self, key: str) -> None:
+        """Delete value from cache"""
+        await self._cache.delete(key)
+        self._expiry.pop(key, None)
+
+    async def clear(self) -> None:
+        """Clear all cache"""
+        await self._cache.clear()
+        self._expiry.clear()
+
+    def expires_at(self, key: str) -> Optional[float]:
+        """Expiry timestamp of a key, None if it was never set"""
+        return self._expiry.get(key)
@@ -0,0 +1,98 @@
+"""In-memory LRU cache with TTL support and a memory cap"""
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+from .base import CacheProvider
+
+
+def json_size(value: Any) -> int:
+    """Approximate memory size of a value: its JSON length"""
+    if hasattr(value, "model_dump_json"):
+        return len(value.model_dump_json())
+    return len(json.dumps(value, ensure_ascii=False, default=str))
+
+
+class BoundedMemoryCache(CacheProvider):
+    """
+    In-memory cache with TTL support, evicting least recently used entries
+    once the cached values exceed max_bytes
+
+    Values larger than max_entry_bytes are not cached at all, so one huge
+    result cannot flush everything else.
+    """
+
+    def __init__(
+        self,
+        default_ttl: int = 300,
+        max_bytes: int = 64 * 1024 * 1024,
+        max_entry_bytes: Optional[int] = None,
+        sizer: Callable[[Any], int] = json_size
+    ):
+        """
+        Initialize bounded cache
+
+        Args:
+            default_ttl: Default time to live in seconds
+            max_bytes: Total size of cached values before evicting
+            max_entry_bytes: Largest cacheable value (None = max_bytes / 8)
+            sizer: Function estimating the size of a value
+        """
+        self._cache: "OrderedDict[str, tuple]" = OrderedDict()  # Key -> (value, expiry, size)
+        self._default_ttl = default_ttl
+        self._max_bytes = max_bytes
+        self._max_entry_bytes = max_entry_bytes or max_bytes // 8
+        self._sizer = sizer
+        self._bytes = 0
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "rejected": 0}
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get value from cache"""
+        entry = self._cache.get(key)
+        if entry is None:
+            self._stats["misses"] += 1
+            return None
+
+        value, expiry, _ = entry
+        if time.time() > expiry:
+            self._remove(key)
+            self._stats["misses"] += 1
+            return None
+
+        self._cache.move_to_end(key)
+        self._stats["hits"] += 1
+        return value
+
+    async def set(self, key: str, value: Any, ttl: int = None) -> None:
+        """Set value in cache with TTL, evicting old entries to stay under the cap"""
+        size = self._sizer(value)
+        self._remove(key)
+        if size > self._max_entry_bytes:
+            self._stats["rejected"] += 1
+            return
+
+        self._cache[key] = (value, time.time() + (ttl or self._default_ttl), size)
+        self._bytes += size
+        while self._bytes > self._max_bytes and self._cache:
+            oldest = next(iter(self._cache))
+            self._remove(oldest)
+            self._stats["evictions"] += 1
+
+    async def delete(self, key: str) -> None:
+        """Delete value from cache"""
+        self._remove(key)
+
+    async def clear(self) -> None:
+        """Clear all cache"""
+        self._cache.clear()
+        self._bytes = 0
+
+    def _remove(self, key: str) -> None:
+        """Drop an entry and release its size"""
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
+    def get_stats(self) -> dict:
+        """Get cache statistics"""
+        return {**self._stats, "keys": len(self._cache), "bytes": self._bytes}
@@ -0,0 +1,276 @@
+"""Server-side store for large results, read back page by page"""
+import asyncio
+import json
+import logging
+import os
+import time
+import uuid
+from array import array
+from collections import OrderedDict
+from typing import Any, List, Optional, Tuple
+from ..models import PageInfo
+from ..utils.errors import ResultNotFoundError
+
+logger = logging.getLogger(__name__)
+
+
+class _StoredResult:
+    """Rows of one stored result, held in memory or spilled to a JSON Lines file"""
+
+    def __init__(self, app_id: str, rows: List[Any], size: int, expiry: float):
+        self.app_id = app_id
+        self.rows: Optional[List[Any]] = rows
+        self.total = len(rows)
+        self.size = size
+        self.expiry = expiry
+        self.path: Optional[str] = None
+        self.offsets: Optional[array] = None  # Byte offset of every row in the spill file
+
+
+class ResultStore:
+    """
+    LRU + TTL bounded store for large results
+
+    Results larger than the threshold are kept server-side and only their
+    first page is returned to the client, together with a cursor that
+    fetch_result_page can use to read further slices without re-running
+    the query. When the memory cap is exceeded the least recently used
+    results are spilled to disk if a spill directory is configured, and
+    dropped otherwise. A result larger than the memory cap on its own goes
+    straight to disk; if it cannot be kept, only a truncated first page is
+    returned.
+    """
+
+    def __init__(
+        self,
+        threshold_bytes: int = 64 * 1024,
+        page_size: int = 100,
+        ttl: int = 1800,
+        max_bytes: int = 256 * 1024 * 1024,
+        spill_dir: Optional[str] = None,
+        max_spill_bytes: int = 2 * 1024 * 1024 * 1024,
+        max_page_size: int = 1000
+    ):
+        """
+        Initialize result store
+
+        Args:
+            threshold_bytes: Results with a larger JSON size are stored and paged
+            page_size: Default number of rows per page
+            ttl: Seconds a stored result stays readable
+            max_bytes: Memory cap for stored results
+            spill_dir: Directory for results evicted from memory (None = drop them)
+            max_spill_bytes: Disk cap for spilled results
+            max_page_size: Largest page a caller may ask for
+        """
+        self._threshold_bytes = threshold_bytes
+        self._page_size = page_size
+        self._ttl = ttl
+        self._max_bytes = max_bytes
+        self._spill_dir = spill_dir
+        self._max_spill_bytes = max_spill_bytes
+        self._max_page_size = max_page_size
+
+        self._entries: "OrderedDict[str, _StoredResult]" = OrderedDict()
+        self._memory_bytes = 0
+        self._spill_bytes = 0
+
+        if spill_dir:
+            os.makedirs(spill_dir, exist_ok=True)
+
+    async def offload(
+        self,
+        app_id: str,
+        rows: List[Any],
+        force: bool = False,
+        first_page_size: Optional[int] = None
+    ) -> Optional[Tuple[List[Any], PageInfo]]:
+        """
+        Store rows server-side if they are too large to return at once
+
+        Args:
+            app_id: Application identifier the result belongs to
+            rows: Result rows
+            force: Store even when below the size threshold
+            first_page_size: Rows in the returned first page (None = default page size)
+
+        Returns:
+            (first page, page info) if stored, None if the rows should be returned as is.
+            A result that cannot be kept returns its first page with page.truncated set
+            and no next_cursor.
+        """
+        if len(rows) <= self._page_size and not force:
+            return None
+
+        size = len(json.dumps(rows, ensure_ascii=False, default=str))
+        if size <= self._threshold_bytes and not force:
+            return None
+
+        self._purge()
+        result_id = uuid.uuid4().hex
+        entry = _StoredResult(app_id, rows, size, time.time() + self._ttl)
+        if size > self._max_bytes:
+            # Larger than the whole memory cap: spill it directly instead of evicting everything else
+            if not await self._spill_new(result_id, entry):
+                return self._truncated_page(rows, first_page_size)
+        else:
+            self._entries[result_id] = entry
+            self._memory_bytes += size
+        logger.info(f"Stored result {result_id}: {len(rows)} rows, {size} bytes")
+
+        await self._enforce_memory_cap()
+        if result_id not in self._entries:
+            return self._truncated_page(rows, first_page_size)
+        return await self.get_page(app_id, f"{result_id}:0", first_page_size)
+
+    async def _spill_new(self, result_id: str, entry: _StoredResult) -> bool:
+        """Store a new entry on disk without holding it in memory; False if it cannot be spilled"""
+        if not self._spill_dir:
+            return False
+        try:
+            await asyncio.to_thread(self._spill, result_id, entry)
+        except OSError as e:
+            logger.warning(f"Failed to spill result {result_id}: {e}")
+            return False
+        self._entries[result_id] = entry
+        return True
+
+    def _truncated_page(self, rows: List[Any], page_size: Optional[int]) -> Tuple[List[Any], PageInfo]:
+        """First page of a result too large to keep, flagged as truncated"""
+        first_page = rows[:min(page_size or self._page_size, self._max_page_size)]
+        logger.warning(f"Result of {len(rows)} rows is too large to store, returning {len(first_page)}")
+        return first_page, PageInfo(
+            offset=0,
+            returned_rows=len(first_page),
+            total_rows=len(rows),
+            truncated=True
+        )
+
+    async def get_page(
+        self, app_id: str, cursor: str, page_size: Optional[int] = None
+    ) -> Tuple[List[Any], PageInfo]:
+        """
+        Read a page of a stored result
+
+        Args:
+            app_id: Application identifier (must match the one that stored the result)
+            cursor: Cursor returned with a previous page
+            page_size: Rows per page (None = default page size, capped at max_page_size)
+
+        Returns:
+            (rows, page info)
+
+        Raises:
+            ValueError: If page_size is less than 1
+            ResultNotFoundError: If the cursor is unknown, expired or of another app
+        """
+        if page_size is not None and page_size < 1:
+            raise ValueError(f"page_size must be at least 1, got {page_size}")
+        result_id, _, offset_text = cursor.partition(":")
+        entry = self._entries.get(result_id)
+        if (
+            entry is None
+            or entry.app_id != app_id
+            or time.time() > entry.expiry
+            or not offset_text.isdigit()
+        ):
+            raise ResultNotFoundError(cursor)
+
+        self._entries.move_to_end(result_id)
+        offset = int(offset_text)
+        limit = min(page_size or self._page_size, self._max_page_size)
+        end = min(offset + limit, entry.total)
+
+        if entry.rows is not None:
+            rows = entry.rows[offset:end]
+        else:
+            rows = await asyncio.to_thread(self._read_spilled, entry, offset, end)
+
+        next_cursor = f"{result_id}:{end}" if end < entry.total else None
+        return rows, PageInfo(
+            offset=offset,
+            returned_rows=len(rows),
+            total_rows=entry.total,
+            next_cursor=next_cursor
+        )
+
+    async def _enforce_memory_cap(self) -> None:
+        """Spill or drop least recently used in-memory results until under the cap"""
+        for result_id, entry in list(self._entries.items()):
+            if self._memory_bytes <= self._max_bytes:
+                break
+            if entry.rows is None:
+                continue
+
+            self._memory_bytes -= entry.size
+            if self._spill_dir:
+                try:
+                    await asyncio.to_thread(self._spill, result_id, entry)
+                    continue
+                except OSError as e:
+                    logger.warning(f"Failed to spill result {result_id}: {e}")
+            self._entries.pop(result_id, None)
+
+        # Disk cap: drop the least recently used spilled results
+        for result_id, entry in list(self._entries.items()):
+            if self._spill_bytes <= self._max_spill_bytes:
+                break
+            if entry.path:
+                self._remove(result_id)
+
+    def _spill(self, result_id: str, entry: _StoredResult) -> None:
+        """Write an entry's rows to a JSON Lines file and release the memory"""
+        path = os.path.join(self._spill_dir, f"{result_id}.jsonl")
+        offsets = array("q")
+        with open(path, "wb") as f:
+            for row in entry.rows:
+                offsets.append(f.tell())
+                f.write(json.dumps(row, ensure_ascii=False, default=str).encode("utf-8"))
+                f.write(b"\n")
+            size = f.tell()
+
+        entry.path = path
+        entry.offsets = offsets
+        entry.rows = None
+        entry.size = size
+        self._spill_bytes += size
+
+    @staticmethod
+    def _read_spilled(entry: _StoredResult, start: int, end: int) -> List[Any]:
+        """Read rows [start, end) from a spill file"""
+        if start >= end:
+            return []
+        with open(entry.path, "rb") as f:
+            f.seek(entry.offsets[start])
+            return [json.loads(f.readline()) for _ in range(end - start)]
+
+    def _purge(self) -> None:
+        """Drop expired results"""
+        now = time.time()
+        for result_id, entry in list(self._entries.items()):
+            if now > entry.expiry:
+                self._remove(result_id)
+
+    def _remove(self, result_id: str) -> None:
+        """Remove a result from memory or disk"""
+        entry = self._entries.pop(result_id, None)
+        if entry is None:
+            return
+        if entry.rows is not None:
+            self._memory_bytes -= entry.size
+        elif entry.path:
+            self._spill_bytes -= entry.size
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+    def get_stats(self) -> dict:
+        """Get result store statistics"""
+        spilled = sum(1 for entry in self._entries.values() if entry.rows is None)
+        return {
+            "results": len(self._entries),
+            "spilled_results": spilled,
+            "memory_bytes": self._memory_bytes,
+            "spill_bytes": self._spill_bytes
+        }
@@ -0,0 +1,39 @@
+"""Collapse identical concurrent calls into one in-flight call"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+
+class SingleFlight:
+    """Share one in-flight call between concurrent callers of the same key"""
+
+    def __init__(self):
+        """Initialize with no in-flight calls"""
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run fn once for all concurrent callers with the same key
+
+        Args:
+            key: Deduplication key
+            fn: Zero-argument coroutine function performing the call
+
+        Returns:
+            Result of the shared call
+        """
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fn())
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+
+        # Shield so a cancelled caller does not cancel the call for the others
+        return await asyncio.shield(future)
+
+    def _forget(self, key: str, future: asyncio.Future) -> None:
+        """Drop a finished call from the in-flight table"""
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+
+    def __len__(self) -> int:
+        return len(self._inflight)
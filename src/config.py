@@ -1,6 +1,6 @@
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import Literal
+from typing import Dict, Literal, Optional
 import yaml
 from pathlib import Path
 import os
@@ -27,12 +27,150 @@ class CacheSettings(BaseSettings):
     type: Literal["memory", "redis"] = "memory"
 
 
+class AccessSettings(BaseSettings):
+    """Cache access recording and refresh-ahead of hot keys"""
+    enabled: bool = False
+    log_path: Optional[str] = None  # JSON Lines access log for offline analysis
+    decay_interval: int = 300  # Seconds between halvings of the access counts
+    top_k: int = 50  # Hot keys tracked and considered for refresh
+    refresh_ahead: bool = True
+    refresh_qps: float = 2.0  # Backend calls per second spent on refreshes
+    refresh_interval: int = 30  # Seconds between refresh rounds
+    refresh_lead_time: int = 120  # Refresh keys expiring within this many seconds
+
+
+class BatchingSettings(BaseSettings):
+    """Micro-batching of get_api_details backend calls"""
+    enabled: bool = True
+    min_window_ms: float = 1.0  # Window used when traffic is light
+    max_window_ms: float = 10.0  # Upper bound for the adaptive window
+    max_batch_size: int = 50  # Max unique API names per backend call
+    target_batch_size: int = 8  # Callers the adaptive window aims to collect
+    idle_timeout: float = 60.0  # Seconds without requests before an app's arrival statistics are dropped
+
+
+class ExecutionCacheSettings(BaseSettings):
+    """Opt-in result caching for read-only execute_apis calls"""
+    enabled: bool = False
+    default_ttl: int = 300  # 5 minutes in seconds
+    max_bytes: int = 64 * 1024 * 1024  # Memory cap for cached results
+    # Read-only API names allowed to be cached, mapped to their TTL (null = default_ttl)
+    apis: Dict[str, Optional[int]] = Field(default_factory=dict)
+
+
+class SweepSettings(BaseSettings):
+    """Limits of execute_api_sweep"""
+    max_concurrency: int = Field(default=20, ge=1)  # Upper bound for a sweep's concurrency
+    max_rows: int = Field(default=1000, ge=1)  # Rows (calls) accepted per sweep
+
+
+class PrefetchSettings(BaseSettings):
+    """Speculative prefetch of API details after get_apis_by_category"""
+    enabled: bool = False
+    max_names: int = 5  # Details warmed per listing
+    rate: float = Field(default=5.0, gt=0)  # Maximum names prefetched per second
+    batch_size: int = Field(default=5, gt=0)  # Names per backend call
+
+
+class CatalogSettings(BaseSettings):
+    """In-memory catalog snapshot (categories, API lists, API details) per app"""
+    enabled: bool = True
+    sync_interval: int = 300  # Seconds between background syncs
+    concurrency: int = 4  # Concurrent backend calls during a sync
+    detail_batch_size: int = 50  # API names per get_api_details call
+    idle_timeout: int = 3600  # Seconds without reads before an app's catalog is dropped
+
+
+class SearchSettings(BaseSettings):
+    """Full-text index behind the search_apis tool"""
+    enabled: bool = True
+    ngram_size: int = 2  # Character n-gram size for Chinese text
+    default_limit: int = 10
+    wait_timeout: float = 5.0  # Seconds a first search waits for the catalog sync
+
+
+class DescribeCategorySettings(BaseSettings):
+    """Size cap of describe_category responses"""
+    max_apis: int = 30  # API details returned per call
+    max_bytes: int = 64 * 1024  # JSON size of the returned details
+
+
+class NameIndexSettings(BaseSettings):
+    """Index of known API names used to reject invented names without backend calls"""
+    enabled: bool = True
+    max_age: int = 3600  # Seconds before the index is rebuilt from the category listings
+    build_concurrency: int = 4  # Concurrent category fetches while building
+
+
+class ValidationSettings(BaseSettings):
+    """Pre-flight parameter validation against cached API details"""
+    enabled: bool = True
+    mode: Literal["reject", "coerce"] = "coerce"  # Coerce convertible values or reject them
+
+
+class SQLSchemaSettings(BaseSettings):
+    """Caching of get_sql_tables / get_sql_table_fields metadata"""
+    cache_enabled: bool = True
+    ttl: int = 600  # Seconds table lists and table fields stay cached
+    fields_batch_size: int = 100  # Tables per information_schema.columns query
+    snapshot_enabled: bool = True  # Keep every table and column of a database in memory
+    refresh_interval: int = 600  # Seconds between background reloads of a snapshot
+    idle_timeout: int = 3600  # Seconds without reads before a database's snapshot is dropped
+    ngram_size: int = 2  # Character n-gram size for Chinese comments in search_sql_schema
+    default_limit: int = 10
+
+
+class SQLLimitSettings(BaseSettings):
+    """Automatic row limit for execute_sql SELECTs without LIMIT"""
+    enabled: bool = True
+    max_rows: int = 1000  # Rows returned before the result is truncated
+
+
+class SummarizeSettings(BaseSettings):
+    """Server-side summaries for summarize execute_sql / execute_apis calls"""
+    top_k: int = 5  # Most frequent values listed per column
+    histogram_bins: int = 10
+    sample_rows: int = 5  # Rows returned next to the summary
+    max_rows: int = 100000  # Row limit of summarized SELECTs without LIMIT
+
+
+class SQLResultCacheSettings(BaseSettings):
+    """Opt-in result caching for read-only execute_sql queries"""
+    enabled: bool = False
+    default_ttl: int = 60  # Seconds
+    max_bytes: int = 64 * 1024 * 1024  # Memory cap for cached results
+    # Database name -> TTL for its results (null = default_ttl)
+    databases: Dict[str, Optional[int]] = Field(default_factory=dict)
+
+
+class JobSettings(BaseSettings):
+    """Asynchronous job execution"""
+    max_workers: int = 4  # Jobs running at the same time
+    max_queued: int = 100  # Unfinished jobs accepted before rejecting submissions
+    result_ttl: int = 900  # Seconds finished jobs are kept
+    max_result_bytes: int = 50 * 1024 * 1024  # Memory cap for finished results
+
+
+class ResultStoreSettings(BaseSettings):
+    """Server-side storage and paging of large results"""
+    enabled: bool = True
+    threshold_bytes: int = 64 * 1024  # Larger results are stored and paged
+    page_size: int = 100  # Rows returned per page
+    max_page_size: int = 1000  # Largest page_size fetch_result_page accepts
+    ttl: int = 1800  # Seconds a stored result stays readable
+    max_bytes: int = 256 * 1024 * 1024  # Memory cap before spilling / dropping
+    spill_dir: Optional[str] = None  # Directory for spilled results (None = no spilling)
+    max_spill_bytes: int = 2 * 1024 * 1024 * 1024
+
+
 class BackendSettings(BaseSettings):
     """Backend API configuration"""
     chatgpt_service_url: str = "http://chatgpt-api-service:31001"
     chatdb_service_url: str = "http://chatdb-visual-service:31001"
     workflow_service_url: str = "http://llm-workflow-service:31001"
     timeout: int = 60
+    # Concurrent category listings for multi-category requests
+    listing_concurrency: int = Field(default=8, ge=1)
 
     model_config = SettingsConfigDict(env_prefix="BACKEND_")
 
@@ -52,6 +190,22 @@ class Settings(BaseSettings):
 
     server: ServerSettings = Field(default_factory=ServerSettings)
     cache: CacheSettings = Field(default_factory=CacheSettings)
+    access: AccessSettings = Field(default_factory=AccessSettings)
+    batching: BatchingSettings = Field(default_factory=BatchingSettings)
+    execution_cache: ExecutionCacheSettings = Field(default_factory=ExecutionCacheSettings)
+    sweep: SweepSettings = Field(default_factory=SweepSettings)
+    prefetch: PrefetchSettings = Field(default_factory=PrefetchSettings)
+    catalog: CatalogSettings = Field(default_factory=CatalogSettings)
+    search: SearchSettings = Field(default_factory=SearchSettings)
+    describe_category: DescribeCategorySettings = Field(default_factory=DescribeCategorySettings)
+    name_index: NameIndexSettings = Field(default_factory=NameIndexSettings)
+    validation: ValidationSettings = Field(default_factory=ValidationSettings)
+    sql_schema: SQLSchemaSettings = Field(default_factory=SQLSchemaSettings)
+    sql_limits: SQLLimitSettings = Field(default_factory=SQLLimitSettings)
+    summarize: SummarizeSettings = Field(default_factory=SummarizeSettings)
+    sql_result_cache: SQLResultCacheSettings = Field(default_factory=SQLResultCacheSettings)
+    jobs: JobSettings = Field(default_factory=JobSettings)
+    result_store: ResultStoreSettings = Field(default_factory=ResultStoreSettings)
     backend: BackendSettings = Field(default_factory=BackendSettings)
     logging: LoggingSettings = Field(default_factory=LoggingSettings)
 
@@ -69,12 +223,44 @@ class Settings(BaseSettings):
         # because Settings extends BaseSettings with env_file support
         server_config = config_data.get("server", {})
         cache_config = config_data.get("cache", {})
+        access_config = config_data.get("access", {})
+        batching_config = config_data.get("batching", {})
+        execution_cache_config = config_data.get("execution_cache", {})
+        sweep_config = config_data.get("sweep", {})
+        prefetch_config = config_data.get("prefetch", {})
+        catalog_config = config_data.get("catalog", {})
+        search_config = config_data.get("search", {})
+        describe_category_config = config_data.get("describe_category", {})
+        name_index_config = config_data.get("name_index", {})
+        validation_config = config_data.get("validation", {})
+        sql_schema_config = config_data.get("sql_schema", {})
+        sql_limits_config = config_data.get("sql_limits", {})
+        summarize_config = config_data.get("summarize", {})
+        sql_result_cache_config = config_data.get("sql_result_cache", {})
+        jobs_config = config_data.get("jobs", {})
+        result_store_config = config_data.get("result_store", {})
         backend_config = config_data.get("backend", {})
         logging_config = config_data.get("logging", {})
 
         return cls(
             server=ServerSettings(**server_config),
             cache=CacheSettings(**cache_config),
+            access=AccessSettings(**access_config),
+            batching=BatchingSettings(**batching_config),
+            execution_cache=ExecutionCacheSettings(**execution_cache_config),
+            sweep=SweepSettings(**sweep_config),
+            prefetch=PrefetchSettings(**prefetch_config),
+            catalog=CatalogSettings(**catalog_config),
+            search=SearchSettings(**search_config),
+            describe_category=DescribeCategorySettings(**describe_category_config),
+            name_index=NameIndexSettings(**name_index_config),
+            validation=ValidationSettings(**validation_config),
+            sql_schema=SQLSchemaSettings(**sql_schema_config),
+            sql_limits=SQLLimitSettings(**sql_limits_config),
+            summarize=SummarizeSettings(**summarize_config),
+            sql_result_cache=SQLResultCacheSettings(**sql_result_cache_config),
+            jobs=JobSettings(**jobs_config),
+            result_store=ResultStoreSettings(**result_store_config),
             backend=BackendSettings(**backend_config),
             logging=LoggingSettings(**logging_config)
         )
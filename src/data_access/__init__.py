@@ -1,5 +1,12 @@
 from .base import DataProvider
 from .mock_provider import MockDataProvider
 from .api_provider import APIDataProvider
+from .category_tree import CategoryTree, flatten_category_tree
 
-__all__ = ["DataProvider", "MockDataProvider", "APIDataProvider"]
\ No newline at end of file
+__all__ = [
+    "DataProvider",
+    "MockDataProvider",
+    "APIDataProvider",
+    "CategoryTree",
+    "flatten_category_tree",
+]
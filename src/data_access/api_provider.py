@@ -3,6 +3,7 @@ import httpx
 import logging
 from typing import List
 from .base import DataProvider
+from .category_tree import flatten_category_tree
 from ..models import Category, APIBasic, APIDetail, ExecutionRequest, ExecutionResult, Parameter
 from ..config import Settings
 from ..utils.errors import InvalidAppIdError, CategoryNotFoundError, APINotFoundError, APIExecutionError
@@ -58,6 +59,10 @@ class APIDataProvider(DataProvider):
 
     async def get_categories(self, app_id: str) -> List[Category]:
         """Get categories from backend and flatten the tree structure"""
+        return self._flatten_categories(await self.get_category_tree(app_id))
+
+    async def get_category_tree(self, app_id: str) -> List[dict]:
+        """Get the raw category tree from backend"""
         try:
             response = await self._chatgpt_client.get(
                 "/file/directory",
@@ -71,9 +76,7 @@ class APIDataProvider(DataProvider):
                 error_msg = data.get("message", {}).get("message", "Unknown error")
                 raise Exception(f"Failed to get categories: {error_msg}")
 
-            # Flatten the category tree
-            categories_data = data.get("data", [])
-            return self._flatten_categories(categories_data)
+            return data.get("data") or []
 
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error getting categories for app {app_id}: {e}")
@@ -86,7 +89,7 @@ class APIDataProvider(DataProvider):
 
     def _flatten_categories(self, categories: List[dict], parent_name: str = "") -> List[Category]:
         """
-        Recursively flatten category tree structure
+        Flatten category tree structure
 
         Args:
             categories: List of category dictionaries with potential children
@@ -95,23 +98,7 @@ class APIDataProvider(DataProvider):
         Returns:
             Flattened list of Category objects
         """
-        result = []
-        for cat in categories:
-            # Build full name with parent prefix
-            full_name = f"{parent_name}>{cat['name']}" if parent_name else cat['name']
-
-            # Add current category
-            result.append(Category(
-                id=str(cat['id']),
-                name=full_name,
-                description=""
-            ))
-
-            # Recursively process children
-            if cat.get('children'):
-                result.extend(self._flatten_categories(cat['children'], full_name))
-
-        return result
+        return flatten_category_tree(categories, parent_name)
 
     async def get_apis_by_category(
         self, app_id: str, category_id: str
@@ -194,6 +181,7 @@ class APIDataProvider(DataProvider):
             Parameter(
                 name=p.get("name", ""),
                 type=p.get("type") or "string",
+                type_declared=bool(p.get("type")),
                 required=p.get("isNecessary") == "是",
                 description=p.get("desc", ""),
                 default=p.get("content")
@@ -33,6 +33,25 @@ class DataProvider(ABC):
         """
         pass
 
+    async def get_category_tree(self, app_id: str) -> List[dict]:
+        """
+        Get the raw category tree for an app
+
+        Nodes look like {"id", "name", "parentId", "children"}, optionally with
+        "updateAt"/"totalNumber" change markers. The default builds a flat
+        tree from get_categories.
+
+        Args:
+            app_id: Application identifier
+
+        Returns:
+            Root category nodes
+        """
+        return [
+            {"id": category.id, "name": category.name, "parentId": None, "children": None}
+            for category in await self.get_categories(app_id)
+        ]
+
     @abstractmethod
     async def get_apis_by_category(
         self, app_id: str, category_id: str
@@ -0,0 +1,158 @@
+"""Indexed node table for the raw /file/directory category tree"""
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+from ..models import Category
+
+# Change marker of a category node: (updateAt, totalNumber), None if the backend sends neither
+CategorySignature = Optional[Tuple[Any, Any]]
+
+
+class CategoryTree:
+    """
+    Category tree stored as a flat node table in preorder
+
+    Node attributes live in parallel lists indexed by position; children of
+    node i are child_positions[child_offsets[i]:child_offsets[i + 1]]. The
+    table is built iteratively, so deep trees cannot hit the recursion limit,
+    and Category objects are only created for the nodes that are returned.
+    """
+
+    def __init__(self):
+        """Initialize an empty tree"""
+        self.ids: List[str] = []
+        self.names: List[str] = []  # Full names, parent>child
+        self.parents: List[int] = []  # Parent position, -1 for roots
+        self.depths: List[int] = []  # 1 for roots
+        self.signatures: List[CategorySignature] = []
+        self.roots: List[int] = []
+        self._child_offsets = array("i", [0])
+        self._child_positions = array("i")
+        self._positions: Dict[str, int] = {}
+        self._categories: List[Optional[Category]] = []
+
+    @classmethod
+    def build(cls, categories: List[dict], parent_name: str = "") -> "CategoryTree":
+        """
+        Build the node table from raw category dictionaries
+
+        Args:
+            categories: Root category dictionaries with potential children
+            parent_name: Name prefix for the roots
+
+        Returns:
+            Category tree
+        """
+        tree = cls()
+        children: List[List[int]] = []
+        stack = [(cat, -1, parent_name, 1) for cat in reversed(categories)]
+        while stack:
+            cat, parent, prefix, depth = stack.pop()
+            position = len(tree.ids)
+            full_name = f"{prefix}>{cat['name']}" if prefix else cat['name']
+            category_id = str(cat['id'])
+
+            tree.ids.append(category_id)
+            tree.names.append(full_name)
+            tree.parents.append(parent)
+            tree.depths.append(depth)
+            update_at, total = cat.get("updateAt"), cat.get("totalNumber")
+            tree.signatures.append(
+                None if update_at is None and total is None else (update_at, total)
+            )
+            tree._positions.setdefault(category_id, position)
+            children.append([])
+            if parent < 0:
+                tree.roots.append(position)
+            else:
+                children[parent].append(position)
+
+            # Reversed so children are popped, and numbered, in their original order
+            for child in reversed(cat.get('children') or []):
+                stack.append((child, position, full_name, depth + 1))
+
+        for positions in children:
+            tree._child_positions.extend(positions)
+            tree._child_offsets.append(len(tree._child_positions))
+        tree._categories = [None] * len(tree.ids)
+        return tree
+
+    def position(self, category_id: str) -> Optional[int]:
+        """Position of a category in the node table, None if unknown"""
+        return self._positions.get(category_id)
+
+    def children(self, position: int) -> List[int]:
+        """Positions of a node's direct children"""
+        return list(self._child_positions[self._child_offsets[position]:self._child_offsets[position + 1]])
+
+    def category(self, position: int) -> Category:
+        """Category object of a node (created on first use)"""
+        category = self._categories[position]
+        if category is None:
+            parent = self.parents[position]
+            category = Category(
+                id=self.ids[position],
+                name=self.names[position],
+                description="",
+                parent_id=self.ids[parent] if parent >= 0 else None,
+                child_count=self._child_offsets[position + 1] - self._child_offsets[position]
+            )
+            self._categories[position] = category
+        return category
+
+    def to_categories(self) -> List[Category]:
+        """Every category, parents before their children"""
+        return [self.category(position) for position in range(len(self.ids))]
+
+    def expand(self, parent_id: Optional[str] = None, depth: Optional[int] = None) -> List[Category]:
+        """
+        Categories below a node, down to a given depth
+
+        Args:
+            parent_id: Category to expand (None = the roots)
+            depth: Levels to return (1 = direct children only, None = all)
+
+        Returns:
+            Categories in preorder
+
+        Raises:
+            KeyError: If parent_id is not in the tree
+        """
+        if parent_id is None:
+            if depth is None:
+                return self.to_categories()
+            start = self.roots
+        else:
+            position = self._positions.get(parent_id)
+            if position is None:
+                raise KeyError(parent_id)
+            start = self.children(position)
+
+        result = []
+        stack = [(position, 1) for position in reversed(start)]
+        while stack:
+            position, level = stack.pop()
+            result.append(self.category(position))
+            if depth is None or level < depth:
+                stack.extend((child, level + 1) for child in reversed(self.children(position)))
+        return result
+
+    def signature_map(self) -> Dict[str, CategorySignature]:
+        """Category id -> (updateAt, totalNumber), or None when the node has neither"""
+        return dict(zip(self.ids, self.signatures))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+def flatten_category_tree(categories: List[dict], parent_name: str = "") -> List[Category]:
+    """
+    Flatten category tree structure
+
+    Args:
+        categories: List of category dictionaries with potential children
+        parent_name: Parent category name for building hierarchical names
+
+    Returns:
+        Flattened list of Category objects
+    """
+    return CategoryTree.build(categories, parent_name).to_categories()
@@ -198,7 +198,6 @@ class MockDataProvider(DataProvider):
         return [
             APIBasic(
                 name=api.name,
-                description=api.description,
                 category_id=api.category_id
             )
             for api in apis
@@ -295,3 +294,13 @@ class MockDataProvider(DataProvider):
                 success=True,
                 data={"message": "Mock execution successful", "parameters": execution.parameters}
             )
+
+    async def execute_sql(self, app_id: str, sql: str, source_name: str) -> dict:
+        """Execute SQL query (mock execution returns an empty result set)"""
+        return {
+            "data": [
+                {"name": "output_standard_chart", "type": "dict", "value": []},
+                {"name": "output_json_schema", "type": "dict", "value": []}
+            ],
+            "message": {"code": 0, "message": "success", "status": 200}
+        }
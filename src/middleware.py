@@ -0,0 +1,37 @@
+"""FastMCP middleware"""
+from typing import Optional
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+from .cache.access_recorder import AccessRecorder
+from .services.refresh_scheduler import RefreshAheadScheduler
+
+
+class ToolAccessMiddleware(Middleware):
+    """Records every tool call for access-pattern statistics"""
+
+    def __init__(self, recorder: AccessRecorder, scheduler: Optional[RefreshAheadScheduler] = None):
+        """
+        Initialize middleware
+
+        Args:
+            recorder: Access recorder
+            scheduler: Refresh-ahead scheduler, started on the first tool call
+        """
+        self._recorder = recorder
+        self._scheduler = scheduler
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next):
+        """Record the tool name, session and size of its list argument, then run the tool"""
+        if self._scheduler:
+            self._scheduler.ensure_started()
+
+        arguments = context.message.arguments or {}
+        sizes = [len(value) for value in arguments.values() if isinstance(value, list)]
+        session = None
+        if context.fastmcp_context is not None:
+            try:
+                session = context.fastmcp_context.session_id
+            except Exception:
+                session = None
+
+        self._recorder.record_tool(context.message.name, session, sizes[0] if sizes else None)
+        return await call_next(context)
@@ -1,16 +1,23 @@
 from .session import SessionContext
 from .category import Category
-from .api import Parameter, APIBasic, APIDetail
-from .execution import ExecutionRequest, ExecutionResult
-from .sql import TableInfo, FieldInfo, TableFieldsInfo, SQLExecutionResult
+from .api import Parameter, APIBasic, APIDetail, APISearchHit
+from .execution import PaginationSpec, ExecutionRequest, ExecutionResult, SweepRequest, SweepResult
+from .sql import TableInfo, FieldInfo, TableFieldsInfo, SchemaSearchHit, ColumnarData, SQLExecutionResult
+from .job import JobKind, JobStatus, JobResponse
+from .paging import PageInfo, ResultPageResponse
+from .summary import ValueCount, Histogram, ColumnSummary, ResultSummary
 from .responses import (
     InitializeResponse,
     CategoriesResponse,
     APIsResponse,
     APIDetailsResponse,
+    CategoryDescriptionResponse,
+    APISearchResponse,
     ExecutionResponse,
+    SweepResponse,
     TablesResponse,
     TableFieldsResponse,
+    SchemaSearchResponse,
     SQLExecutionResponse
 )
 
@@ -20,18 +27,37 @@ __all__ = [
     "Parameter",
     "APIBasic",
     "APIDetail",
+    "APISearchHit",
+    "PaginationSpec",
     "ExecutionRequest",
     "ExecutionResult",
+    "SweepRequest",
+    "SweepResult",
     "TableInfo",
     "FieldInfo",
     "TableFieldsInfo",
+    "SchemaSearchHit",
+    "ColumnarData",
     "SQLExecutionResult",
+    "JobKind",
+    "JobStatus",
+    "JobResponse",
+    "PageInfo",
+    "ResultPageResponse",
+    "ValueCount",
+    "Histogram",
+    "ColumnSummary",
+    "ResultSummary",
     "InitializeResponse",
     "CategoriesResponse",
     "APIsResponse",
     "APIDetailsResponse",
+    "CategoryDescriptionResponse",
+    "APISearchResponse",
     "ExecutionResponse",
+    "SweepResponse",
     "TablesResponse",
     "TableFieldsResponse",
+    "SchemaSearchResponse",
     "SQLExecutionResponse",
 ]
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Any, Optional
 
 
@@ -9,6 +9,8 @@ class Parameter(BaseModel):
     required: bool
     description: str
     default: Optional[Any] = None
+    # False when the backend gave no type and "type" is a placeholder; not serialized
+    type_declared: bool = Field(default=True, exclude=True)
 
 
 class APIBasic(BaseModel):
@@ -19,5 +21,15 @@ class APIBasic(BaseModel):
 
 class APIDetail(APIBasic):
     """Detailed API information including parameters"""
+    description: str = ""
     parameters: List[Parameter]
     response_schema: dict
+
+
+class APISearchHit(BaseModel):
+    """API matched by search_apis"""
+    name: str
+    category_id: Optional[str] = None
+    category: Optional[str] = None  # Full category path (parent>child)
+    description: Optional[str] = None
+    score: float
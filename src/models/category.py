@@ -1,4 +1,5 @@
 from pydantic import BaseModel
+from typing import Optional
 
 
 class Category(BaseModel):
@@ -6,3 +7,5 @@ class Category(BaseModel):
     id: str
     name: str
     description: str
+    parent_id: Optional[str] = None
+    child_count: int = 0  # Number of direct children, for lazy expansion
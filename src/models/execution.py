@@ -1,11 +1,30 @@
-from pydantic import BaseModel
-from typing import Any, Optional
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional
+from .paging import PageInfo
+from .summary import ResultSummary
+
+
+class PaginationSpec(BaseModel):
+    """Automatic pagination of a paged backend API"""
+    page_param: str = "cp"  # Page number parameter
+    size_param: str = "ps"  # Page size parameter
+    page_size: Optional[int] = Field(default=None, ge=1)  # Defaults to parameters[size_param], then 100
+    start_page: int = 1
+    max_pages: int = Field(default=20, ge=1)
+    max_rows: Optional[int] = None
+    rows_path: Optional[str] = None  # Path of the row list in data (default: longest list)
+    total_path: Optional[str] = None  # Path of the total row count (default: auto-detect)
+    concurrency: int = Field(default=5, ge=1)  # Pages fetched at the same time
 
 
 class ExecutionRequest(BaseModel):
     """API execution request"""
     api_name: str
     parameters: dict
+    id: Optional[str] = None  # Name other executions use in {"$ref": "<id>.data..."}
+    fields: Optional[List[str]] = None  # Projection paths applied to the result data
+    paginate: Optional[PaginationSpec] = None  # Fetch all pages and merge their rows
+    summarize: bool = False  # Return statistics of the longest list and a few sample rows
 
 
 class ExecutionResult(BaseModel):
@@ -14,3 +33,24 @@ class ExecutionResult(BaseModel):
     success: bool
     data: Optional[Any] = None
     error: Optional[str] = None
+    page: Optional[PageInfo] = None  # Set when data was truncated to its first page
+    summary: Optional[ResultSummary] = None  # Statistics of the longest list (summarize mode)
+
+
+class SweepRequest(BaseModel):
+    """One API called over many parameter sets"""
+    api_name: str
+    base_parameters: dict = {}
+    vary: Dict[str, List[Any]]  # Parameter name -> values; columns are zipped row by row
+    fields: Optional[List[str]] = None  # Projection paths applied to every row's data
+    concurrency: int = 10
+
+
+class SweepResult(BaseModel):
+    """Columnar result of a parameter sweep"""
+    api_name: str
+    count: int
+    succeeded: int
+    data: List[Any]  # Result data per row (None where the call failed)
+    error_mask: List[bool]  # True where the call failed
+    errors: Dict[int, str] = {}  # Row index -> error message, failed rows only
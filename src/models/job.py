@@ -0,0 +1,26 @@
+"""Asynchronous job models"""
+from pydantic import BaseModel, Field
+from typing import Any, Literal, Optional
+
+# Kinds of work a job can run
+JobKind = Literal["execute_apis", "execute_sql"]
+
+
+class JobStatus(BaseModel):
+    """Status of an asynchronous job"""
+    job_id: str = Field(description="Job identifier")
+    kind: JobKind = Field(description="Type of work")
+    status: Literal["queued", "running", "succeeded", "failed"] = Field(description="Job state")
+    progress: int = Field(default=0, description="Completed units of work")
+    total: int = Field(default=1, description="Total units of work")
+    created_at: float = Field(description="Submission time (unix seconds)")
+    started_at: Optional[float] = Field(default=None, description="Start time (unix seconds)")
+    finished_at: Optional[float] = Field(default=None, description="Finish time (unix seconds)")
+    error: Optional[str] = Field(default=None, description="Error message if failed")
+
+
+class JobResponse(BaseModel):
+    """Response for job tools"""
+    job: JobStatus
+    result: Optional[Any] = Field(default=None, description="Final or partial result")
+    partial: bool = Field(default=False, description="Whether result holds only the finished part")
@@ -0,0 +1,22 @@
+"""Result paging models"""
+from pydantic import BaseModel, Field
+from typing import Any, List, Optional
+
+
+class PageInfo(BaseModel):
+    """Paging information for a result stored server-side"""
+    offset: int = Field(description="Index of the first row in this page")
+    returned_rows: int = Field(description="Number of rows in this page")
+    total_rows: int = Field(description="Total number of rows in the stored result")
+    next_cursor: Optional[str] = Field(default=None, description="Cursor for fetch_result_page, None on the last page")
+    path: Optional[str] = Field(default=None, description="Location of the paged rows inside the result data")
+    truncated: bool = Field(
+        default=False,
+        description="Result was too large to store: only this page was kept, the other rows are dropped"
+    )
+
+
+class ResultPageResponse(BaseModel):
+    """Response for fetch_result_page tool"""
+    rows: List[Any]
+    page: PageInfo
@@ -1,9 +1,9 @@
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Dict, List, Optional
 from .category import Category
-from .api import APIBasic, APIDetail
-from .execution import ExecutionResult
-from .sql import TableInfo, TableFieldsInfo, SQLExecutionResult
+from .api import APIBasic, APIDetail, APISearchHit
+from .execution import ExecutionResult, SweepResult
+from .sql import TableInfo, TableFieldsInfo, SchemaSearchHit, SQLExecutionResult
 
 
 class InitializeResponse(BaseModel):
@@ -26,6 +26,23 @@ class APIsResponse(BaseModel):
 class APIDetailsResponse(BaseModel):
     """Response for get_api_details tool"""
     apis: List[APIDetail]
+    unknown_apis: Dict[str, List[str]] = {}  # Unknown name -> suggested existing names
+
+
+class CategoryDescriptionResponse(BaseModel):
+    """Response for describe_category tool"""
+    category_id: str
+    total_apis: int  # APIs in the category matching the name filter
+    apis: List[APIDetail]
+    omitted_apis: List[str] = []  # Matching APIs left out by the size cap
+    truncated: bool = False
+
+
+class APISearchResponse(BaseModel):
+    """Response for search_apis tool"""
+    query: str
+    results: List[APISearchHit]
+    partial: bool = False  # Only part of the catalog was indexed; later searches may find more
 
 
 class ExecutionResponse(BaseModel):
@@ -33,6 +50,11 @@ class ExecutionResponse(BaseModel):
     results: List[ExecutionResult]
 
 
+class SweepResponse(BaseModel):
+    """Response for execute_api_sweep tool"""
+    result: SweepResult
+
+
 class TablesResponse(BaseModel):
     """Response for get_sql_tables tool"""
     tables: List[TableInfo]
@@ -44,6 +66,13 @@ class TableFieldsResponse(BaseModel):
     table_fields: List[TableFieldsInfo]
 
 
+class SchemaSearchResponse(BaseModel):
+    """Response for search_sql_schema tool"""
+    query: str
+    database_name: Optional[str] = None
+    results: List[SchemaSearchHit]
+
+
 class SQLExecutionResponse(BaseModel):
     """Response for execute_sql tool"""
     result: SQLExecutionResult
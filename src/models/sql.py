@@ -1,6 +1,8 @@
 """SQL-related data models"""
 from pydantic import BaseModel, Field, ConfigDict
 from typing import List, Optional, Any
+from .paging import PageInfo
+from .summary import ResultSummary
 
 
 class TableInfo(BaseModel):
@@ -25,12 +27,40 @@ class TableFieldsInfo(BaseModel):
     fields: List[FieldInfo] = Field(description="List of fields")
 
 
+class SchemaSearchHit(BaseModel):
+    """Table or column matched by search_sql_schema"""
+    table_name: str = Field(description="Table name")
+    table_comment: Optional[str] = Field(default=None, description="Table comment")
+    column_name: Optional[str] = Field(default=None, description="Column name (None for a table match)")
+    column_type: Optional[str] = Field(default=None, description="Column data type")
+    column_comment: Optional[str] = Field(default=None, description="Column comment")
+    score: float = Field(description="Relevance score")
+
+
+class ColumnarData(BaseModel):
+    """Column-oriented result: column names once, one value array per column"""
+    columns: List[str] = Field(description="Column names")
+    types: List[str] = Field(description="Column types from output_json_schema (inferred if absent)")
+    values: List[List[Any]] = Field(description="values[c][r] is column c of row r")
+    null_mask: List[Optional[List[bool]]] = Field(
+        description="null_mask[c][r] is true where the value is NULL; None for columns without NULLs"
+    )
+    row_count: int = Field(description="Number of rows")
+
+
 class SQLExecutionResult(BaseModel):
     """SQL execution result"""
     model_config = ConfigDict(populate_by_name=True)
 
     success: bool = Field(description="Whether execution succeeded")
     data: Optional[List[dict]] = Field(default=None, description="Query result data")
+    columnar: Optional[ColumnarData] = Field(default=None, description="Query result data in columnar format")
+    summary: Optional[ResultSummary] = Field(default=None, description="Per-column statistics in summarize mode")
     result_schema: Optional[List[dict]] = Field(default=None, description="Result schema", alias="schema")
     error: Optional[str] = Field(default=None, description="Error message if failed")
+    page: Optional[PageInfo] = Field(default=None, description="Paging info when data holds only the first page")
+    truncated: bool = Field(default=False, description="Whether the automatic row limit cut off further rows")
+    continuation_token: Optional[str] = Field(
+        default=None, description="Pass to execute_sql to read the rows after a truncated result"
+    )
 
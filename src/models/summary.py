@@ -0,0 +1,38 @@
+"""Result summary models"""
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional, Union
+
+
+class ValueCount(BaseModel):
+    """A value and how often it occurs"""
+    value: Any
+    count: int
+
+
+class Histogram(BaseModel):
+    """Equal-width histogram of a numeric column"""
+    edges: List[float] = Field(description="Bin edges; bin i covers [edges[i], edges[i + 1])")
+    counts: List[int] = Field(description="Values per bin")
+
+
+class ColumnSummary(BaseModel):
+    """Statistics of one result column"""
+    name: str
+    type: str = Field(description="number, boolean, string or mixed")
+    count: int = Field(description="Non-null values")
+    null_count: int
+    distinct_count: int
+    top_values: List[ValueCount] = Field(default_factory=list, description="Most frequent values")
+    min: Optional[Any] = None
+    max: Optional[Any] = None
+    sum: Optional[Union[int, float]] = Field(default=None, description="Exact for integer columns")
+    mean: Optional[float] = None
+    std: Optional[float] = None
+    quantiles: Optional[Dict[str, float]] = Field(default=None, description="p25, p50 (median), p75")
+    histogram: Optional[Histogram] = None
+
+
+class ResultSummary(BaseModel):
+    """Per-column statistics of a result, computed server-side"""
+    row_count: int
+    columns: List[ColumnSummary]
@@ -1,13 +1,19 @@
 """FastMCP Server Entry Point"""
 from fastmcp import FastMCP, Context
-from typing import List, Optional
+from typing import Any, Dict, List, Literal, Optional
 import logging
 import json
 from .config import Settings
 from .data_access import APIDataProvider
-from .cache import MemoryCache
-from .services import CategoryService, APIService, ExecutionService, SQLService
-from .models import ExecutionRequest
+from .cache import MemoryCache, BoundedMemoryCache, ResultStore, AccessRecorder, RecordingCache
+from .middleware import ToolAccessMiddleware
+from .services import (
+    CategoryService, APIService, ExecutionService, SQLService, APIDetailBatcher, JobService,
+    ParameterValidator, APINameIndex, CatalogService, APISearchIndex, DetailPrefetcher,
+    RefreshAheadScheduler, SQLSchemaService
+)
+from .models import ExecutionRequest, JobKind, SweepRequest
+from .utils.summarize import ResultSummarizer
 
 # Initialize settings
 settings = Settings.from_yaml()
@@ -23,7 +29,10 @@ logger = logging.getLogger("mcp_data_api")
 # Create FastMCP instance
 mcp = FastMCP(name = "API Data Server",instructions="""
 工具调用参数约束:
-1. 调用get_api_details工具入参api_names必须是get_apis_by_category工具返回的name参数
+1. 调用get_api_details工具入参api_names必须是get_apis_by_category、get_apis_by_categories或search_apis工具返回的name参数
+2. 浏览分类时可调用describe_category一次获取分类下的API列表及详情
+3. 不确定使用哪个API时，优先调用search_apis按关键字搜索，而不是逐个遍历分类
+4. 不确定数据在哪张表时，优先调用search_sql_schema按关键字搜索表和字段，而不是逐个获取表字段
 """)
 
 logger.info("=" * 80)
@@ -37,16 +46,200 @@ data_provider = APIDataProvider(settings)
 logger.info(f"Creating cache: MemoryCache (TTL={settings.cache.ttl}s)")
 cache = MemoryCache(default_ttl=settings.cache.ttl)
 
+access_recorder = None
+if settings.access.enabled:
+    logger.info(
+        f"Recording cache accesses (top_k={settings.access.top_k}, log={settings.access.log_path})"
+    )
+    access_recorder = AccessRecorder(
+        decay_interval=settings.access.decay_interval,
+        top_k=settings.access.top_k,
+        log_path=settings.access.log_path
+    )
+    cache = RecordingCache(cache, access_recorder, default_ttl=settings.cache.ttl)
+
+result_store = None
+if settings.result_store.enabled:
+    logger.info(
+        f"Creating result store: ResultStore (threshold={settings.result_store.threshold_bytes}B, "
+        f"page_size={settings.result_store.page_size}, spill_dir={settings.result_store.spill_dir})"
+    )
+    result_store = ResultStore(
+        threshold_bytes=settings.result_store.threshold_bytes,
+        page_size=settings.result_store.page_size,
+        ttl=settings.result_store.ttl,
+        max_bytes=settings.result_store.max_bytes,
+        spill_dir=settings.result_store.spill_dir,
+        max_spill_bytes=settings.result_store.max_spill_bytes,
+        max_page_size=settings.result_store.max_page_size
+    )
+
 # Create services
 logger.info("Initializing services:")
+name_index = None
+if settings.name_index.enabled:
+    logger.info(f"  - APINameIndex (max_age={settings.name_index.max_age}s)")
+    name_index = APINameIndex()
+search_index = None
+if settings.search.enabled:
+    logger.info(f"  - APISearchIndex (ngram_size={settings.search.ngram_size})")
+    search_index = APISearchIndex(ngram_size=settings.search.ngram_size)
+catalog_service = None
+if settings.catalog.enabled:
+    logger.info(f"  - CatalogService (sync_interval={settings.catalog.sync_interval}s)")
+    catalog_service = CatalogService(
+        data_provider,
+        sync_interval=settings.catalog.sync_interval,
+        concurrency=settings.catalog.concurrency,
+        detail_batch_size=settings.catalog.detail_batch_size,
+        name_index=name_index,
+        search_index=search_index,
+        idle_timeout=settings.catalog.idle_timeout
+    )
 logger.info("  - CategoryService")
-category_service = CategoryService(data_provider, cache)
+category_service = CategoryService(data_provider, cache, catalog_service)
+detail_batcher = None
+if settings.batching.enabled:
+    logger.info(
+        f"  - APIDetailBatcher (window={settings.batching.min_window_ms}"
+        f"-{settings.batching.max_window_ms}ms, max_batch={settings.batching.max_batch_size})"
+    )
+    detail_batcher = APIDetailBatcher(
+        data_provider,
+        min_window_ms=settings.batching.min_window_ms,
+        max_window_ms=settings.batching.max_window_ms,
+        max_batch_size=settings.batching.max_batch_size,
+        target_batch_size=settings.batching.target_batch_size,
+        idle_timeout=settings.batching.idle_timeout
+    )
+prefetcher = None
+if settings.prefetch.enabled:
+    logger.info(
+        f"  - DetailPrefetcher (max_names={settings.prefetch.max_names}, "
+        f"rate={settings.prefetch.rate}/s)"
+    )
+    prefetcher = DetailPrefetcher(
+        max_names=settings.prefetch.max_names,
+        rate=settings.prefetch.rate,
+        batch_size=settings.prefetch.batch_size
+    )
 logger.info("  - APIService")
-api_service = APIService(data_provider, cache)
-logger.info("  - ExecutionService")
-execution_service = ExecutionService(data_provider)
-logger.info("  - SQLService")
-sql_service = SQLService(data_provider)
+api_service = APIService(
+    data_provider,
+    cache,
+    detail_batcher,
+    category_service=category_service,
+    name_index=name_index,
+    name_index_max_age=settings.name_index.max_age,
+    name_index_concurrency=settings.name_index.build_concurrency,
+    listing_concurrency=settings.backend.listing_concurrency,
+    catalog=catalog_service,
+    search_index=search_index,
+    prefetcher=prefetcher,
+    search_wait=settings.search.wait_timeout
+)
+parameter_validator = None
+if settings.validation.enabled:
+    logger.info(f"  - ParameterValidator (mode={settings.validation.mode})")
+    parameter_validator = ParameterValidator(
+        api_service, coerce=settings.validation.mode == "coerce"
+    )
+execution_result_cache = None
+if settings.execution_cache.enabled:
+    logger.info(
+        f"  - ExecutionService (result cache for {len(settings.execution_cache.apis)} API(s), "
+        f"max_bytes={settings.execution_cache.max_bytes})"
+    )
+    execution_result_cache = BoundedMemoryCache(
+        default_ttl=settings.execution_cache.default_ttl,
+        max_bytes=settings.execution_cache.max_bytes
+    )
+else:
+    logger.info("  - ExecutionService")
+summarizer = ResultSummarizer(
+    top_k=settings.summarize.top_k, histogram_bins=settings.summarize.histogram_bins
+)
+execution_service = ExecutionService(
+    data_provider,
+    result_cache=execution_result_cache,
+    cacheable_apis=settings.execution_cache.apis,
+    default_result_ttl=settings.execution_cache.default_ttl,
+    result_store=result_store,
+    validator=parameter_validator,
+    api_service=api_service if name_index else None,
+    summarizer=summarizer,
+    summary_sample_rows=settings.summarize.sample_rows,
+    sweep_max_concurrency=settings.sweep.max_concurrency,
+    sweep_max_rows=settings.sweep.max_rows
+)
+schema_service = None
+if settings.sql_schema.snapshot_enabled:
+    logger.info(f"  - SQLSchemaService (refresh_interval={settings.sql_schema.refresh_interval}s)")
+    schema_service = SQLSchemaService(
+        data_provider,
+        refresh_interval=settings.sql_schema.refresh_interval,
+        ngram_size=settings.sql_schema.ngram_size,
+        idle_timeout=settings.sql_schema.idle_timeout
+    )
+sql_result_cache = None
+if settings.sql_result_cache.enabled:
+    logger.info(
+        f"  - SQL result cache (default TTL={settings.sql_result_cache.default_ttl}s, "
+        f"max_bytes={settings.sql_result_cache.max_bytes})"
+    )
+    sql_result_cache = BoundedMemoryCache(
+        default_ttl=settings.sql_result_cache.default_ttl,
+        max_bytes=settings.sql_result_cache.max_bytes
+    )
+if settings.sql_schema.cache_enabled:
+    logger.info(f"  - SQLService (schema cache TTL={settings.sql_schema.ttl}s)")
+else:
+    logger.info("  - SQLService")
+sql_service = SQLService(
+    data_provider,
+    result_store,
+    cache=cache if settings.sql_schema.cache_enabled else None,
+    schema_ttl=settings.sql_schema.ttl,
+    fields_batch_size=settings.sql_schema.fields_batch_size,
+    schema=schema_service,
+    result_cache=sql_result_cache,
+    result_ttls=settings.sql_result_cache.databases,
+    default_result_ttl=settings.sql_result_cache.default_ttl,
+    max_rows=settings.sql_limits.max_rows if settings.sql_limits.enabled else None,
+    summarizer=summarizer,
+    summary_sample_rows=settings.summarize.sample_rows,
+    summary_max_rows=settings.summarize.max_rows
+)
+logger.info(f"  - JobService (workers={settings.jobs.max_workers}, result TTL={settings.jobs.result_ttl}s)")
+job_service = JobService(
+    execution_service,
+    sql_service,
+    max_workers=settings.jobs.max_workers,
+    max_queued=settings.jobs.max_queued,
+    result_ttl=settings.jobs.result_ttl,
+    max_result_bytes=settings.jobs.max_result_bytes
+)
+refresh_scheduler = None
+if access_recorder and settings.access.refresh_ahead:
+    logger.info(
+        f"  - RefreshAheadScheduler (qps={settings.access.refresh_qps}, "
+        f"lead_time={settings.access.refresh_lead_time}s)"
+    )
+    refresh_scheduler = RefreshAheadScheduler(
+        cache,
+        access_recorder,
+        top_k=settings.access.top_k,
+        qps=settings.access.refresh_qps,
+        interval=settings.access.refresh_interval,
+        lead_time=settings.access.refresh_lead_time
+    )
+    refresh_scheduler.register(
+        "category_tree", lambda app_id, _: category_service.refresh_category_tree(app_id)
+    )
+    refresh_scheduler.register("apis", api_service.refresh_listings)
+    refresh_scheduler.register("api_detail", api_service.refresh_details, batch=True)
+if access_recorder:
+    mcp.add_middleware(ToolAccessMiddleware(access_recorder, refresh_scheduler))
 logger.info("All services initialized successfully")
 
 
@@ -132,18 +325,31 @@ def get_db_name_from_request() -> Optional[str]:
 
 
 @mcp.tool()
-async def get_categories(ctx: Context) -> dict:
+async def get_categories(
+    ctx: Context,
+    parent_id: Optional[str] = None,
+    depth: Optional[int] = None
+) -> dict:
     """
-    Get all API categories for the current session.
+    Get API categories for the current session.
+
+    Large trees can be expanded lazily: call with depth=1 for the top level,
+    then with parent_id of a category whose child_count is non-zero.
+
+    Args:
+        parent_id: Only return categories below this category (default: from the top level)
+        depth: Number of levels to return (1 = direct children only; default: all)
 
     Returns:
-        List of available categories
+        List of available categories with parent_id and child_count
     """
     logger.info("=" * 80)
     logger.info("MCP TOOL CALL: get_categories")
     logger.info("=" * 80)
-    logger.info("Description: Retrieve all available API categories")
-    logger.info("Parameters: None")
+    logger.info("Description: Retrieve available API categories")
+    logger.info(f"Parameters:")
+    logger.info(f"  - parent_id: {parent_id}")
+    logger.info(f"  - depth: {depth}")
 
     from .tools import get_categories_tool
 
@@ -156,7 +362,7 @@ async def get_categories(ctx: Context) -> dict:
         app_id = get_app_id_from_request()
 
     logger.info("Executing tool logic...")
-    result = await get_categories_tool(app_id, category_service)
+    result = await get_categories_tool(app_id, category_service, parent_id, depth)
 
     logger.info(f"✓ Tool execution completed successfully")
     logger.info(f"  Result: Found {len(result.categories)} categories")
@@ -167,12 +373,13 @@ async def get_categories(ctx: Context) -> dict:
 
 
 @mcp.tool()
-async def get_apis_by_category(category_id: str, ctx: Context) -> dict:
+async def get_apis_by_category(category_id: str, ctx: Context, recursive: bool = False) -> dict:
     """
     Get all APIs in a specific category.
 
     Args:
         category_id: Category identifier
+        recursive: Also return the APIs of all sub-categories (default False)
 
     Returns:
         List of APIs with basic information
@@ -183,6 +390,7 @@ async def get_apis_by_category(category_id: str, ctx: Context) -> dict:
     logger.info("Description: Retrieve all APIs in a specific category")
     logger.info(f"Parameters:")
     logger.info(f"  - category_id: {category_id}")
+    logger.info(f"  - recursive: {recursive}")
 
     from .tools import get_apis_by_category_tool
 
@@ -195,7 +403,7 @@ async def get_apis_by_category(category_id: str, ctx: Context) -> dict:
         app_id = get_app_id_from_request()
 
     logger.info("Executing tool logic...")
-    result = await get_apis_by_category_tool(app_id, api_service, category_id)
+    result = await get_apis_by_category_tool(app_id, api_service, category_id, recursive)
 
     logger.info(f"✓ Tool execution completed successfully")
     logger.info(f"  Result: Found {len(result.apis)} APIs in category '{category_id}'")
@@ -205,6 +413,48 @@ async def get_apis_by_category(category_id: str, ctx: Context) -> dict:
     return result.model_dump()
 
 
+@mcp.tool()
+async def get_apis_by_categories(
+    category_ids: List[str],
+    ctx: Context,
+    recursive: bool = True
+) -> dict:
+    """
+    Get the APIs of several categories in one call, including their sub-categories.
+
+    Use this instead of calling get_apis_by_category once per category, e.g. to
+    list everything under a top-level category.
+
+    Args:
+        category_ids: Category identifiers
+        recursive: Also return the APIs of all sub-categories (default True)
+
+    Returns:
+        Merged list of APIs with basic information (each API listed once)
+    """
+    logger.info("=" * 80)
+    logger.info("MCP TOOL CALL: get_apis_by_categories")
+    logger.info("=" * 80)
+    logger.info("Description: Retrieve the APIs of several categories and their sub-categories")
+    logger.info(f"Parameters:")
+    logger.info(f"  - category_ids: {category_ids} (count: {len(category_ids)})")
+    logger.info(f"  - recursive: {recursive}")
+
+    from .tools import get_apis_by_categories_tool
+
+    app_id = get_app_id_from_request()
+
+    logger.info("Executing tool logic...")
+    result = await get_apis_by_categories_tool(app_id, api_service, category_ids, recursive)
+
+    logger.info(f"✓ Tool execution completed successfully")
+    logger.info(f"  Result: Found {len(result.apis)} APIs in {len(category_ids)} categories")
+    logger.debug(f"  APIs: {[api.name for api in result.apis]}")
+    logger.info("=" * 80)
+
+    return result.model_dump()
+
+
 @mcp.tool()
 async def get_api_details(api_names: List[str], ctx: Context) -> dict:
     """
@@ -214,7 +464,8 @@ async def get_api_details(api_names: List[str], ctx: Context) -> dict:
         api_names: List of API names to get details (请注意使用get_apis_by_category工具中的 name 字段中的值，而不是description字段)
 
     Returns:
-        Detailed API information including parameters
+        Detailed API information including parameters. Names that do not exist are listed
+        in unknown_apis with the closest existing names.
     """
     logger.info("=" * 80)
     logger.info("MCP TOOL CALL: get_api_details")
@@ -238,6 +489,10 @@ async def get_api_details(api_names: List[str], ctx: Context) -> dict:
 
     logger.info(f"✓ Tool execution completed successfully")
     logger.info(f"  Result: Retrieved details for {len(result.apis)} APIs")
+    for name, suggestions in result.unknown_apis.items():
+        logger.warning(f"    Unknown API '{name}', suggestions: {suggestions}")
+    if prefetcher:
+        logger.info(f"  Prefetch: {prefetcher.get_stats()}")
     for api in result.apis:
         logger.debug(f"    - {api.name}: {len(api.parameters)} parameters")
     logger.info("=" * 80)
@@ -246,15 +501,125 @@ async def get_api_details(api_names: List[str], ctx: Context) -> dict:
 
 
 @mcp.tool()
-async def execute_apis(executions: List[dict], ctx: Context) -> dict:
+async def describe_category(
+    category_id: str,
+    ctx: Context,
+    name_filter: Optional[str] = None,
+    recursive: bool = False
+) -> dict:
+    """
+    Get the APIs of a category together with their details in one call.
+
+    Replaces get_apis_by_category followed by get_api_details. If the category
+    holds more APIs than fit in one response, the rest are listed in
+    omitted_apis; fetch them with get_api_details or narrow with name_filter.
+
+    Args:
+        category_id: Category identifier
+        name_filter: Only APIs whose name contains this text
+        recursive: Also include the APIs of all sub-categories (default False)
+
+    Returns:
+        API details, the total number of matching APIs and the omitted names
+    """
+    logger.info("=" * 80)
+    logger.info("MCP TOOL CALL: describe_category")
+    logger.info("=" * 80)
+    logger.info("Description: Retrieve the APIs of a category with their details")
+    logger.info(f"Parameters:")
+    logger.info(f"  - category_id: {category_id}")
+    logger.info(f"  - name_filter: {name_filter}")
+    logger.info(f"  - recursive: {recursive}")
+
+    from .tools import describe_category_tool
+
+    app_id = get_app_id_from_request()
+
+    logger.info("Executing tool logic...")
+    result = await describe_category_tool(
+        app_id,
+        api_service,
+        category_id,
+        name_filter=name_filter,
+        recursive=recursive,
+        max_apis=settings.describe_category.max_apis,
+        max_bytes=settings.describe_category.max_bytes
+    )
+
+    logger.info(f"✓ Tool execution completed successfully")
+    logger.info(
+        f"  Result: {len(result.apis)}/{result.total_apis} API details"
+        f"{' (truncated)' if result.truncated else ''}"
+    )
+    logger.info("=" * 80)
+
+    return result.model_dump()
+
+
+@mcp.tool()
+async def search_apis(query: str, ctx: Context, limit: Optional[int] = None) -> dict:
+    """
+    Search APIs by keywords instead of walking the category tree.
+
+    Matches API names, descriptions, category paths and parameter descriptions
+    (Chinese keywords such as 开户行 or 发票 work). Use the returned names with
+    get_api_details or execute_apis.
+
+    Args:
+        query: Keywords describing what the API should do or return
+        limit: Maximum number of results (default 10)
+
+    Returns:
+        Ranked APIs with category and description. partial=true means the catalog is
+        still being indexed; search again later for complete results.
+    """
+    logger.info("=" * 80)
+    logger.info("MCP TOOL CALL: search_apis")
+    logger.info("=" * 80)
+    logger.info("Description: Full-text search over API metadata")
+    logger.info(f"Parameters:")
+    logger.info(f"  - query: {query}")
+    logger.info(f"  - limit: {limit}")
+
+    from .tools import search_apis_tool
+
+    app_id = get_app_id_from_request()
+
+    logger.info("Executing tool logic...")
+    result = await search_apis_tool(
+        app_id, api_service, query, limit or settings.search.default_limit
+    )
+
+    logger.info(f"✓ Tool execution completed successfully")
+    logger.info(f"  Result: {len(result.results)} matching APIs" + (" (partial index)" if result.partial else ""))
+    for hit in result.results:
+        logger.debug(f"    - {hit.name} ({hit.score})")
+    logger.info("=" * 80)
+
+    return result.model_dump()
+
+
+@mcp.tool()
+async def execute_apis(executions: List[dict], ctx: Context, stream: bool = False) -> dict:
     """
     Execute multiple API calls.
 
     Args:
-        executions: List of API execution requests (each with api_name and parameters)
+        executions: List of API execution requests (each with api_name and parameters, and
+            optionally fields: a list of paths such as "total" or "rows[*].id" to keep only
+            those parts of the result data). Give an execution an id to use its result in
+            another execution's parameters: {"$ref": "<id>.data.rows[0].id"}. Dependent
+            executions run after the ones they reference, all in this single call.
+            For paged APIs (cp/ps parameters) set paginate, e.g. {"max_pages": 10}, to fetch
+            all pages concurrently and get the rows merged in one result.
+            Set "summarize": true to get per-column statistics (summary) of the result's
+            longest list and a few sample rows instead of all its rows.
+        stream: If true, each result is also sent as a progress notification as soon as
+            it finishes (message is the JSON result with its request index)
 
     Returns:
-        Execution results for all APIs
+        Execution results for all APIs. Large results contain only the first page of
+        their longest list (page.path); use fetch_result_page with page.next_cursor.
     """
     logger.info("=" * 80)
     logger.info("MCP TOOL CALL: execute_apis")
@@ -262,8 +627,11 @@ async def execute_apis(executions: List[dict], ctx: Context) -> dict:
     logger.info("Description: Execute multiple API calls")
     logger.info(f"Parameters:")
     logger.info(f"  - executions: {len(executions)} API call(s)")
+    logger.info(f"  - stream: {stream}")
     for i, ex in enumerate(executions, 1):
         logger.info(f"    [{i}] api_name: {ex.get('api_name')}")
+        if ex.get('fields'):
+            logger.info(f"        fields: {ex.get('fields')}")
         logger.debug(f"        parameters: {json.dumps(ex.get('parameters', {}), indent=10)}")
 
     from .tools import execute_apis_tool
@@ -280,9 +648,20 @@ async def execute_apis(executions: List[dict], ctx: Context) -> dict:
     logger.info("Converting execution requests to ExecutionRequest objects...")
     execution_requests = [ExecutionRequest(**ex) for ex in executions]
 
+    on_result = None
+    if stream:
+        completed = 0
+
+        async def on_result(index: int, res) -> None:
+            nonlocal completed
+            completed += 1
+            logger.info(f"  → streaming result [{index + 1}] {res.api_name} ({completed}/{len(executions)})")
+            message = json.dumps({"index": index, **res.model_dump()}, ensure_ascii=False, default=str)
+            await ctx.report_progress(progress=completed, total=len(executions), message=message)
+
     logger.info("Executing tool logic...")
     result = await execute_apis_tool(
-        app_id, execution_service, execution_requests
+        app_id, execution_service, execution_requests, on_result=on_result
     )
 
     logger.info(f"✓ Tool execution completed")
@@ -299,6 +678,58 @@ async def execute_apis(executions: List[dict], ctx: Context) -> dict:
     return result.model_dump()
 
 
+@mcp.tool()
+async def execute_api_sweep(
+    api_name: str,
+    vary: Dict[str, List[Any]],
+    ctx: Context,
+    base_parameters: Optional[dict] = None,
+    fields: Optional[List[str]] = None,
+    concurrency: int = 10
+) -> dict:
+    """
+    Call one API many times with varying parameters, e.g. one call per user id.
+
+    Prefer this over many execute_apis entries for the same API.
+
+    Args:
+        api_name: API to call
+        vary: Parameter name -> list of values; row i uses the i-th value of every list,
+            e.g. {"user_id": ["u1", "u2", "u3"]}
+        base_parameters: Parameters shared by every call
+        fields: Optional projection paths applied to every row's result data
+        concurrency: Maximum calls in flight at the same time (capped by the server)
+
+    Returns:
+        Columnar results: data[i] is row i's result data, error_mask[i] is true if it failed
+    """
+    logger.info("=" * 80)
+    logger.info("MCP TOOL CALL: execute_api_sweep")
+    logger.info("=" * 80)
+    logger.info(f"Parameters:")
+    logger.info(f"  - api_name: {api_name}")
+    logger.info(f"  - vary: {', '.join(f'{k} ({len(v)} values)' for k, v in vary.items())}")
+    logger.info(f"  - concurrency: {concurrency}")
+
+    from .tools import execute_api_sweep_tool
+
+    app_id = ctx.get_state('app_id') or get_app_id_from_request()
+    sweep = SweepRequest(
+        api_name=api_name,
+        base_parameters=base_parameters or {},
+        vary=vary,
+        fields=fields,
+        concurrency=concurrency
+    )
+
+    result = await execute_api_sweep_tool(app_id, execution_service, sweep)
+
+    logger.info(f"✓ {result.result.succeeded}/{result.result.count} call(s) succeeded")
+    logger.info("=" * 80)
+
+    return result.model_dump()
+
+
 @mcp.tool()
 async def get_sql_tables(ctx: Context) -> dict:
     """
@@ -366,15 +797,77 @@ async def get_sql_table_fields(table_names: List[str], ctx: Context) -> dict:
 
 
 @mcp.tool()
-async def execute_sql(sql: str, ctx: Context) -> dict:
+async def search_sql_schema(query: str, ctx: Context, limit: Optional[int] = None) -> dict:
+    """
+    Search tables and columns by keywords instead of reading every table's fields.
+
+    Matches table and column names and comments (Chinese keywords such as 开户行
+    or 发票金额 work). Use the returned table names with get_sql_table_fields or
+    in execute_sql.
+
+    Args:
+        query: Keywords describing the data you are looking for
+        limit: Maximum number of results (default 10)
+
+    Returns:
+        Ranked tables and columns with their comments
+    """
+    logger.info("=" * 80)
+    logger.info("MCP TOOL CALL: search_sql_schema")
+    logger.info("=" * 80)
+    logger.info(f"Parameters: query={query}, limit={limit}")
+
+    from .tools import search_sql_schema_tool
+
+    app_id = ctx.get_state('app_id') or get_app_id_from_request()
+    db_name = get_db_name_from_request()
+
+    logger.info(f"✓ app_id: {app_id}")
+    if db_name:
+        logger.info(f"✓ dbName: {db_name}")
+    else:
+        logger.warning("✗ dbName not found")
+
+    result = await search_sql_schema_tool(
+        app_id, sql_service, db_name, query, limit or settings.sql_schema.default_limit
+    )
+
+    logger.info(f"✓ Found {len(result.results)} matching tables / columns")
+    for hit in result.results:
+        logger.debug(f"    - {hit.table_name}.{hit.column_name or '*'} ({hit.score})")
+    logger.info("=" * 80)
+
+    return result.model_dump()
+
+
+@mcp.tool()
+async def execute_sql(
+    sql: str,
+    ctx: Context,
+    fields: Optional[List[str]] = None,
+    continuation_token: Optional[str] = None,
+    format: Literal["rows", "columnar"] = "rows",
+    summarize: bool = False
+) -> dict:
     """
     Execute an arbitrary SQL query against the database.
 
+    SELECTs without LIMIT return a limited number of rows; when more rows exist the
+    result has truncated=true and a continuation_token.
+
     Args:
-        sql: SQL query to execute
+        sql: SQL query to execute (may be empty when continuation_token is given)
+        fields: Optional list of result columns to return (others are dropped server-side)
+        continuation_token: continuation_token of a truncated result, to read its next rows
+        format: "rows" (default, data is a list of row objects) or "columnar" (columnar holds
+            column names once, one value array per column and a null mask; smaller for wide results)
+        summarize: Return per-column statistics (counts, top values, min/max/mean, quantiles,
+            histograms) and a few sample rows instead of all rows; the remaining rows can be
+            read with fetch_result_page
 
     Returns:
-        Query results with data and schema information
+        Query results with data and schema information. Large results contain only the
+        first page; use fetch_result_page with page.next_cursor to read more rows.
     """
     logger.info("=" * 80)
     logger.info("MCP TOOL CALL: execute_sql")
@@ -392,10 +885,16 @@ async def execute_sql(sql: str, ctx: Context) -> dict:
     else:
         logger.warning("✗ dbName not found")
 
-    result = await execute_sql_tool(app_id, sql_service, db_name, sql)
+    result = await execute_sql_tool(
+        app_id, sql_service, db_name, sql, fields, continuation_token, format, summarize
+    )
 
     if result.result.success:
-        logger.info(f"✓ Success - {len(result.result.data or [])} rows")
+        rows = result.result.columnar.row_count if result.result.columnar else len(result.result.data or [])
+        logger.info(
+            f"✓ Success - {rows} rows"
+            + (" (truncated)" if result.result.truncated else "")
+        )
     else:
         logger.warning(f"✗ Failed - {result.result.error}")
     logger.info("=" * 80)
@@ -403,6 +902,142 @@ async def execute_sql(sql: str, ctx: Context) -> dict:
     return result.model_dump()
 
 
+@mcp.tool()
+async def fetch_result_page(cursor: str, ctx: Context, page_size: Optional[int] = None) -> dict:
+    """
+    Read further rows of a large execute_sql / execute_apis result without re-running it.
+
+    Args:
+        cursor: page.next_cursor from a previous result or page
+        page_size: Rows to return, at least 1 (default: server page size; capped at the
+            server's max_page_size)
+
+    Returns:
+        Rows of the page plus paging information (next_cursor is null on the last page)
+    """
+    logger.info("=" * 80)
+    logger.info("MCP TOOL CALL: fetch_result_page")
+    logger.info("=" * 80)
+    logger.info(f"Parameters: cursor={cursor}, page_size={page_size}")
+
+    from .tools import fetch_result_page_tool
+
+    if result_store is None:
+        raise ValueError("Result paging is disabled on this server")
+
+    app_id = ctx.get_state('app_id') or get_app_id_from_request()
+    result = await fetch_result_page_tool(app_id, result_store, cursor, page_size)
+
+    logger.info(
+        f"✓ Returned rows {result.page.offset}-{result.page.offset + result.page.returned_rows}"
+        f" of {result.page.total_rows}"
+    )
+    logger.info("=" * 80)
+
+    return result.model_dump()
+
+
+@mcp.tool()
+async def submit_job(
+    kind: JobKind,
+    ctx: Context,
+    executions: Optional[List[dict]] = None,
+    sql: Optional[str] = None,
+    wait_seconds: float = 0
+) -> dict:
+    """
+    Run a long execute_apis batch or execute_sql query in the background.
+
+    Use this instead of execute_apis / execute_sql when the work may take longer
+    than the request timeout. Poll with get_job_status and fetch with get_job_result.
+
+    Args:
+        kind: "execute_apis" or "execute_sql"
+        executions: List of API execution requests (for execute_apis)
+        sql: SQL query to execute (for execute_sql)
+        wait_seconds: Wait up to this many seconds; whatever finished by then is returned
+            and the rest keeps running in the background
+
+    Returns:
+        Job id and status, plus final or partial results
+    """
+    logger.info("=" * 80)
+    logger.info("MCP TOOL CALL: submit_job")
+    logger.info("=" * 80)
+    logger.info(f"Parameters: kind={kind}, wait_seconds={wait_seconds}")
+
+    from .tools import submit_job_tool
+
+    app_id = ctx.get_state('app_id') or get_app_id_from_request()
+    db_name = get_db_name_from_request() if kind == "execute_sql" else None
+    execution_requests = [ExecutionRequest(**ex) for ex in executions] if executions else None
+
+    result = await submit_job_tool(
+        app_id, job_service, kind, execution_requests, db_name, sql, wait_seconds
+    )
+
+    logger.info(f"✓ Job {result.job.job_id}: {result.job.status} ({result.job.progress}/{result.job.total})")
+    logger.info("=" * 80)
+
+    return result.model_dump()
+
+
+@mcp.tool()
+async def get_job_status(job_id: str, ctx: Context) -> dict:
+    """
+    Get status and progress of a background job.
+
+    Args:
+        job_id: Job identifier returned by submit_job
+
+    Returns:
+        Job state (queued, running, succeeded, failed) and progress
+    """
+    logger.info("=" * 80)
+    logger.info("MCP TOOL CALL: get_job_status")
+    logger.info("=" * 80)
+    logger.info(f"Parameters: job_id={job_id}")
+
+    from .tools import get_job_status_tool
+
+    app_id = ctx.get_state('app_id') or get_app_id_from_request()
+    result = await get_job_status_tool(app_id, job_service, job_id)
+
+    logger.info(f"✓ Job {job_id}: {result.status} ({result.progress}/{result.total})")
+    logger.info("=" * 80)
+
+    return result.model_dump()
+
+
+@mcp.tool()
+async def get_job_result(job_id: str, ctx: Context) -> dict:
+    """
+    Get the result of a background job.
+
+    While the job is running, the results finished so far are returned with partial=true.
+
+    Args:
+        job_id: Job identifier returned by submit_job
+
+    Returns:
+        Job status plus final or partial results
+    """
+    logger.info("=" * 80)
+    logger.info("MCP TOOL CALL: get_job_result")
+    logger.info("=" * 80)
+    logger.info(f"Parameters: job_id={job_id}")
+
+    from .tools import get_job_result_tool
+
+    app_id = ctx.get_state('app_id') or get_app_id_from_request()
+    result = await get_job_result_tool(app_id, job_service, job_id)
+
+    logger.info(f"✓ Job {job_id}: {result.job.status} (partial={result.partial})")
+    logger.info("=" * 80)
+
+    return result.model_dump()
+
+
 if __name__ == "__main__":
     logger.info("=" * 80)
     logger.info("Starting MCP Data API Server")
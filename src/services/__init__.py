@@ -1,11 +1,31 @@
+from .catalog_service import CatalogService, CatalogSnapshot
 from .category_service import CategoryService
 from .api_service import APIService
 from .execution_service import ExecutionService
+from .schema_service import SQLSchemaService, SchemaSnapshot
 from .sql_service import SQLService
+from .detail_batcher import APIDetailBatcher
+from .job_service import JobService
+from .parameter_validator import ParameterValidator
+from .name_index import APINameIndex
+from .prefetcher import DetailPrefetcher
+from .refresh_scheduler import RefreshAheadScheduler
+from .search_index import APISearchIndex
 
 __all__ = [
+    "CatalogService",
+    "CatalogSnapshot",
     "CategoryService",
     "APIService",
     "ExecutionService",
+    "SQLSchemaService",
+    "SchemaSnapshot",
     "SQLService",
+    "APIDetailBatcher",
+    "JobService",
+    "ParameterValidator",
+    "APINameIndex",
+    "DetailPrefetcher",
+    "RefreshAheadScheduler",
+    "APISearchIndex",
 ]
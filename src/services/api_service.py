@@ -1,23 +1,71 @@
 """API management service"""
-from typing import List
-from ..models import APIBasic, APIDetail
+import asyncio
+import logging
+from typing import Dict, List, Optional
+from ..models import APIBasic, APIDetail, APISearchHit
 from ..data_access import DataProvider
 from ..cache import CacheProvider
+from ..utils.errors import CategoryNotFoundError
+from .catalog_service import CatalogService
+from .category_service import CategoryService
+from .detail_batcher import APIDetailBatcher
+from .name_index import APINameIndex
+from .prefetcher import DetailPrefetcher
+from .search_index import APISearchIndex
+
+logger = logging.getLogger(__name__)
 
 
 class APIService:
     """Service for managing API metadata"""
 
-    def __init__(self, data_provider: DataProvider, cache: CacheProvider):
+    def __init__(
+        self,
+        data_provider: DataProvider,
+        cache: CacheProvider,
+        batcher: Optional[APIDetailBatcher] = None,
+        category_service: Optional[CategoryService] = None,
+        name_index: Optional[APINameIndex] = None,
+        name_index_max_age: int = 3600,
+        name_index_concurrency: int = 4,
+        listing_concurrency: int = 8,
+        catalog: Optional[CatalogService] = None,
+        search_index: Optional[APISearchIndex] = None,
+        prefetcher: Optional[DetailPrefetcher] = None,
+        search_wait: float = 5.0
+    ):
         """
         Initialize API service
 
         Args:
             data_provider: Data provider instance
             cache: Cache provider instance
+            batcher: Optional batcher merging concurrent detail lookups
+            category_service: Category service used to walk all categories of an app
+            name_index: Optional index of known API names for fail-fast lookups
+            name_index_max_age: Seconds before a complete name index is rebuilt
+            name_index_concurrency: Concurrent category fetches while building the index
+            listing_concurrency: Concurrent category fetches for multi-category listings
+            catalog: Optional catalog snapshot served before the cache; it also keeps
+                the name index complete
+            search_index: Optional full-text index fed with fetched listings and details
+            prefetcher: Optional prefetcher warming details after category listings
+            search_wait: Seconds the first search of an app waits for the catalog
+                before searching what is indexed so far
         """
         self._data_provider = data_provider
         self._cache = cache
+        self._batcher = batcher
+        self._category_service = category_service
+        self._name_index = name_index
+        self._name_index_max_age = name_index_max_age
+        self._name_index_concurrency = name_index_concurrency
+        self._listing_concurrency = listing_concurrency
+        self._index_builds: Dict[str, asyncio.Task] = {}
+        self._catalog = catalog
+        self._search_index = search_index
+        self._prefetcher = prefetcher
+        self._search_wait = search_wait
 
     async def get_apis_by_category(
         self, app_id: str, category_id: str
@@ -32,6 +80,23 @@ class APIService:
         Returns:
             List of basic API information
         """
+        apis = await self._list_category(app_id, category_id)
+        if self._prefetcher:
+            self._prefetcher.schedule(
+                app_id,
+                [api.name for api in apis],
+                lambda names: self._prefetch_details(app_id, names)
+            )
+        return apis
+
+    async def _list_category(
+        self, app_id: str, category_id: str
+    ) -> List[APIBasic]:
+        """Get a category listing from the snapshot, the cache or the backend"""
+        snapshot = self._catalog.get_snapshot(app_id) if self._catalog else None
+        if snapshot and category_id in snapshot.apis_by_category:
+            return snapshot.apis_by_category[category_id]
+
         cache_key = f"apis:{app_id}:{category_id}"
 
         cached = await self._cache.get(cache_key)
@@ -42,9 +107,79 @@ class APIService:
             app_id, category_id
         )
 
-        await self._cache.set(cache_key, apis)
+        await self._store_listing(app_id, category_id, apis)
         return apis
 
+    async def _store_listing(self, app_id: str, category_id: str, apis: List[APIBasic]) -> None:
+        """Cache a fetched category listing and feed it to the name and search indexes"""
+        await self._cache.set(f"apis:{app_id}:{category_id}", apis)
+        if self._name_index:
+            self._name_index.add(app_id, [api.name for api in apis])
+        if self._search_index:
+            self._search_index.index_listing(app_id, category_id, apis)
+
+    async def _store_details(self, app_id: str, details: List[APIDetail]) -> None:
+        """Cache fetched API details and feed them to the name and search indexes"""
+        for api in details:
+            await self._cache.set(f"api_detail:{app_id}:{api.name}", api)
+        if self._name_index:
+            self._name_index.add(app_id, [api.name for api in details])
+        if self._search_index:
+            self._search_index.index_details(app_id, details)
+
+    async def get_apis_in_categories(
+        self, app_id: str, category_ids: List[str], recursive: bool = True
+    ) -> List[APIBasic]:
+        """
+        Get the APIs of several categories, optionally including all descendants
+
+        Categories are listed concurrently (bounded) through get_apis_by_category,
+        so cached listings are reused. APIs found in several categories are
+        returned once.
+
+        Args:
+            app_id: Application identifier
+            category_ids: Category identifiers
+            recursive: Also list every descendant category (needs a category
+                service; without one only the given categories are listed)
+
+        Returns:
+            Merged list of basic API information
+
+        Raises:
+            CategoryNotFoundError: If a category is not in the category tree
+        """
+        if recursive and not self._category_service:
+            logger.warning(
+                f"Recursive listing of categories {category_ids} for app {app_id} needs a "
+                f"category service; listing the given categories only"
+            )
+        elif recursive:
+            tree = await self._category_service.get_category_tree(app_id)
+            expanded = []
+            for category_id in category_ids:
+                if tree.position(category_id) is None:
+                    raise CategoryNotFoundError(category_id)
+                expanded.append(category_id)
+                expanded.extend(category.id for category in tree.expand(category_id))
+            category_ids = expanded
+
+        semaphore = asyncio.Semaphore(self._listing_concurrency)
+
+        async def list_category(category_id: str) -> List[APIBasic]:
+            async with semaphore:
+                return await self._list_category(app_id, category_id)
+
+        listings = await asyncio.gather(*[
+            list_category(category_id) for category_id in dict.fromkeys(category_ids)
+        ])
+
+        merged: Dict[str, APIBasic] = {}
+        for apis in listings:
+            for api in apis:
+                merged.setdefault(api.name, api)
+        return list(merged.values())
+
     async def get_api_details(
         self, app_id: str, api_names: List[str]
     ) -> List[APIDetail]:
@@ -58,11 +193,19 @@ class APIService:
         Returns:
             List of detailed API information
         """
-        # Try to get from cache first
+        # Try the catalog snapshot and the cache first
+        snapshot = self._catalog.get_snapshot(app_id) if self._catalog else None
         cached_results = []
         uncached_names = []
 
-        for name in api_names:
+        max_age = self._name_index_max_age
+        for name in dict.fromkeys(api_names):
+            if self._name_index and self._name_index.is_known(app_id, name, max_age) is False:
+                # Known not to exist, do not ask the backend
+                continue
+            if snapshot and name in snapshot.details:
+                cached_results.append(snapshot.details[name])
+                continue
             cache_key = f"api_detail:{app_id}:{name}"
             cached = await self._cache.get(cache_key)
             if cached:
@@ -70,17 +213,202 @@ class APIService:
             else:
                 uncached_names.append(name)
 
+        if self._prefetcher:
+            served = {api.name for api in cached_results}
+            self._prefetcher.record_request(app_id, api_names, served)
+
         # Fetch uncached APIs
         if uncached_names:
-            fetched = await self._data_provider.get_api_details(
-                app_id, uncached_names
-            )
-
-            # Cache individual results
-            for api in fetched:
-                cache_key = f"api_detail:{app_id}:{api.name}"
-                await self._cache.set(cache_key, api)
+            if self._prefetcher:
+                with self._prefetcher.foreground():
+                    fetched = await self._fetch_api_details(app_id, uncached_names)
+            else:
+                fetched = await self._fetch_api_details(app_id, uncached_names)
 
+            await self._store_details(app_id, fetched)
             cached_results.extend(fetched)
 
         return cached_results
+
+    async def refresh_listings(self, app_id: str, category_ids: List[str]) -> None:
+        """
+        Fetch category listings from the backend and cache them (refresh-ahead)
+
+        The name and search indexes are updated as for a normal listing load.
+
+        Args:
+            app_id: Application identifier
+            category_ids: Category identifiers
+        """
+        for category_id in category_ids:
+            apis = await self._data_provider.get_apis_by_category(app_id, category_id)
+            await self._store_listing(app_id, category_id, apis)
+
+    async def refresh_details(self, app_id: str, api_names: List[str]) -> None:
+        """
+        Fetch API details from the backend and cache them (refresh-ahead)
+
+        The name and search indexes are updated as for a normal detail load.
+
+        Args:
+            app_id: Application identifier
+            api_names: API names
+        """
+        await self._store_details(app_id, await self._fetch_api_details(app_id, api_names))
+
+    async def _prefetch_details(self, app_id: str, api_names: List[str]) -> List[str]:
+        """Fetch and cache details that are not cached yet; returns the names fetched"""
+        snapshot = self._catalog.get_snapshot(app_id) if self._catalog else None
+        missing = []
+        for name in api_names:
+            if snapshot and name in snapshot.details:
+                continue
+            if await self._cache.get(f"api_detail:{app_id}:{name}") is None:
+                missing.append(name)
+        if not missing:
+            return []
+
+        fetched = await self._fetch_api_details(app_id, missing)
+        await self._store_details(app_id, fetched)
+        return [api.name for api in fetched]
+
+    async def _fetch_api_details(
+        self, app_id: str, api_names: List[str]
+    ) -> List[APIDetail]:
+        """Fetch details from the backend, batched with concurrent callers if enabled"""
+        if self._batcher:
+            return await self._batcher.load(app_id, api_names)
+        return await self._data_provider.get_api_details(app_id, api_names)
+
+    async def peek_api_detail(self, app_id: str, api_name: str) -> Optional[APIDetail]:
+        """
+        Get an API detail from cache only, without calling the backend
+
+        Args:
+            app_id: Application identifier
+            api_name: API name
+
+        Returns:
+            Cached API detail or None
+        """
+        snapshot = self._catalog.get_snapshot(app_id) if self._catalog else None
+        if snapshot and api_name in snapshot.details:
+            return snapshot.details[api_name]
+        return await self._cache.get(f"api_detail:{app_id}:{api_name}")
+
+    async def search_apis(
+        self, app_id: str, query: str, limit: int = 10
+    ) -> List[APISearchHit]:
+        """
+        Full-text search over API names, descriptions, category paths and parameters
+
+        Without a catalog only listings and details fetched so far are
+        searchable. With one, the first search of an app waits up to
+        search_wait seconds for the first sync; if it takes longer the sync
+        continues in the background and the search covers what is indexed so
+        far (see is_search_complete).
+
+        Args:
+            app_id: Application identifier
+            query: Free-text query
+            limit: Maximum number of hits
+
+        Returns:
+            Ranked hits
+        """
+        if not self._search_index:
+            return []
+        if self._catalog and self._catalog.get_snapshot(app_id) is None:
+            try:
+                # The sync runs on in the background if the wait times out
+                await asyncio.wait_for(asyncio.shield(self._catalog.refresh(app_id)), self._search_wait)
+            except asyncio.TimeoutError:
+                logger.info(f"Catalog of app {app_id} still syncing, searching the partial index")
+            except Exception as e:
+                logger.warning(f"Catalog sync for app {app_id} failed, searching the partial index: {e}")
+        return self._search_index.search(app_id, query, limit)
+
+    def is_search_complete(self, app_id: str) -> bool:
+        """Whether search_apis covers the app's whole catalog (False while it is still syncing)"""
+        return bool(self._catalog and self._catalog.get_snapshot(app_id))
+
+    async def check_api_names(
+        self, app_id: str, api_names: List[str]
+    ) -> Dict[str, List[str]]:
+        """
+        Find names that are known not to exist, without calling the backend
+
+        Starts building the app's name index in the background if it is
+        missing or stale; until it is complete no name is reported unknown.
+
+        Args:
+            app_id: Application identifier
+            api_names: List of API names
+
+        Returns:
+            Unknown API name -> suggested existing names
+        """
+        if not self._name_index:
+            return {}
+
+        self._ensure_name_index(app_id)
+        return {
+            name: self._name_index.suggest(app_id, name)
+            for name in api_names
+            if self._name_index.is_known(app_id, name, self._name_index_max_age) is False
+        }
+
+    def suggest_api_names(self, app_id: str, api_name: str) -> List[str]:
+        """
+        Suggest existing API names close to a given name
+
+        Args:
+            app_id: Application identifier
+            api_name: Unknown API name
+
+        Returns:
+            Suggested API names, best first
+        """
+        if not self._name_index:
+            return []
+        return self._name_index.suggest(app_id, api_name)
+
+    def _ensure_name_index(self, app_id: str) -> None:
+        """Start a background build of the app's name index if needed"""
+        if self._catalog:
+            # The catalog sync replaces the index with the complete name list
+            self._catalog.get_snapshot(app_id)
+            return
+        if not self._category_service:
+            return
+        if self._name_index.is_complete(app_id, self._name_index_max_age):
+            return
+        if app_id in self._index_builds:
+            return
+
+        task = asyncio.ensure_future(self._build_name_index(app_id))
+        self._index_builds[app_id] = task
+        task.add_done_callback(lambda _: self._index_builds.pop(app_id, None))
+
+    async def _build_name_index(self, app_id: str) -> None:
+        """Collect every API name of an app from its category listings"""
+        try:
+            categories = await self._category_service.get_categories(app_id)
+            semaphore = asyncio.Semaphore(self._name_index_concurrency)
+
+            async def list_category(category_id: str) -> List[APIBasic]:
+                async with semaphore:
+                    return await self._list_category(app_id, category_id)
+
+            listings = await asyncio.gather(*[
+                list_category(category.id) for category in categories
+            ])
+            names = [api.name for apis in listings for api in apis]
+            self._name_index.replace(app_id, names)
+            logger.info(
+                f"Built API name index for app {app_id}: "
+                f"{len(set(names))} names from {len(categories)} categories"
+            )
+        except Exception as e:
+            # Leave the index incomplete; names are then never rejected locally
+            logger.warning(f"Failed to build API name index for app {app_id}: {e}")
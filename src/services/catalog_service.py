@@ -0,0 +1,307 @@
+"""Per-app catalog snapshot with background incremental sync"""
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional
+from ..models import Category, APIBasic, APIDetail
+from ..data_access import DataProvider, CategoryTree
+from ..data_access.category_tree import CategorySignature
+from ..cache import SingleFlight
+from .name_index import APINameIndex
+from .search_index import APISearchIndex
+
+logger = logging.getLogger(__name__)
+
+
+class CatalogSnapshot:
+    """
+    Immutable, indexed view of one app's catalog
+
+    A refresh builds a new snapshot and swaps it in, so readers never see a
+    half-updated catalog.
+    """
+
+    def __init__(
+        self,
+        app_id: str,
+        tree: CategoryTree,
+        apis_by_category: Dict[str, List[APIBasic]],
+        details: Dict[str, APIDetail],
+        signatures: Dict[str, CategorySignature]
+    ):
+        self.app_id = app_id
+        self.tree = tree
+        self.categories: List[Category] = tree.to_categories()
+        self.category_by_id: Dict[str, Category] = {c.id: c for c in self.categories}
+        self.apis_by_category = apis_by_category
+        self.details = details
+        self.signatures = signatures
+        self.built_at = time.time()
+
+    @property
+    def api_names(self) -> List[str]:
+        """Every API name of the app, in category order"""
+        return list(dict.fromkeys(
+            api.name for apis in self.apis_by_category.values() for api in apis
+        ))
+
+
+class CatalogService:
+    """
+    Service holding the full catalog of each app in memory
+
+    The first request for an app starts a background task that loads the
+    category tree, every category's API list and every API's details, then
+    re-syncs periodically. A re-sync refetches only categories whose
+    updateAt/totalNumber changed (all of them if the backend sends neither)
+    and only the details of APIs in those categories. Apps not read for
+    idle_timeout seconds stop syncing and are dropped from memory.
+    """
+
+    def __init__(
+        self,
+        data_provider: DataProvider,
+        sync_interval: int = 300,
+        concurrency: int = 4,
+        detail_batch_size: int = 50,
+        name_index: Optional[APINameIndex] = None,
+        search_index: Optional[APISearchIndex] = None,
+        idle_timeout: int = 3600
+    ):
+        """
+        Initialize catalog service
+
+        Args:
+            data_provider: Data provider instance
+            sync_interval: Seconds between background syncs of an app
+            concurrency: Concurrent backend calls during a sync
+            detail_batch_size: API names per get_api_details call
+            name_index: Name index to replace with the complete name list after each sync
+            search_index: Full-text index kept in line with the snapshot
+            idle_timeout: Seconds without reads after which an app is dropped
+        """
+        self._data_provider = data_provider
+        self._sync_interval = sync_interval
+        self._concurrency = concurrency
+        self._detail_batch_size = detail_batch_size
+        self._name_index = name_index
+        self._search_index = search_index
+        self._idle_timeout = idle_timeout
+
+        self._snapshots: Dict[str, CatalogSnapshot] = {}
+        self._sync_tasks: Dict[str, asyncio.Task] = {}
+        self._last_used: Dict[str, float] = {}
+        self._inflight = SingleFlight()
+        self._stats = {
+            "syncs": 0, "failed_syncs": 0, "categories_fetched": 0, "details_fetched": 0, "evictions": 0
+        }
+
+    def get_snapshot(self, app_id: str) -> Optional[CatalogSnapshot]:
+        """
+        Get the current snapshot without waiting
+
+        Starts the background sync for the app on first use.
+
+        Args:
+            app_id: Application identifier
+
+        Returns:
+            Current snapshot, or None while the first sync is running
+        """
+        self._last_used[app_id] = time.time()
+        self._ensure_sync(app_id)
+        return self._snapshots.get(app_id)
+
+    async def load(self, app_id: str) -> CatalogSnapshot:
+        """
+        Get the snapshot, waiting for the first sync if needed
+
+        Args:
+            app_id: Application identifier
+
+        Returns:
+            Current snapshot
+        """
+        snapshot = self.get_snapshot(app_id)
+        if snapshot is None:
+            snapshot = await self.refresh(app_id)
+        return snapshot
+
+    async def refresh(self, app_id: str) -> CatalogSnapshot:
+        """
+        Sync an app's catalog now; concurrent callers share one sync
+
+        Args:
+            app_id: Application identifier
+
+        Returns:
+            New snapshot
+        """
+        return await self._inflight.do(f"catalog:{app_id}", lambda: self._sync(app_id))
+
+    async def close(self) -> None:
+        """Stop all background syncs"""
+        tasks = list(self._sync_tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _ensure_sync(self, app_id: str) -> None:
+        """Start the background sync loop of an app if it is not running"""
+        if app_id not in self._sync_tasks:
+            task = asyncio.ensure_future(self._sync_loop(app_id))
+            self._sync_tasks[app_id] = task
+            task.add_done_callback(lambda _: self._sync_tasks.pop(app_id, None))
+
+    async def _sync_loop(self, app_id: str) -> None:
+        """Sync an app's catalog every sync_interval seconds until it is idle"""
+        while not self._is_idle(app_id):
+            try:
+                await self.refresh(app_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Keep serving the previous snapshot and retry on the next round
+                self._stats["failed_syncs"] += 1
+                logger.warning(f"Catalog sync failed for app {app_id}: {e}")
+            await asyncio.sleep(self._sync_interval)
+        self._evict(app_id)
+
+    def _is_idle(self, app_id: str) -> bool:
+        """Whether an app has not been read for idle_timeout seconds"""
+        return time.time() - self._last_used.get(app_id, 0.0) > self._idle_timeout
+
+    def _evict(self, app_id: str) -> None:
+        """Drop an idle app's snapshot and indexes"""
+        self._snapshots.pop(app_id, None)
+        self._last_used.pop(app_id, None)
+        if self._name_index:
+            self._name_index.discard(app_id)
+        if self._search_index:
+            self._search_index.discard(app_id)
+        self._stats["evictions"] += 1
+        logger.info(f"Catalog for app {app_id} dropped after {self._idle_timeout}s without reads")
+
+    async def _sync(self, app_id: str) -> CatalogSnapshot:
+        """Build a new snapshot, reusing unchanged parts of the previous one"""
+        started = time.time()
+        previous = self._snapshots.get(app_id)
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        tree = CategoryTree.build(await self._data_provider.get_category_tree(app_id))
+        categories = tree.to_categories()
+        signatures = tree.signature_map()
+
+        changed = [
+            category.id for category in categories
+            if previous is None
+            or category.id not in previous.apis_by_category
+            or signatures.get(category.id) is None
+            or previous.signatures.get(category.id) != signatures[category.id]
+        ]
+
+        async def list_category(category_id: str) -> List[APIBasic]:
+            async with semaphore:
+                return await self._data_provider.get_apis_by_category(app_id, category_id)
+
+        listings = await asyncio.gather(
+            *[list_category(category_id) for category_id in changed],
+            return_exceptions=True
+        )
+
+        apis_by_category: Dict[str, List[APIBasic]] = {}
+        if previous:
+            for category in categories:
+                if category.id in previous.apis_by_category:
+                    apis_by_category[category.id] = previous.apis_by_category[category.id]
+        stale_names = set()
+        listing_failed = False
+        for category_id, listing in zip(changed, listings):
+            if isinstance(listing, Exception):
+                listing_failed = True
+                # Keep the old listing (if any) and refetch it next sync
+                logger.warning(f"Catalog sync: listing category {category_id} failed: {listing}")
+                signatures[category_id] = None
+                continue
+            apis_by_category[category_id] = listing
+            stale_names.update(api.name for api in listing)
+        # Keep category order stable
+        apis_by_category = {
+            category.id: apis_by_category[category.id]
+            for category in categories if category.id in apis_by_category
+        }
+
+        names = list(dict.fromkeys(
+            api.name for apis in apis_by_category.values() for api in apis
+        ))
+        details: Dict[str, APIDetail] = {}
+        to_fetch = []
+        for name in names:
+            if previous and name in previous.details and name not in stale_names:
+                details[name] = previous.details[name]
+            else:
+                to_fetch.append(name)
+
+        async def fetch_details(batch: List[str]) -> List[APIDetail]:
+            async with semaphore:
+                return await self._data_provider.get_api_details(app_id, batch)
+
+        batches = [
+            to_fetch[i:i + self._detail_batch_size]
+            for i in range(0, len(to_fetch), self._detail_batch_size)
+        ]
+        fetched = await asyncio.gather(
+            *[fetch_details(batch) for batch in batches], return_exceptions=True
+        )
+        for batch, result in zip(batches, fetched):
+            if isinstance(result, Exception):
+                logger.warning(f"Catalog sync: fetching {len(batch)} API details failed: {result}")
+                for name in batch:
+                    if previous and name in previous.details:
+                        details[name] = previous.details[name]
+                continue
+            for api in result:
+                details[api.name] = api
+
+        snapshot = CatalogSnapshot(app_id, tree, apis_by_category, details, signatures)
+        self._snapshots[app_id] = snapshot
+        if self._name_index:
+            # A category that could not be listed may hold APIs missing from names
+            self._name_index.replace(app_id, names, complete=not listing_failed)
+        if self._search_index:
+            self._index_snapshot(snapshot)
+
+        self._stats["syncs"] += 1
+        self._stats["categories_fetched"] += len(changed)
+        self._stats["details_fetched"] += len(to_fetch)
+        logger.info(
+            f"Catalog synced for app {app_id} in {time.time() - started:.2f}s: "
+            f"{len(categories)} categories ({len(changed)} refetched), "
+            f"{len(names)} APIs ({len(to_fetch)} details refetched)"
+        )
+        return snapshot
+
+    def _index_snapshot(self, snapshot: CatalogSnapshot) -> None:
+        """Bring the search index in line with a snapshot (unchanged APIs are skipped)"""
+        app_id = snapshot.app_id
+        for category_id, apis in snapshot.apis_by_category.items():
+            category = snapshot.category_by_id.get(category_id)
+            self._search_index.index_listing(
+                app_id, category_id, apis, category.name if category else None
+            )
+        self._search_index.index_details(app_id, list(snapshot.details.values()))
+        self._search_index.retain(app_id, snapshot.api_names)
+
+    def get_stats(self) -> dict:
+        """Get catalog statistics"""
+        return {
+            **self._stats,
+            "apps": {
+                app_id: {
+                    "categories": len(snapshot.categories),
+                    "apis": len(snapshot.details),
+                    "age_seconds": round(time.time() - snapshot.built_at, 1)
+                }
+                for app_id, snapshot in self._snapshots.items()
+            }
+        }
@@ -1,45 +1,96 @@
 """Category management service"""
-from typing import List
+from typing import List, Optional
 from ..models import Category
-from ..data_access import DataProvider
+from ..data_access import DataProvider, CategoryTree
 from ..cache import CacheProvider
+from ..utils.errors import CategoryNotFoundError
+from .catalog_service import CatalogService
 
 
 class CategoryService:
     """Service for managing categories"""
 
-    def __init__(self, data_provider: DataProvider, cache: CacheProvider):
+    def __init__(
+        self,
+        data_provider: DataProvider,
+        cache: CacheProvider,
+        catalog: Optional[CatalogService] = None
+    ):
         """
         Initialize category service
 
         Args:
             data_provider: Data provider instance
             cache: Cache provider instance
+            catalog: Optional catalog snapshot served before the cache
         """
         self._data_provider = data_provider
         self._cache = cache
+        self._catalog = catalog
 
-    async def get_categories(self, app_id: str) -> List[Category]:
+    async def get_categories(
+        self,
+        app_id: str,
+        parent_id: Optional[str] = None,
+        depth: Optional[int] = None
+    ) -> List[Category]:
         """
-        Get categories with caching
+        Get categories, optionally only part of the tree
 
         Args:
             app_id: Application identifier
+            parent_id: Only return categories below this one (None = from the roots)
+            depth: Levels to return (1 = direct children only, None = all)
 
         Returns:
-            List of categories
+            List of categories, parents before their children
+
+        Raises:
+            CategoryNotFoundError: If parent_id does not exist
+            ValueError: If depth is smaller than 1
         """
-        cache_key = f"categories:{app_id}"
+        if depth is not None and depth < 1:
+            raise ValueError(f"depth must be at least 1, got {depth}")
+
+        tree = await self.get_category_tree(app_id)
+        try:
+            return tree.expand(parent_id, depth)
+        except KeyError:
+            raise CategoryNotFoundError(parent_id)
+
+    async def get_category_tree(self, app_id: str) -> CategoryTree:
+        """
+        Get the indexed category tree with caching
+
+        Args:
+            app_id: Application identifier
+
+        Returns:
+            Category tree
+        """
+        snapshot = self._catalog.get_snapshot(app_id) if self._catalog else None
+        if snapshot:
+            return snapshot.tree
+
+        cache_key = f"category_tree:{app_id}"
 
         # Try cache first
         cached = await self._cache.get(cache_key)
         if cached:
             return cached
 
-        # Fetch from data provider
-        categories = await self._data_provider.get_categories(app_id)
+        return await self.refresh_category_tree(app_id)
+
+    async def refresh_category_tree(self, app_id: str) -> CategoryTree:
+        """
+        Fetch the category tree from the backend and cache it
 
-        # Cache the result
-        await self._cache.set(cache_key, categories)
+        Args:
+            app_id: Application identifier
 
-        return categories
+        Returns:
+            Category tree
+        """
+        tree = CategoryTree.build(await self._data_provider.get_category_tree(app_id))
+        await self._cache.set(f"category_tree:{app_id}", tree)
+        return tree
@@ -0,0 +1,225 @@
+"""Micro-batching of API detail lookups across concurrent callers"""
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional, Tuple
+from ..models import APIDetail
+from ..data_access import DataProvider
+from ..utils.metrics import Histogram
+
+logger = logging.getLogger(__name__)
+
+
+class _PendingBatch:
+    """Names and waiters collected during one batching window"""
+
+    def __init__(self):
+        self.names: Dict[str, None] = {}  # insertion-ordered set
+        self.waiters: List[Tuple[List[str], asyncio.Future, float]] = []
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class APIDetailBatcher:
+    """
+    DataLoader-style batcher for get_api_details
+
+    Requests for the same app arriving within a short window are merged into
+    a single backend call. The window adapts to load: when requests are rare
+    the minimum window is used, under load it grows towards the maximum so
+    that more callers share one round trip. No backend call asks for more
+    than max_batch_size names; larger requests are split.
+    """
+
+    def __init__(
+        self,
+        data_provider: DataProvider,
+        min_window_ms: float = 1.0,
+        max_window_ms: float = 10.0,
+        max_batch_size: int = 50,
+        target_batch_size: int = 8,
+        idle_timeout: float = 60.0
+    ):
+        """
+        Initialize batcher
+
+        Args:
+            data_provider: Data provider instance
+            min_window_ms: Window used when the app is idle
+            max_window_ms: Upper bound for the adaptive window
+            max_batch_size: Maximum unique names per backend call
+            target_batch_size: Number of callers the adaptive window aims to collect
+            idle_timeout: Seconds without requests before an app's arrival statistics are dropped
+        """
+        self._data_provider = data_provider
+        self._min_window = min_window_ms / 1000
+        self._max_window = max_window_ms / 1000
+        self._max_batch_size = max_batch_size
+        self._target_batch_size = target_batch_size
+        self._idle_timeout = idle_timeout
+
+        self._pending: Dict[str, _PendingBatch] = {}
+        self._last_arrival: Dict[str, float] = {}
+        self._interarrival: Dict[str, float] = {}  # EWMA in seconds
+        self._last_prune = time.monotonic()
+        self._tasks: set = set()
+
+        self.batch_size_histogram = Histogram([1, 2, 5, 10, 20, 50, 100])
+        self.waiters_histogram = Histogram([1, 2, 5, 10, 20, 50])
+        self.wait_time_histogram = Histogram([0.5, 1, 2, 5, 10, 20, 50, 100])  # ms
+
+    async def load(self, app_id: str, api_names: List[str]) -> List[APIDetail]:
+        """
+        Get API details, sharing the backend call with concurrent callers
+
+        Args:
+            app_id: Application identifier
+            api_names: List of API names
+
+        Returns:
+            List of detailed API information for the names that exist
+        """
+        now = time.monotonic()
+        self._record_arrival(app_id, now)
+
+        names = list(dict.fromkeys(api_names))
+        if len(names) <= self._max_batch_size:
+            return await self._enqueue(app_id, names, now)
+
+        chunks = [
+            names[start:start + self._max_batch_size]
+            for start in range(0, len(names), self._max_batch_size)
+        ]
+        results = await asyncio.gather(*[self._enqueue(app_id, chunk, now) for chunk in chunks])
+        return [detail for details in results for detail in details]
+
+    async def _enqueue(self, app_id: str, names: List[str], now: float) -> List[APIDetail]:
+        """Add at most max_batch_size names to the app's open batch and wait for the result"""
+        loop = asyncio.get_running_loop()
+
+        batch = self._pending.get(app_id)
+        if batch is not None and len(batch.names.keys() | set(names)) > self._max_batch_size:
+            # Would not fit: send the open batch now and start a new one
+            self._dispatch(app_id)
+            batch = None
+        if batch is None:
+            batch = _PendingBatch()
+            self._pending[app_id] = batch
+            batch.timer = loop.call_later(self._window_for(app_id), self._dispatch, app_id)
+
+        future = loop.create_future()
+        batch.waiters.append((names, future, now))
+        for name in names:
+            batch.names[name] = None
+
+        if len(batch.names) >= self._max_batch_size:
+            self._dispatch(app_id)
+
+        return await future
+
+    def _record_arrival(self, app_id: str, now: float) -> None:
+        """Update the inter-arrival estimate for an app"""
+        self._prune_idle(now)
+        last = self._last_arrival.get(app_id)
+        self._last_arrival[app_id] = now
+        if last is None:
+            return
+        gap = now - last
+        previous = self._interarrival.get(app_id)
+        self._interarrival[app_id] = gap if previous is None else 0.8 * previous + 0.2 * gap
+
+    def _prune_idle(self, now: float) -> None:
+        """Drop arrival statistics of apps without requests for idle_timeout (checked once per timeout)"""
+        if now - self._last_prune < self._idle_timeout:
+            return
+        self._last_prune = now
+        for app_id, last in list(self._last_arrival.items()):
+            if now - last > self._idle_timeout and app_id not in self._pending:
+                del self._last_arrival[app_id]
+                self._interarrival.pop(app_id, None)
+
+    def _window_for(self, app_id: str) -> float:
+        """Size the batching window from the observed arrival rate"""
+        interarrival = self._interarrival.get(app_id)
+        if interarrival is None or interarrival >= self._max_window:
+            # Nobody else is likely to show up in time; do not add latency
+            return self._min_window
+        window = interarrival * self._target_batch_size
+        return max(self._min_window, min(self._max_window, window))
+
+    def _dispatch(self, app_id: str) -> None:
+        """Close the current window for an app and start the backend call"""
+        batch = self._pending.pop(app_id, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+
+        task = asyncio.ensure_future(self._run_batch(app_id, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, app_id: str, batch: _PendingBatch) -> None:
+        """Fetch a batch of names and hand the results to every waiter"""
+        names = list(batch.names)
+        started = time.monotonic()
+
+        self.batch_size_histogram.observe(len(names))
+        self.waiters_histogram.observe(len(batch.waiters))
+        for _, _, enqueued in batch.waiters:
+            self.wait_time_histogram.observe((started - enqueued) * 1000)
+
+        logger.debug(
+            f"Dispatching detail batch for app {app_id}: "
+            f"{len(names)} names from {len(batch.waiters)} callers"
+        )
+
+        try:
+            details = await self._data_provider.get_api_details(app_id, names)
+        except Exception as e:
+            if len(batch.waiters) == 1:
+                self._resolve(batch.waiters[0][1], exception=e)
+                return
+            # Isolate failures so one bad name does not fail unrelated callers
+            logger.warning(f"Detail batch for app {app_id} failed, retrying per caller: {e}")
+            await asyncio.gather(*[
+                self._run_single(app_id, waiter_names, future)
+                for waiter_names, future, _ in batch.waiters
+            ])
+            return
+
+        by_name = {detail.name: detail for detail in details}
+        for waiter_names, future, _ in batch.waiters:
+            self._resolve(future, [by_name[n] for n in waiter_names if n in by_name])
+
+    async def _run_single(
+        self, app_id: str, api_names: List[str], future: asyncio.Future
+    ) -> None:
+        """Fetch names for a single waiter"""
+        try:
+            details = await self._data_provider.get_api_details(app_id, api_names)
+        except Exception as e:
+            self._resolve(future, exception=e)
+        else:
+            self._resolve(future, details)
+
+    @staticmethod
+    def _resolve(
+        future: asyncio.Future, result: Optional[list] = None, exception: Exception = None
+    ) -> None:
+        """Complete a waiter future unless the caller already went away"""
+        if future.done():
+            return
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
+
+    def get_stats(self) -> dict:
+        """Get batching statistics"""
+        return {
+            "batch_size": self.batch_size_histogram.snapshot(),
+            "waiters_per_batch": self.waiters_histogram.snapshot(),
+            "wait_time_ms": self.wait_time_histogram.snapshot(),
+            "pending_apps": len(self._pending),
+            "tracked_apps": len(self._last_arrival)
+        }
@@ -0,0 +1,130 @@
+"""Dependency graph of $ref references between executions"""
+from typing import Any, Dict, List, Set
+from ..models import ExecutionRequest, ExecutionResult
+from ..utils.errors import ExecutionGraphError
+from ..utils.json_path import get_at, parse_path
+
+REF_KEY = "$ref"
+
+
+def _is_ref(value: Any) -> bool:
+    return isinstance(value, dict) and len(value) == 1 and isinstance(value.get(REF_KEY), str)
+
+
+def _collect_refs(value: Any, refs: List[str]) -> None:
+    """Collect $ref expressions anywhere inside a parameter value"""
+    if _is_ref(value):
+        refs.append(value[REF_KEY])
+    elif isinstance(value, dict):
+        for item in value.values():
+            _collect_refs(item, refs)
+    elif isinstance(value, list):
+        for item in value:
+            _collect_refs(item, refs)
+
+
+def build_dependency_graph(executions: List[ExecutionRequest]) -> List[Set[int]]:
+    """
+    Build the dependency graph of an execute_apis batch
+
+    A parameter value of the form {"$ref": "a.data.rows[0].id"} depends on the
+    execution whose id is "a"; the rest of the path is looked up in that
+    execution's result (api_name, success, data, error).
+
+    Args:
+        executions: List of execution requests
+
+    Returns:
+        For every execution, the indexes of the executions it depends on
+
+    Raises:
+        ExecutionGraphError: On duplicate ids, unknown or malformed references, or cycles
+    """
+    ids: Dict[str, int] = {}
+    for index, execution in enumerate(executions):
+        if execution.id is None:
+            continue
+        if execution.id in ids:
+            raise ExecutionGraphError(f"duplicate execution id '{execution.id}'")
+        ids[execution.id] = index
+
+    dependencies: List[Set[int]] = []
+    for index, execution in enumerate(executions):
+        refs: List[str] = []
+        _collect_refs(execution.parameters, refs)
+
+        depends_on = set()
+        for ref in refs:
+            try:
+                target = parse_path(ref)[0]
+            except ValueError as e:
+                raise ExecutionGraphError(f"execution [{index}] has malformed $ref '{ref}': {e}")
+            if target not in ids:
+                raise ExecutionGraphError(f"execution [{index}] references unknown id '{target}'")
+            if ids[target] == index:
+                raise ExecutionGraphError(f"execution [{index}] references itself")
+            depends_on.add(ids[target])
+        dependencies.append(depends_on)
+
+    _check_acyclic(executions, dependencies)
+    return dependencies
+
+
+def _check_acyclic(executions: List[ExecutionRequest], dependencies: List[Set[int]]) -> None:
+    """Reject cycles using Kahn's algorithm"""
+    remaining = [len(deps) for deps in dependencies]
+    dependents: List[List[int]] = [[] for _ in dependencies]
+    for index, deps in enumerate(dependencies):
+        for dep in deps:
+            dependents[dep].append(index)
+
+    ready = [index for index, count in enumerate(remaining) if count == 0]
+    visited = 0
+    while ready:
+        index = ready.pop()
+        visited += 1
+        for dependent in dependents[index]:
+            remaining[dependent] -= 1
+            if remaining[dependent] == 0:
+                ready.append(dependent)
+
+    if visited < len(dependencies):
+        cycle = [
+            executions[index].id or f"[{index}]"
+            for index, count in enumerate(remaining) if count > 0
+        ]
+        raise ExecutionGraphError(f"dependency cycle between {', '.join(cycle)}")
+
+
+def resolve_references(value: Any, results: Dict[str, ExecutionResult]) -> Any:
+    """
+    Replace $ref expressions with values from finished results
+
+    Args:
+        value: Parameter value possibly containing references
+        results: Finished results by execution id
+
+    Returns:
+        Copy of value with references resolved
+
+    Raises:
+        ValueError: If a referenced path does not exist in the result
+    """
+    if _is_ref(value):
+        tokens = parse_path(value[REF_KEY])
+        result = results[tokens[0]]
+        view = {
+            "api_name": result.api_name,
+            "success": result.success,
+            "data": result.data,
+            "error": result.error
+        }
+        try:
+            return get_at(view, tokens[1:])
+        except ValueError as e:
+            raise ValueError(f"Cannot resolve $ref '{value[REF_KEY]}': {e}")
+    if isinstance(value, dict):
+        return {key: resolve_references(item, results) for key, item in value.items()}
+    if isinstance(value, list):
+        return [resolve_references(item, results) for item in value]
+    return value
@@ -1,57 +1,327 @@
 """API execution service"""
 import asyncio
-from typing import List
-from ..models import ExecutionRequest, ExecutionResult
+import hashlib
+import json
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+from ..models import ExecutionRequest, ExecutionResult, SweepRequest, SweepResult
 from ..data_access import DataProvider
+from ..cache import CacheProvider, SingleFlight, ResultStore
+from ..utils.errors import APINotFoundError
+from ..utils.json_path import find_largest_list, format_path, replace_at
+from ..utils.projection import compile_projection
+from ..utils.summarize import ResultSummarizer
+from .execution_graph import build_dependency_graph, resolve_references
+from .pagination import execute_paginated
+from .parameter_validator import ParameterValidator
+from .api_service import APIService
+
+logger = logging.getLogger(__name__)
+
+# Called with (index in the request list, result) as soon as each execution finishes
+ResultCallback = Callable[[int, ExecutionResult], Awaitable[None]]
 
 
 class ExecutionService:
     """Service for executing APIs"""
 
-    def __init__(self, data_provider: DataProvider):
+    def __init__(
+        self,
+        data_provider: DataProvider,
+        result_cache: Optional[CacheProvider] = None,
+        cacheable_apis: Optional[Dict[str, Optional[int]]] = None,
+        default_result_ttl: int = 300,
+        result_store: Optional[ResultStore] = None,
+        validator: Optional[ParameterValidator] = None,
+        api_service: Optional[APIService] = None,
+        summarizer: Optional[ResultSummarizer] = None,
+        summary_sample_rows: int = 5,
+        sweep_max_concurrency: int = 20,
+        sweep_max_rows: int = 1000
+    ):
         """
         Initialize execution service
 
         Args:
             data_provider: Data provider instance
+            result_cache: Cache for results of read-only APIs (None disables caching)
+            cacheable_apis: Read-only API names mapped to their result TTL in seconds
+                (None uses default_result_ttl)
+            default_result_ttl: Result TTL for cacheable APIs without their own TTL
+            result_store: Store for large results (None returns them in full)
+            validator: Pre-flight parameter validator (None sends parameters unchecked)
+            api_service: API service used to reject unknown API names before calling the backend
+            summarizer: Computes summaries for summarize executions (default settings if None)
+            summary_sample_rows: Rows of the summarized list returned next to a summary
+            sweep_max_concurrency: Upper bound for the concurrency a sweep requests
+            sweep_max_rows: Largest number of rows (calls) a sweep may have
         """
         self._data_provider = data_provider
+        self._result_cache = result_cache
+        self._cacheable_apis = cacheable_apis or {}
+        self._default_result_ttl = default_result_ttl
+        self._inflight = SingleFlight()
+        self._result_store = result_store
+        self._validator = validator
+        self._api_service = api_service
+        self._summarizer = summarizer or ResultSummarizer()
+        self._summary_sample_rows = summary_sample_rows
+        self._sweep_max_concurrency = sweep_max_concurrency
+        self._sweep_max_rows = sweep_max_rows
 
     async def execute_apis(
-        self, app_id: str, executions: List[ExecutionRequest]
+        self,
+        app_id: str,
+        executions: List[ExecutionRequest],
+        on_result: Optional[ResultCallback] = None
     ) -> List[ExecutionResult]:
         """
         Execute multiple APIs concurrently
 
+        Executions may reference each other's results through {"$ref": "<id>.<path>"}
+        parameter values. Independent executions start immediately; dependent ones
+        start as soon as everything they reference has finished.
+
         Args:
             app_id: Application identifier
             executions: List of execution requests
+            on_result: Optional callback invoked in completion order as soon as
+                each result is available (streaming mode)
 
         Returns:
-            List of execution results
+            List of execution results, in request order
+
+        Raises:
+            ExecutionGraphError: If references are unknown, malformed or cyclic
         """
+        dependencies = build_dependency_graph(executions)
+
+        # Raw (unprojected, unpaged) results that dependent executions read from
+        loop = asyncio.get_running_loop()
+        raw_results = [loop.create_future() for _ in executions]
+
         # Execute all APIs concurrently
         tasks = [
-            self._execute_single(app_id, execution)
-            for execution in executions
+            asyncio.ensure_future(
+                self._execute_indexed(app_id, i, executions, dependencies[i], raw_results)
+            )
+            for i in range(len(executions))
         ]
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Convert exceptions to error results
-        final_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                final_results.append(ExecutionResult(
-                    api_name=executions[i].api_name,
-                    success=False,
-                    error=str(result)
-                ))
-            else:
-                final_results.append(result)
+        final_results: List[Optional[ExecutionResult]] = [None] * len(executions)
+        try:
+            for completed in asyncio.as_completed(tasks):
+                index, result = await completed
+                final_results[index] = result
+                if on_result:
+                    await self._notify(on_result, index, result)
+        finally:
+            for task in tasks:
+                task.cancel()
 
         return final_results
 
+    async def execute_sweep(self, app_id: str, sweep: SweepRequest) -> SweepResult:
+        """
+        Call one API for every row of varying parameter values
+
+        Rows are built by zipping the vary columns onto base_parameters and run
+        with the requested concurrency, capped at sweep_max_concurrency. Results
+        come back in columnar form instead of one ExecutionResult per row.
+
+        Args:
+            app_id: Application identifier
+            sweep: Sweep request
+
+        Returns:
+            Per-row result data with an error mask
+
+        Raises:
+            ValueError: If the vary columns have different lengths or more than
+                sweep_max_rows rows
+        """
+        lengths = {name: len(values) for name, values in sweep.vary.items()}
+        if len(set(lengths.values())) > 1:
+            raise ValueError(f"vary columns must have the same length, got {lengths}")
+        count = next(iter(lengths.values()), 0)
+        if count > self._sweep_max_rows:
+            raise ValueError(f"Sweep has {count} rows, at most {self._sweep_max_rows} are allowed")
+
+        projection = compile_projection(sweep.fields) if sweep.fields else None
+        semaphore = asyncio.Semaphore(min(max(1, sweep.concurrency), self._sweep_max_concurrency))
+        columns = list(sweep.vary.items())
+        data: List[Any] = [None] * count
+        errors: Dict[int, str] = {}
+
+        async def run_row(index: int) -> None:
+            parameters = dict(sweep.base_parameters)
+            for name, values in columns:
+                parameters[name] = values[index]
+            execution = ExecutionRequest(api_name=sweep.api_name, parameters=parameters)
+            async with semaphore:
+                result = await self._execute_single(app_id, execution)
+            if not result.success:
+                errors[index] = result.error or "Unknown error"
+            elif projection:
+                data[index] = projection.apply(result.data)
+            else:
+                data[index] = result.data
+
+        await asyncio.gather(*[run_row(i) for i in range(count)])
+
+        logger.info(f"Sweep {sweep.api_name}: {count - len(errors)}/{count} succeeded")
+        return SweepResult(
+            api_name=sweep.api_name,
+            count=count,
+            succeeded=count - len(errors),
+            data=data,
+            error_mask=[i in errors for i in range(count)],
+            errors=errors
+        )
+
+    async def _execute_indexed(
+        self,
+        app_id: str,
+        index: int,
+        executions: List[ExecutionRequest],
+        depends_on: Set[int],
+        raw_results: List[asyncio.Future]
+    ) -> Tuple[int, ExecutionResult]:
+        """Execute a single API once its dependencies finished, tagging the result with its request index"""
+        execution = executions[index]
+        raw = None
+        try:
+            if depends_on:
+                execution = await self._resolve_dependencies(
+                    executions, index, depends_on, raw_results
+                )
+            if execution.paginate:
+                raw = result = await execute_paginated(
+                    execution, lambda page: self._execute_single(app_id, page)
+                )
+            else:
+                raw = result = await self._execute_single(app_id, execution)
+            if execution.fields and result.success:
+                projection = compile_projection(execution.fields)
+                result = result.model_copy(update={"data": projection.apply(result.data)})
+            if execution.summarize and result.success:
+                result = await self._summarize(app_id, result)
+            elif self._result_store and result.success:
+                result = await self._offload_large(app_id, result)
+        except Exception as e:
+            # Convert exceptions to error results
+            result = ExecutionResult(
+                api_name=execution.api_name,
+                success=False,
+                error=str(e)
+            )
+        raw_results[index].set_result(raw or result)
+        return index, result
+
+    async def _resolve_dependencies(
+        self,
+        executions: List[ExecutionRequest],
+        index: int,
+        depends_on: Set[int],
+        raw_results: List[asyncio.Future]
+    ) -> ExecutionRequest:
+        """
+        Wait for referenced executions and substitute their values into the parameters
+
+        Args:
+            executions: List of execution requests
+            index: Index of the execution to resolve
+            depends_on: Indexes of the executions it references
+            raw_results: Futures of raw results, by index
+
+        Returns:
+            Execution request with references replaced by values
+
+        Raises:
+            ValueError: If a dependency failed or a referenced path does not exist
+        """
+        results = {}
+        for dep in sorted(depends_on):
+            result = await raw_results[dep]
+            dep_id = executions[dep].id
+            if not result.success:
+                raise ValueError(f"Dependency '{dep_id}' failed: {result.error}")
+            results[dep_id] = result
+
+        execution = executions[index]
+        parameters = resolve_references(execution.parameters, results)
+        return execution.model_copy(update={"parameters": parameters})
+
+    async def _offload_large(self, app_id: str, result: ExecutionResult) -> ExecutionResult:
+        """
+        Keep a large result server-side and return only its first page
+
+        The longest list inside the result data is paged; everything else is
+        returned as is.
+
+        Args:
+            app_id: Application identifier
+            result: Successful execution result
+
+        Returns:
+            The result, with its rows cut to the first page if it was stored
+        """
+        path, rows = find_largest_list(result.data)
+        if rows is None:
+            return result
+
+        paged = await self._result_store.offload(app_id, rows)
+        if paged is None:
+            return result
+
+        first_page, page = paged
+        page.path = format_path(path) or None
+        return result.model_copy(update={
+            "data": replace_at(result.data, path, first_page),
+            "page": page
+        })
+
+    async def _summarize(self, app_id: str, result: ExecutionResult) -> ExecutionResult:
+        """
+        Replace the longest list inside a result by its summary and a few sample rows
+
+        The full list is kept in the result store (page.next_cursor reads the
+        rows after the sample).
+
+        Args:
+            app_id: Application identifier
+            result: Successful execution result
+
+        Returns:
+            The result with summary set, or unchanged if its data holds no list
+        """
+        path, rows = find_largest_list(result.data)
+        if rows is None:
+            return result
+
+        summary = await asyncio.to_thread(self._summarizer.summarize, rows)
+        paged = None
+        if self._result_store and rows:
+            paged = await self._result_store.offload(
+                app_id, rows, force=True, first_page_size=self._summary_sample_rows
+            )
+        sample, page = paged or (rows[:self._summary_sample_rows], None)
+        if page:
+            page.path = format_path(path) or None
+        return result.model_copy(update={
+            "data": replace_at(result.data, path, sample),
+            "page": page,
+            "summary": summary
+        })
+
+    @staticmethod
+    async def _notify(on_result: ResultCallback, index: int, result: ExecutionResult) -> None:
+        """Deliver a streamed result without letting callback errors abort the batch"""
+        try:
+            await on_result(index, result)
+        except Exception as e:
+            logger.warning(f"Failed to stream result [{index}] {result.api_name}: {e}")
+
     async def _execute_single(
         self, app_id: str, execution: ExecutionRequest
     ) -> ExecutionResult:
@@ -66,6 +336,14 @@ class ExecutionService:
             Execution result
         """
         try:
+            if self._api_service:
+                unknown = await self._api_service.check_api_names(app_id, [execution.api_name])
+                if unknown:
+                    raise APINotFoundError(execution.api_name, unknown[execution.api_name])
+            if self._validator:
+                execution = await self._validator.validate(app_id, execution)
+            if self._result_cache and execution.api_name in self._cacheable_apis:
+                return await self._execute_cached(app_id, execution)
             return await self._data_provider.execute_api(app_id, execution)
         except Exception as e:
             return ExecutionResult(
@@ -73,3 +351,50 @@ class ExecutionService:
                 success=False,
                 error=str(e)
             )
+
+    async def _execute_cached(
+        self, app_id: str, execution: ExecutionRequest
+    ) -> ExecutionResult:
+        """
+        Execute a read-only API through the result cache
+
+        Identical concurrent calls share one backend request. Only successful
+        results are cached. Callers get deep copies, so mutating a returned
+        result never changes the cached one or another caller's.
+
+        Args:
+            app_id: Application identifier
+            execution: Execution request
+
+        Returns:
+            Execution result
+        """
+        cache_key = self._result_cache_key(app_id, execution)
+
+        cached = await self._result_cache.get(cache_key)
+        if cached:
+            logger.debug(f"Result cache hit for {execution.api_name}")
+            return cached.model_copy(deep=True)
+
+        async def fetch() -> ExecutionResult:
+            result = await self._data_provider.execute_api(app_id, execution)
+            if result.success:
+                ttl = self._cacheable_apis.get(execution.api_name) or self._default_result_ttl
+                await self._result_cache.set(cache_key, result, ttl)
+            return result
+
+        result = await self._inflight.do(cache_key, fetch)
+        return result.model_copy(deep=True)
+
+    @staticmethod
+    def _result_cache_key(app_id: str, execution: ExecutionRequest) -> str:
+        """Build a cache key from app_id, api_name and canonicalized parameters"""
+        canonical = json.dumps(
+            execution.parameters,
+            sort_keys=True,
+            ensure_ascii=False,
+            separators=(",", ":"),
+            default=str
+        )
+        digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+        return f"exec_result:{app_id}:{execution.api_name}:{digest}"
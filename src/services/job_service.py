@@ -0,0 +1,287 @@
+"""Asynchronous job service for long-running executions and SQL"""
+import asyncio
+import json
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from ..models import ExecutionRequest, ExecutionResult, ExecutionResponse, SQLExecutionResponse
+from ..models import JobKind, JobStatus, JobResponse
+from ..utils.errors import JobNotFoundError, JobQueueFullError
+from .execution_service import ExecutionService
+from .sql_service import SQLService
+
+logger = logging.getLogger(__name__)
+
+
+class _Job:
+    """In-memory state of a single job"""
+
+    def __init__(self, app_id: str, kind: JobKind, total: int):
+        self.app_id = app_id
+        self.status = JobStatus(
+            job_id=uuid.uuid4().hex,
+            kind=kind,
+            status="queued",
+            total=total,
+            created_at=time.time()
+        )
+        self.partial: Dict[int, ExecutionResult] = {}
+        self.result: Optional[Any] = None
+        self.result_bytes = 0
+        self.task: Optional[asyncio.Task] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status.status in ("succeeded", "failed")
+
+
+class JobService:
+    """
+    Service running execute_apis batches and SQL queries as background jobs
+
+    Work is started immediately on a bounded worker pool and survives the
+    MCP request that submitted it, so clients that hit their request timeout
+    can poll for the result instead of re-submitting the work.
+    """
+
+    def __init__(
+        self,
+        execution_service: ExecutionService,
+        sql_service: SQLService,
+        max_workers: int = 4,
+        max_queued: int = 100,
+        result_ttl: int = 900,
+        max_result_bytes: int = 50 * 1024 * 1024
+    ):
+        """
+        Initialize job service
+
+        Args:
+            execution_service: Execution service instance
+            sql_service: SQL service instance
+            max_workers: Maximum number of jobs running at the same time
+            max_queued: Maximum number of unfinished jobs (running + queued)
+            result_ttl: Seconds a finished job is kept after completion
+            max_result_bytes: Memory cap for finished results (oldest evicted first); a
+                single result larger than this fails its job
+        """
+        self._execution_service = execution_service
+        self._sql_service = sql_service
+        self._workers = asyncio.Semaphore(max_workers)
+        self._max_queued = max_queued
+        self._result_ttl = result_ttl
+        self._max_result_bytes = max_result_bytes
+
+        self._jobs: "OrderedDict[str, _Job]" = OrderedDict()
+        self._result_bytes = 0
+
+    async def submit_execute_apis(
+        self,
+        app_id: str,
+        executions: List[ExecutionRequest],
+        wait_seconds: float = 0
+    ) -> JobResponse:
+        """
+        Submit an execute_apis batch as a job
+
+        Args:
+            app_id: Application identifier
+            executions: List of execution requests
+            wait_seconds: How long to wait for completion before returning
+                the job id with the results finished so far
+
+        Returns:
+            Job status with final or partial results
+        """
+        job = self._create_job(app_id, "execute_apis", len(executions))
+
+        async def on_result(index: int, result: ExecutionResult) -> None:
+            job.partial[index] = result
+            job.status.progress = len(job.partial)
+
+        async def work() -> Any:
+            results = await self._execution_service.execute_apis(
+                app_id, executions, on_result=on_result
+            )
+            return ExecutionResponse(results=results).model_dump()
+
+        return await self._start(job, work, wait_seconds)
+
+    async def submit_execute_sql(
+        self,
+        app_id: str,
+        db_name: str,
+        sql: str,
+        wait_seconds: float = 0
+    ) -> JobResponse:
+        """
+        Submit a SQL query as a job
+
+        The automatic row limit applies as for execute_sql; a truncated result
+        carries the continuation token for the next rows.
+
+        Args:
+            app_id: Application identifier
+            db_name: Database name
+            sql: SQL query to execute
+            wait_seconds: How long to wait for completion before returning the job id
+
+        Returns:
+            Job status with the result if it finished in time
+        """
+        job = self._create_job(app_id, "execute_sql", 1)
+
+        async def work() -> Any:
+            result = await self._sql_service.execute_sql(app_id, db_name, sql)
+            job.status.progress = 1
+            return SQLExecutionResponse(result=result).model_dump()
+
+        return await self._start(job, work, wait_seconds)
+
+    def get_status(self, app_id: str, job_id: str) -> JobStatus:
+        """
+        Get job status
+
+        Args:
+            app_id: Application identifier (must match the one that submitted the job)
+            job_id: Job identifier
+
+        Returns:
+            Current job status
+
+        Raises:
+            JobNotFoundError: If the job is unknown, expired or of another app
+        """
+        return self._get_job(app_id, job_id).status.model_copy()
+
+    def get_result(self, app_id: str, job_id: str) -> JobResponse:
+        """
+        Get job result, or the results finished so far if still running
+
+        Args:
+            app_id: Application identifier (must match the one that submitted the job)
+            job_id: Job identifier
+
+        Returns:
+            Job status with final or partial results
+
+        Raises:
+            JobNotFoundError: If the job is unknown, expired or of another app
+        """
+        return self._response(self._get_job(app_id, job_id))
+
+    def _create_job(self, app_id: str, kind: JobKind, total: int) -> _Job:
+        """Register a new job, enforcing the queue limit"""
+        self._purge()
+        unfinished = sum(1 for job in self._jobs.values() if not job.finished)
+        if unfinished >= self._max_queued:
+            raise JobQueueFullError(self._max_queued)
+
+        job = _Job(app_id, kind, total)
+        self._jobs[job.status.job_id] = job
+        return job
+
+    async def _start(
+        self, job: _Job, work: Callable[[], Awaitable[Any]], wait_seconds: float
+    ) -> JobResponse:
+        """Schedule job work on the worker pool and optionally wait for it"""
+        job.task = asyncio.ensure_future(self._run(job, work))
+        logger.info(f"Job {job.status.job_id} submitted ({job.status.kind}, {job.status.total} unit(s))")
+
+        if wait_seconds and wait_seconds > 0:
+            # asyncio.wait leaves the task running when the timeout expires
+            await asyncio.wait({job.task}, timeout=wait_seconds)
+
+        return self._response(job)
+
+    async def _run(self, job: _Job, work: Callable[[], Awaitable[Any]]) -> None:
+        """Run job work once a worker slot is free"""
+        try:
+            async with self._workers:
+                job.status.status = "running"
+                job.status.started_at = time.time()
+                result = await work()
+        except asyncio.CancelledError:
+            logger.warning(f"Job {job.status.job_id} cancelled")
+            job.status.status = "failed"
+            job.status.error = "Job was cancelled"
+            raise
+        except Exception as e:
+            logger.error(f"Job {job.status.job_id} failed: {e}")
+            job.status.status = "failed"
+            job.status.error = str(e)
+        else:
+            size = len(json.dumps(result, ensure_ascii=False, default=str))
+            if size > self._max_result_bytes:
+                logger.error(f"Job {job.status.job_id} result of {size} bytes exceeds the memory cap")
+                job.status.status = "failed"
+                job.status.error = f"Result too large: {size} bytes (limit {self._max_result_bytes})"
+            else:
+                job.result = result
+                job.result_bytes = size
+                self._result_bytes += size
+                job.status.status = "succeeded"
+                job.status.progress = job.status.total
+        finally:
+            job.status.finished_at = time.time()
+            job.partial = {}
+            logger.info(
+                f"Job {job.status.job_id} {job.status.status} in "
+                f"{job.status.finished_at - job.status.created_at:.2f}s"
+            )
+            self._purge()
+
+    def _response(self, job: _Job) -> JobResponse:
+        """Build a response with final or partial results"""
+        status = job.status.model_copy()
+        if job.finished:
+            return JobResponse(job=status, result=job.result)
+
+        if job.partial:
+            partial = [
+                {"index": index, **result.model_dump()}
+                for index, result in sorted(job.partial.items())
+            ]
+            return JobResponse(job=status, result={"results": partial}, partial=True)
+
+        return JobResponse(job=status)
+
+    def _get_job(self, app_id: str, job_id: str) -> _Job:
+        """Look up a job of app_id that has not expired"""
+        self._purge()
+        job = self._jobs.get(job_id)
+        if job is None or job.app_id != app_id:
+            raise JobNotFoundError(job_id)
+        return job
+
+    def _purge(self) -> None:
+        """Drop expired finished jobs, then the oldest ones while over the memory cap"""
+        now = time.time()
+        for job_id, job in list(self._jobs.items()):
+            if job.finished and now - job.status.finished_at > self._result_ttl:
+                self._evict(job_id)
+
+        if self._result_bytes <= self._max_result_bytes:
+            return
+        for job_id, job in list(self._jobs.items()):
+            if self._result_bytes <= self._max_result_bytes:
+                break
+            if job.finished:
+                self._evict(job_id)
+
+    def _evict(self, job_id: str) -> None:
+        """Remove a job and release its result memory"""
+        job = self._jobs.pop(job_id)
+        self._result_bytes -= job.result_bytes
+
+    def get_stats(self) -> dict:
+        """Get job statistics"""
+        counts: Dict[str, int] = {}
+        for job in self._jobs.values():
+            counts[job.status.status] = counts.get(job.status.status, 0) + 1
+        return {
+            "jobs": counts,
+            "result_bytes": self._result_bytes
+        }
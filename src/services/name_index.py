@@ -0,0 +1,153 @@
+"""Per-app index of API names for fail-fast lookups and suggestions"""
+import time
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Set
+
+
+def name_ngrams(text: str, n: int = 2) -> Set[str]:
+    """Character n-grams of a name (lowercased, padded so short names still match)"""
+    padded = f" {text.strip().lower()} "
+    if len(padded) <= n:
+        return {padded}
+    return {padded[i:i + n] for i in range(len(padded) - n + 1)}
+
+
+class _AppNames:
+    """Known names of one app"""
+
+    def __init__(self):
+        self.names: Set[str] = set()
+        self.grams: Dict[str, Set[str]] = {}
+        self.complete = False
+        self.built_at = 0.0
+
+
+class APINameIndex:
+    """
+    Index of API names per app
+
+    Names are added as category listings and details are seen. Once an app's
+    index has been built from all of its categories it is marked complete,
+    and a name missing from it is known not to exist, so callers can reject
+    it without a backend call. A character n-gram index provides nearest-match
+    suggestions for misspelled or invented names.
+    """
+
+    def __init__(self, ngram_size: int = 2):
+        """
+        Initialize name index
+
+        Args:
+            ngram_size: Character n-gram size used for suggestions
+        """
+        self._ngram_size = ngram_size
+        self._apps: Dict[str, _AppNames] = {}
+
+    def add(self, app_id: str, names: Iterable[str]) -> None:
+        """
+        Add names seen for an app
+
+        Args:
+            app_id: Application identifier
+            names: API names
+        """
+        app = self._apps.setdefault(app_id, _AppNames())
+        for name in names:
+            if name in app.names:
+                continue
+            app.names.add(name)
+            for gram in name_ngrams(name, self._ngram_size):
+                app.grams.setdefault(gram, set()).add(name)
+
+    def replace(self, app_id: str, names: Iterable[str], complete: bool = True) -> None:
+        """
+        Replace an app's names with a new listing
+
+        Args:
+            app_id: Application identifier
+            names: API names of the app
+            complete: Whether names holds every API of the app (False if some
+                categories could not be listed)
+        """
+        self._apps[app_id] = _AppNames()
+        self.add(app_id, names)
+        app = self._apps[app_id]
+        app.complete = complete
+        app.built_at = time.time()
+
+    def discard(self, app_id: str) -> None:
+        """Forget an app's names"""
+        self._apps.pop(app_id, None)
+
+    def is_complete(self, app_id: str, max_age: Optional[float] = None) -> bool:
+        """Whether the app's index holds every name (and is younger than max_age seconds)"""
+        app = self._apps.get(app_id)
+        if app is None or not app.complete:
+            return False
+        return max_age is None or time.time() - app.built_at <= max_age
+
+    def is_known(self, app_id: str, name: str, max_age: Optional[float] = None) -> Optional[bool]:
+        """
+        Check whether an API name exists
+
+        Args:
+            app_id: Application identifier
+            name: API name
+            max_age: Seconds after which a complete index no longer proves a
+                name missing (None = never)
+
+        Returns:
+            True if known, False if the complete, fresh index does not contain
+            it, None if the index is incomplete or stale and the name has not
+            been seen
+        """
+        app = self._apps.get(app_id)
+        if app is None:
+            return None
+        if name in app.names:
+            return True
+        return False if self.is_complete(app_id, max_age) else None
+
+    def suggest(self, app_id: str, name: str, limit: int = 3, min_score: float = 0.2) -> List[str]:
+        """
+        Suggest known names close to a given name
+
+        Args:
+            app_id: Application identifier
+            name: Unknown name
+            limit: Maximum number of suggestions
+            min_score: Minimum similarity (Dice coefficient over n-grams)
+
+        Returns:
+            Best matching known names, best first
+        """
+        app = self._apps.get(app_id)
+        if app is None:
+            return []
+
+        query_grams = name_ngrams(name, self._ngram_size)
+        shared: Counter = Counter()
+        for gram in query_grams:
+            for candidate in app.grams.get(gram, ()):
+                shared[candidate] += 1
+
+        query = name.strip().lower()
+        scored = []
+        for candidate, count in shared.items():
+            candidate_grams = len(name_ngrams(candidate, self._ngram_size))
+            score = 2 * count / (len(query_grams) + candidate_grams)
+            lowered = candidate.lower()
+            if query and (query in lowered or lowered in query):
+                score += 0.3
+            if score >= min_score:
+                scored.append((score, candidate))
+
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [candidate for _, candidate in scored[:limit]]
+
+    def get_stats(self) -> dict:
+        """Get index statistics"""
+        return {
+            app_id: {"names": len(app.names), "complete": app.complete}
+            for app_id, app in self._apps.items()
+        }
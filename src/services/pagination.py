@@ -0,0 +1,144 @@
+"""Automatic parallel pagination of paged backend APIs"""
+import asyncio
+import logging
+import math
+from typing import Awaitable, Callable, List, Optional, Tuple
+from ..models import ExecutionRequest, ExecutionResult, PaginationSpec
+from ..utils.json_path import PathToken, find_largest_list, get_at, parse_path, replace_at
+
+logger = logging.getLogger(__name__)
+
+# Keys commonly used by backends for the total row count
+TOTAL_KEYS = ("total", "totalCount", "totalNum", "totalSize", "totalRecords", "recordsTotal", "count")
+
+Executor = Callable[[ExecutionRequest], Awaitable[ExecutionResult]]
+
+
+class _PageError(Exception):
+    """A page request failed"""
+
+
+async def execute_paginated(execution: ExecutionRequest, execute: Executor) -> ExecutionResult:
+    """
+    Fetch every page of a paged API and merge the rows in page order
+
+    The first page is fetched to locate the rows and the total; the remaining
+    pages are then fetched concurrently (bounded by spec.concurrency). When no
+    total is found, pages are fetched in concurrent waves until a short page.
+
+    Args:
+        execution: Execution request with a pagination spec
+        execute: Function executing a single (non-paginated) request
+
+    Returns:
+        Result of the first page with its rows replaced by the merged rows
+    """
+    spec: PaginationSpec = execution.paginate
+    page_size = spec.page_size or int(execution.parameters.get(spec.size_param) or 100)
+    row_limit = spec.max_rows if spec.max_rows is not None else math.inf
+
+    def page_request(page: int) -> ExecutionRequest:
+        parameters = dict(execution.parameters)
+        parameters[spec.page_param] = page
+        parameters[spec.size_param] = page_size
+        return execution.model_copy(update={"parameters": parameters, "paginate": None})
+
+    first = await execute(page_request(spec.start_page))
+    if not first.success:
+        return first
+
+    rows_tokens, rows = _locate_rows(first.data, spec)
+    if rows_tokens is None:
+        logger.warning(f"No row list found in {execution.api_name} result, pagination skipped")
+        return first
+
+    pages: List[list] = [rows]
+    total = _locate_total(first.data, rows_tokens, spec)
+    semaphore = asyncio.Semaphore(max(1, spec.concurrency))
+
+    async def fetch(page: int) -> list:
+        async with semaphore:
+            result = await execute(page_request(page))
+        if not result.success:
+            raise _PageError(f"page {page} failed: {result.error}")
+        try:
+            page_rows = get_at(result.data, rows_tokens)
+        except ValueError:
+            page_rows = []
+        return page_rows if isinstance(page_rows, list) else []
+
+    try:
+        if total is not None:
+            wanted = min(total, row_limit)
+            page_count = min(spec.max_pages, math.ceil(wanted / page_size)) if page_size else 1
+            pages += await _gather_pages([
+                fetch(spec.start_page + offset) for offset in range(1, page_count)
+            ])
+        else:
+            next_page = spec.start_page + 1
+            while (
+                len(pages[-1]) >= page_size
+                and len(pages) < spec.max_pages
+                and sum(len(p) for p in pages) < row_limit
+            ):
+                wave = range(next_page, min(next_page + spec.concurrency, spec.start_page + spec.max_pages))
+                if not wave:
+                    break
+                wave_pages = await _gather_pages([fetch(page) for page in wave])
+                next_page += len(wave)
+                for page_rows in wave_pages:
+                    pages.append(page_rows)
+                    if len(page_rows) < page_size:
+                        break
+    except _PageError as e:
+        return ExecutionResult(api_name=execution.api_name, success=False, error=str(e))
+
+    merged = [row for page_rows in pages for row in page_rows]
+    if len(merged) > row_limit:
+        merged = merged[:int(row_limit)]
+
+    logger.info(f"Paginated {execution.api_name}: {len(pages)} page(s), {len(merged)} row(s)")
+    return first.model_copy(update={"data": replace_at(first.data, rows_tokens, merged)})
+
+
+async def _gather_pages(fetches: List[Awaitable[list]]) -> List[list]:
+    """Run page fetches concurrently; if one fails, cancel the others before raising"""
+    tasks = [asyncio.ensure_future(fetch) for fetch in fetches]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+def _locate_rows(data, spec: PaginationSpec) -> Tuple[Optional[List[PathToken]], Optional[list]]:
+    """Find the row list via rows_path or as the longest list in the data"""
+    if spec.rows_path:
+        tokens = parse_path(spec.rows_path)
+        rows = get_at(data, tokens)
+        if not isinstance(rows, list):
+            raise ValueError(f"rows_path '{spec.rows_path}' is not a list")
+        return tokens, rows
+    return find_largest_list(data)
+
+
+def _locate_total(data, rows_tokens: List[PathToken], spec: PaginationSpec) -> Optional[int]:
+    """Find the total row count via total_path or a well-known key next to the rows"""
+    if spec.total_path:
+        return int(get_at(data, parse_path(spec.total_path)))
+
+    # Look next to the rows first, then walk up to the top level
+    for depth in range(len(rows_tokens) - 1, -1, -1):
+        try:
+            container = get_at(data, rows_tokens[:depth])
+        except ValueError:
+            continue
+        if not isinstance(container, dict):
+            continue
+        for key in TOTAL_KEYS:
+            value = container.get(key)
+            if isinstance(value, (int, float)) or (isinstance(value, str) and value.isdigit()):
+                return int(value)
+    return None
@@ -0,0 +1,222 @@
+"""Pre-flight validation of execution parameters against cached API details"""
+import hashlib
+import logging
+import math
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from ..models import APIDetail, ExecutionRequest
+from ..utils.errors import ParameterValidationError
+from .api_service import APIService
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+# Coercions below are applied only when converting back gives exactly the
+# original value, so "00123", "1e3", " 10 ", "inf" or "yes" are never rewritten.
+
+
+def _check_string(value: Any, coerce: bool) -> Any:
+    if isinstance(value, str):
+        return value
+    if coerce and isinstance(value, bool):
+        return "true" if value else "false"
+    if coerce and isinstance(value, int):
+        return str(value)
+    if coerce and isinstance(value, float) and math.isfinite(value):
+        return repr(value)
+    raise TypeError("expected string")
+
+
+def _check_number(value: Any, coerce: bool) -> Any:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    if coerce and isinstance(value, str):
+        for convert in (int, float):
+            try:
+                number = convert(value)
+            except ValueError:
+                continue
+            if math.isfinite(number) and repr(number) == value:
+                return number
+    raise TypeError("expected number")
+
+
+def _check_boolean(value: Any, coerce: bool) -> Any:
+    if isinstance(value, bool):
+        return value
+    if coerce and value in ("true", "false"):
+        return value == "true"
+    if coerce and type(value) is int and value in (0, 1):
+        return value == 1
+    raise TypeError("expected boolean")
+
+
+def _check_object(value: Any, coerce: bool) -> Any:
+    if isinstance(value, dict):
+        return value
+    raise TypeError("expected object")
+
+
+def _check_array(value: Any, coerce: bool) -> Any:
+    if isinstance(value, list):
+        return value
+    raise TypeError("expected array")
+
+
+_CHECKERS: Dict[str, Callable[[Any, bool], Any]] = {
+    "string": _check_string,
+    "str": _check_string,
+    "number": _check_number,
+    "int": _check_number,
+    "integer": _check_number,
+    "long": _check_number,
+    "float": _check_number,
+    "double": _check_number,
+    "boolean": _check_boolean,
+    "bool": _check_boolean,
+    "object": _check_object,
+    "array": _check_array,
+    "list": _check_array,
+}
+
+
+def _fingerprint(detail: APIDetail) -> str:
+    """Version of an API detail's parameter definitions"""
+    text = "|".join(
+        f"{p.name}:{p.type}:{p.type_declared}:{p.required}:{p.default!r}" for p in detail.parameters
+    )
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+class CompiledValidator:
+    """Parameter checks compiled from one version of an APIDetail"""
+
+    def __init__(self, detail: APIDetail):
+        """
+        Compile checks
+
+        Args:
+            detail: API detail with parameter definitions
+        """
+        self.api_name = detail.name
+        self.fingerprint = _fingerprint(detail)
+        self._checks: List[Tuple[str, bool, Optional[Callable[[Any, bool], Any]]]] = []
+        for parameter in detail.parameters:
+            has_default = parameter.default not in (None, "")
+            # Only types the backend declared are checked, not the provider's placeholder
+            checker = (
+                _CHECKERS.get((parameter.type or "").strip().lower()) if parameter.type_declared else None
+            )
+            self._checks.append((parameter.name, parameter.required and not has_default, checker))
+
+    def validate(self, parameters: dict, coerce: bool) -> dict:
+        """
+        Validate parameters, coercing values to the declared types if allowed
+
+        Args:
+            parameters: Execution parameters
+            coerce: Convert values of the wrong type where converting back gives the
+                original (e.g. "10" -> 10, but not "010")
+
+        Returns:
+            Parameters, with coerced values
+
+        Raises:
+            ParameterValidationError: If required parameters are missing or values have the wrong type
+        """
+        checked = parameters
+        problems: List[Tuple[str, str]] = []
+
+        for name, required, checker in self._checks:
+            value = parameters.get(name, _MISSING)
+            if value is _MISSING or value is None or value == "":
+                if required:
+                    problems.append((name, "missing required parameter"))
+                continue
+            if checker is None:
+                continue
+            try:
+                converted = checker(value, coerce)
+            except TypeError as e:
+                problems.append((name, f"{e}, got {type(value).__name__} {value!r}"))
+                continue
+            if converted is not value:
+                if checked is parameters:
+                    checked = dict(parameters)
+                checked[name] = converted
+
+        if problems:
+            raise ParameterValidationError(
+                self.api_name,
+                ", ".join(name for name, _ in problems),
+                "; ".join(f"{name}: {error}" for name, error in problems)
+            )
+        return checked
+
+
+class ParameterValidator:
+    """
+    Validates executions against cached API details before calling the backend
+
+    Validators are compiled once per API version and recompiled when the
+    cached detail's parameter definitions change. APIs whose details are not
+    cached are passed through unchecked, so validation never adds a backend call.
+    """
+
+    def __init__(self, api_service: APIService, coerce: bool = True):
+        """
+        Initialize validator
+
+        Args:
+            api_service: API service whose cached details are used
+            coerce: Coerce values to the declared types instead of rejecting them
+        """
+        self._api_service = api_service
+        self._coerce = coerce
+        # (app_id, api_name) -> (detail object the validator was built from, validator)
+        self._compiled: Dict[Tuple[str, str], Tuple[APIDetail, CompiledValidator]] = {}
+
+    async def validate(self, app_id: str, execution: ExecutionRequest) -> ExecutionRequest:
+        """
+        Validate an execution request
+
+        Args:
+            app_id: Application identifier
+            execution: Execution request
+
+        Returns:
+            The request, with coerced parameters if needed
+
+        Raises:
+            ParameterValidationError: If the parameters are invalid
+        """
+        validator = await self._get_validator(app_id, execution.api_name)
+        if validator is None:
+            return execution
+
+        parameters = validator.validate(execution.parameters, self._coerce)
+        if parameters is execution.parameters:
+            return execution
+        return execution.model_copy(update={"parameters": parameters})
+
+    async def _get_validator(self, app_id: str, api_name: str) -> Optional[CompiledValidator]:
+        """Get the compiled validator for the currently cached detail"""
+        detail = await self._api_service.peek_api_detail(app_id, api_name)
+        key = (app_id, api_name)
+        if detail is None:
+            self._compiled.pop(key, None)
+            return None
+
+        compiled = self._compiled.get(key)
+        if compiled is not None:
+            source, validator = compiled
+            if source is detail:
+                return validator
+            if validator.fingerprint == _fingerprint(detail):
+                self._compiled[key] = (detail, validator)
+                return validator
+            logger.info(f"Parameter definitions of {api_name} changed, recompiling validator")
+
+        validator = CompiledValidator(detail)
+        self._compiled[key] = (detail, validator)
+        return validator
@@ -0,0 +1,183 @@
+"""Speculative, low-priority prefetch of API details"""
+import asyncio
+import logging
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Awaitable, Callable, Dict, Iterable, Iterator, List, Set
+
+logger = logging.getLogger(__name__)
+
+# Warms the cache for the given names and returns the names actually fetched
+WarmFunction = Callable[[List[str]], Awaitable[List[str]]]
+
+
+class DetailPrefetcher:
+    """
+    Prefetches API details an agent is likely to ask for next
+
+    After a category listing the first max_names APIs are warmed in the
+    background, the ones requested most often in the past first. Prefetching
+    runs in small rate-limited batches, waits while foreground detail
+    fetches are in flight, and is cancelled when a newer listing for the
+    same app is scheduled. Prefetched names are tracked so the hit rate
+    (prefetched details later requested from cache) can guide max_names.
+    """
+
+    def __init__(
+        self,
+        max_names: int = 5,
+        rate: float = 5.0,
+        batch_size: int = 5,
+        max_idle_wait: float = 2.0,
+        max_tracked: int = 10000
+    ):
+        """
+        Initialize prefetcher
+
+        Args:
+            max_names: Names warmed per listing
+            rate: Maximum names prefetched per second
+            batch_size: Names per backend call
+            max_idle_wait: Longest wait for foreground fetches to finish before a batch
+            max_tracked: Popularity counters and prefetched names kept per app
+
+        Raises:
+            ValueError: If rate or batch_size is not positive
+        """
+        if rate <= 0 or batch_size <= 0:
+            raise ValueError(f"rate and batch_size must be positive, got {rate} and {batch_size}")
+        self._max_names = max_names
+        self._rate = rate
+        self._batch_size = batch_size
+        self._max_idle_wait = max_idle_wait
+        self._max_tracked = max_tracked
+
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._popularity: Dict[str, Counter] = {}
+        self._prefetched: Dict[str, Set[str]] = {}
+        self._foreground = 0
+        self._next_slot = 0.0
+        self._stats = {"scheduled": 0, "cancelled": 0, "prefetched": 0, "hits": 0, "misses": 0}
+
+    def schedule(self, app_id: str, names: Iterable[str], warm: WarmFunction) -> None:
+        """
+        Start prefetching for a listing, replacing any pending prefetch of the app
+
+        Args:
+            app_id: Application identifier
+            names: API names in listing order
+            warm: Function fetching and caching details for a batch of names
+        """
+        if self._max_names <= 0:
+            return
+        popularity = self._popularity.get(app_id, Counter())
+        ordered = list(dict.fromkeys(names))
+        # Stable sort: popular names first, listing order otherwise
+        ordered.sort(key=lambda name: -popularity[name])
+        candidates = ordered[:self._max_names]
+        if not candidates:
+            return
+
+        self.cancel(app_id)
+        task = asyncio.ensure_future(self._run(app_id, candidates, warm))
+        self._tasks[app_id] = task
+        task.add_done_callback(lambda done: self._forget(app_id, done))
+        self._stats["scheduled"] += 1
+
+    def cancel(self, app_id: str) -> None:
+        """Cancel the pending prefetch of an app"""
+        task = self._tasks.pop(app_id, None)
+        if task and not task.done():
+            task.cancel()
+            self._stats["cancelled"] += 1
+
+    async def close(self) -> None:
+        """Cancel all pending prefetches"""
+        tasks = list(self._tasks.values())
+        for app_id in list(self._tasks):
+            self.cancel(app_id)
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    @contextmanager
+    def foreground(self) -> Iterator[None]:
+        """Mark a foreground backend fetch; prefetch batches wait until none is running"""
+        self._foreground += 1
+        try:
+            yield
+        finally:
+            self._foreground -= 1
+
+    def record_request(self, app_id: str, names: Iterable[str], served_from_cache: Set[str]) -> None:
+        """
+        Record a get_api_details request for popularity and hit rate
+
+        Args:
+            app_id: Application identifier
+            names: Requested API names
+            served_from_cache: Requested names that did not need a backend call
+        """
+        popularity = self._popularity.setdefault(app_id, Counter())
+        prefetched = self._prefetched.get(app_id, set())
+        for name in names:
+            popularity[name] += 1
+            if name in prefetched:
+                prefetched.discard(name)
+                self._stats["hits" if name in served_from_cache else "misses"] += 1
+        if len(popularity) > self._max_tracked:
+            self._popularity[app_id] = Counter(dict(popularity.most_common(self._max_tracked // 2)))
+
+    async def _run(self, app_id: str, names: List[str], warm: WarmFunction) -> None:
+        """Warm names in rate-limited batches, yielding to foreground fetches"""
+        for start in range(0, len(names), self._batch_size):
+            batch = names[start:start + self._batch_size]
+            await self._wait_for_idle()
+            await self._wait_for_rate(len(batch))
+            try:
+                fetched = await warm(batch)
+            except Exception as e:
+                logger.debug(f"Prefetch of {batch} for app {app_id} failed: {e}")
+                continue
+
+            prefetched = self._prefetched.setdefault(app_id, set())
+            if len(prefetched) > self._max_tracked:
+                prefetched.clear()
+            prefetched.update(fetched)
+            self._stats["prefetched"] += len(fetched)
+
+    async def _wait_for_idle(self) -> None:
+        """Wait (bounded) until no foreground fetch is in flight"""
+        deadline = time.monotonic() + self._max_idle_wait
+        while self._foreground and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+
+    async def _wait_for_rate(self, count: int) -> None:
+        """Space batches so at most `rate` names per second are prefetched"""
+        now = time.monotonic()
+        slot = max(now, self._next_slot)
+        reserved_until = self._next_slot = slot + count / self._rate
+        if slot > now:
+            try:
+                await asyncio.sleep(slot - now)
+            except asyncio.CancelledError:
+                # Give the slot back unless a later batch has reserved after it
+                if self._next_slot == reserved_until:
+                    self._next_slot = slot
+                raise
+
+    def _forget(self, app_id: str, task: asyncio.Task) -> None:
+        """Drop a finished task from the pending table and log its failure"""
+        if self._tasks.get(app_id) is task:
+            del self._tasks[app_id]
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Prefetch for app {app_id} failed: {task.exception()}")
+
+    def get_stats(self) -> dict:
+        """Get prefetch statistics including the hit rate"""
+        prefetched = self._stats["prefetched"]
+        return {
+            **self._stats,
+            "pending": len(self._tasks),
+            # Share of prefetched details that a later request was served from
+            "hit_rate": round(self._stats["hits"] / prefetched, 3) if prefetched else None
+        }
@@ -0,0 +1,140 @@
+"""Refresh-ahead of hot cache entries"""
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+from ..cache.access_recorder import AccessRecorder, RecordingCache
+
+logger = logging.getLogger(__name__)
+
+# Reloads cache entries of one app: (app_id, key suffixes after "<prefix>:<app_id>:")
+Refresher = Callable[[str, List[str]], Awaitable[None]]
+
+
+class RefreshAheadScheduler:
+    """
+    Reloads the hottest cache entries shortly before they expire
+
+    Every interval seconds the recorder's top-K keys are checked; keys
+    expiring within lead_time are reloaded through the refresher registered
+    for their prefix (the part before the first ':'). Reloads are spaced to
+    stay within qps backend calls per second. Keys of a batchable prefix are
+    reloaded per app in one call.
+    """
+
+    def __init__(
+        self,
+        cache: RecordingCache,
+        recorder: AccessRecorder,
+        top_k: int = 50,
+        qps: float = 2.0,
+        interval: float = 30.0,
+        lead_time: float = 120.0
+    ):
+        """
+        Initialize scheduler
+
+        Args:
+            cache: Recording cache holding the entries' expiry
+            recorder: Access recorder ranking keys by popularity
+            top_k: Hot keys considered per round
+            qps: Backend calls per second spent on refreshes
+            interval: Seconds between rounds
+            lead_time: Refresh keys expiring within this many seconds
+        """
+        self._cache = cache
+        self._recorder = recorder
+        self._top_k = top_k
+        self._qps = qps
+        self._interval = interval
+        self._lead_time = lead_time
+
+        self._refreshers: Dict[str, Tuple[Refresher, bool]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._stats = {"rounds": 0, "refreshed_keys": 0, "calls": 0, "failures": 0}
+
+    def register(self, prefix: str, refresher: Refresher, batch: bool = False) -> None:
+        """
+        Register the refresher of a key prefix
+
+        Args:
+            prefix: Key prefix before the first ':' (e.g. "api_detail")
+            refresher: Coroutine function reloading entries of one app
+            batch: Reload all due keys of an app in one call
+        """
+        self._refreshers[prefix] = (refresher, batch)
+
+    def ensure_started(self) -> None:
+        """Start the background loop if it is not running (needs a running event loop)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._loop())
+
+    async def close(self) -> None:
+        """Stop the background loop"""
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _loop(self) -> None:
+        """Run refresh rounds forever"""
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Refresh-ahead round failed: {e}")
+            self._recorder.flush()
+
+    async def run_once(self) -> int:
+        """
+        Refresh hot keys that are about to expire
+
+        Returns:
+            Number of keys refreshed
+        """
+        self._stats["rounds"] += 1
+        now = time.time()
+        groups: Dict[Tuple[str, str], List[str]] = {}
+        for key, _ in self._recorder.hot_keys(self._top_k):
+            expiry = self._cache.expires_at(key)
+            if expiry is None or expiry - now > self._lead_time:
+                continue
+            prefix, _, rest = key.partition(":")
+            if prefix not in self._refreshers:
+                continue
+            app_id, _, suffix = rest.partition(":")
+            groups.setdefault((prefix, app_id), []).append(suffix)
+
+        calls: List[Tuple[Refresher, str, List[str]]] = []
+        for (prefix, app_id), suffixes in groups.items():
+            refresher, batch = self._refreshers[prefix]
+            if batch:
+                calls.append((refresher, app_id, suffixes))
+            else:
+                calls.extend((refresher, app_id, [suffix]) for suffix in suffixes)
+
+        # Stay within the QPS budget: at most qps * interval calls, one every 1/qps seconds
+        budget = max(1, int(self._qps * self._interval))
+        refreshed = 0
+        for position, (refresher, app_id, suffixes) in enumerate(calls[:budget]):
+            if position:
+                await asyncio.sleep(1 / self._qps)
+            self._stats["calls"] += 1
+            try:
+                await refresher(app_id, suffixes)
+                refreshed += len(suffixes)
+            except Exception as e:
+                self._stats["failures"] += 1
+                logger.debug(f"Refresh-ahead of {app_id} {suffixes} failed: {e}")
+
+        self._stats["refreshed_keys"] += refreshed
+        if refreshed:
+            logger.info(f"Refresh-ahead: reloaded {refreshed} hot cache entries in {min(len(calls), budget)} calls")
+        return refreshed
+
+    def get_stats(self) -> dict:
+        """Get scheduler statistics"""
+        return dict(self._stats)
@@ -0,0 +1,374 @@
+"""Per-database schema snapshot with background refresh and column search"""
+import asyncio
+import logging
+import time
+from array import array
+from typing import Dict, List, Optional, Tuple
+from ..models import TableInfo, FieldInfo, TableFieldsInfo, SchemaSearchHit
+from ..data_access import DataProvider
+from ..cache import SingleFlight
+from ..utils.text_search import BM25Index
+
+logger = logging.getLogger(__name__)
+
+# A match in a table or column name weighs most, then its comment
+SCHEMA_FIELD_WEIGHTS = {"name": 3.0, "comment": 2.0, "table": 1.0}
+
+_TABLES_SQL = """
+SELECT table_name AS name, table_comment AS comment
+FROM information_schema.tables
+WHERE table_schema = DATABASE() AND table_type = 'BASE TABLE'
+ORDER BY table_name
+"""
+
+_COLUMNS_SQL = """
+SELECT table_name AS table_name, column_name AS name, data_type AS type,
+       column_comment AS comment, is_nullable AS nullable,
+       column_default AS default_value, column_key AS key_type
+FROM information_schema.columns
+WHERE table_schema = DATABASE()
+ORDER BY table_name, ordinal_position
+"""
+
+
+class SchemaSnapshot:
+    """
+    Immutable, indexed view of every table and column of one database
+
+    Columns are stored in parallel lists ordered by table and ordinal
+    position; the columns of table i are positions
+    column_offsets[i]:column_offsets[i + 1]. FieldInfo objects are only
+    created for the tables that are returned.
+    """
+
+    def __init__(self, app_id: str, db_name: str, ngram_size: int = 2):
+        """Initialize an empty snapshot"""
+        self.app_id = app_id
+        self.db_name = db_name
+        self.tables: List[TableInfo] = []
+        self.column_offsets = array("i", [0])
+        self.column_names: List[str] = []
+        self.column_types: List[str] = []
+        self.column_comments: List[str] = []
+        self.column_nullable = bytearray()
+        self.column_defaults: List[Optional[str]] = []
+        self.column_keys: List[str] = []
+        self.built_at = time.time()
+        self._positions: Dict[str, int] = {}  # Lower-cased table name -> position
+        self._index = BM25Index(SCHEMA_FIELD_WEIGHTS, ngram_size=ngram_size)
+
+    @classmethod
+    def build(
+        cls,
+        app_id: str,
+        db_name: str,
+        table_rows: List[dict],
+        column_rows: List[dict],
+        ngram_size: int = 2
+    ) -> "SchemaSnapshot":
+        """
+        Build the snapshot from information_schema rows
+
+        Args:
+            app_id: Application identifier
+            db_name: Database name
+            table_rows: Rows with name and comment
+            column_rows: Rows with table_name and FieldInfo attributes, ordered
+                by table and ordinal position
+            ngram_size: Character n-gram size for Chinese comments
+
+        Returns:
+            Schema snapshot
+        """
+        snapshot = cls(app_id, db_name, ngram_size)
+        for row in table_rows:
+            table = TableInfo(**row)
+            snapshot._positions[table.name.lower()] = len(snapshot.tables)
+            snapshot.tables.append(table)
+
+        grouped: List[List[dict]] = [[] for _ in snapshot.tables]
+        for row in column_rows:
+            position = snapshot._positions.get(str(row.get("table_name", "")).lower())
+            if position is not None:  # Views and other non-base tables are skipped
+                grouped[position].append(row)
+
+        for table, rows in zip(snapshot.tables, grouped):
+            for row in rows:
+                field = FieldInfo(**{k: v for k, v in row.items() if k != "table_name"})
+                snapshot.column_names.append(field.name)
+                snapshot.column_types.append(field.type)
+                snapshot.column_comments.append(field.comment or "")
+                snapshot.column_nullable.append(1 if field.nullable else 0)
+                snapshot.column_defaults.append(field.default_value)
+                snapshot.column_keys.append(field.key_type or "")
+            snapshot.column_offsets.append(len(snapshot.column_names))
+
+        snapshot._build_index()
+        return snapshot
+
+    def _build_index(self) -> None:
+        """Index every table and column by name and comment"""
+        for position, table in enumerate(self.tables):
+            self._index.upsert(
+                f"table:{position}",
+                {"name": table.name, "comment": table.comment or ""},
+                payload=(position, -1)
+            )
+            context = f"{table.name} {table.comment or ''}"
+            for column in range(self.column_offsets[position], self.column_offsets[position + 1]):
+                self._index.upsert(
+                    f"column:{column}",
+                    {"name": self.column_names[column], "comment": self.column_comments[column],
+                     "table": context},
+                    payload=(position, column)
+                )
+
+    def position(self, table_name: str) -> Optional[int]:
+        """Position of a table, None if it does not exist"""
+        return self._positions.get(table_name.lower())
+
+    def fields(self, table_name: str) -> Optional[TableFieldsInfo]:
+        """
+        Fields of a table
+
+        Args:
+            table_name: Table name (case-insensitive)
+
+        Returns:
+            Fields in ordinal order, None if the table does not exist
+        """
+        position = self.position(table_name)
+        if position is None:
+            return None
+        return TableFieldsInfo(
+            table_name=self.tables[position].name,
+            fields=[
+                FieldInfo(
+                    name=self.column_names[column],
+                    type=self.column_types[column],
+                    comment=self.column_comments[column],
+                    nullable=bool(self.column_nullable[column]),
+                    default_value=self.column_defaults[column],
+                    key_type=self.column_keys[column]
+                )
+                for column in range(self.column_offsets[position], self.column_offsets[position + 1])
+            ]
+        )
+
+    def primary_key(self, table_name: str) -> List[str]:
+        """Primary key columns of a table in ordinal order (empty if none or unknown)"""
+        position = self.position(table_name)
+        if position is None:
+            return []
+        return [
+            self.column_names[column]
+            for column in range(self.column_offsets[position], self.column_offsets[position + 1])
+            if self.column_keys[column] == "PRI"
+        ]
+
+    def search(self, query: str, limit: int = 10) -> List[SchemaSearchHit]:
+        """
+        Rank tables and columns against a query
+
+        Args:
+            query: Keywords (Chinese or latin)
+            limit: Maximum number of hits
+
+        Returns:
+            Ranked hits; column hits carry their table
+        """
+        hits = []
+        for doc_id, score in self._index.search(query, limit):
+            position, column = self._index.get_payload(doc_id)
+            table = self.tables[position]
+            column_fields = {}
+            if column >= 0:
+                column_fields = {
+                    "column_name": self.column_names[column],
+                    "column_type": self.column_types[column],
+                    "column_comment": self.column_comments[column] or None
+                }
+            hits.append(SchemaSearchHit(
+                table_name=table.name,
+                table_comment=table.comment or None,
+                score=round(score, 4),
+                **column_fields
+            ))
+        return hits
+
+    @property
+    def column_count(self) -> int:
+        """Number of columns over all tables"""
+        return len(self.column_names)
+
+
+class SQLSchemaService:
+    """
+    Service holding the schema of each (app_id, dbName) in memory
+
+    The first request for a database starts a background task that loads
+    every table and column with two information_schema queries and reloads
+    them every refresh_interval seconds. Readers use the current snapshot
+    and never wait for a reload. Databases not read for idle_timeout seconds
+    stop refreshing and are dropped from memory.
+    """
+
+    def __init__(
+        self,
+        data_provider: DataProvider,
+        refresh_interval: int = 600,
+        ngram_size: int = 2,
+        idle_timeout: int = 3600
+    ):
+        """
+        Initialize schema service
+
+        Args:
+            data_provider: Data provider instance
+            refresh_interval: Seconds between background reloads of a database
+            ngram_size: Character n-gram size for Chinese comments
+            idle_timeout: Seconds without reads after which a database is dropped
+        """
+        self._data_provider = data_provider
+        self._refresh_interval = refresh_interval
+        self._ngram_size = ngram_size
+        self._idle_timeout = idle_timeout
+
+        self._snapshots: Dict[Tuple[str, str], SchemaSnapshot] = {}
+        self._refresh_tasks: Dict[Tuple[str, str], asyncio.Task] = {}
+        self._last_used: Dict[Tuple[str, str], float] = {}
+        self._inflight = SingleFlight()
+        self._stats = {"loads": 0, "failed_loads": 0, "evictions": 0}
+
+    def get_snapshot(self, app_id: str, db_name: str) -> Optional[SchemaSnapshot]:
+        """
+        Get the current snapshot without waiting
+
+        Starts the background refresh of the database on first use.
+
+        Args:
+            app_id: Application identifier
+            db_name: Database name
+
+        Returns:
+            Current snapshot, or None while the first load is running
+        """
+        self._last_used[(app_id, db_name)] = time.time()
+        self._ensure_refresh(app_id, db_name)
+        return self._snapshots.get((app_id, db_name))
+
+    async def load(self, app_id: str, db_name: str) -> SchemaSnapshot:
+        """
+        Get the snapshot, waiting for the first load if needed
+
+        Args:
+            app_id: Application identifier
+            db_name: Database name
+
+        Returns:
+            Current snapshot
+        """
+        snapshot = self.get_snapshot(app_id, db_name)
+        if snapshot is None:
+            snapshot = await self.refresh(app_id, db_name)
+        return snapshot
+
+    async def refresh(self, app_id: str, db_name: str) -> SchemaSnapshot:
+        """
+        Reload a database's schema now; concurrent callers share one load
+
+        Args:
+            app_id: Application identifier
+            db_name: Database name
+
+        Returns:
+            New snapshot
+        """
+        return await self._inflight.do(
+            f"sql_schema:{app_id}:{db_name}", lambda: self._load(app_id, db_name)
+        )
+
+    def invalidate(self, app_id: str, db_name: str) -> None:
+        """Drop a database's snapshot (e.g. after DDL) and reload it in the background"""
+        if self._snapshots.pop((app_id, db_name), None) is None:
+            return
+        task = asyncio.ensure_future(self.refresh(app_id, db_name))
+        # Failures are retried by the refresh loop; retrieve them so they are not reported
+        task.add_done_callback(lambda done: done.cancelled() or done.exception())
+
+    async def close(self) -> None:
+        """Stop all background refreshes"""
+        tasks = list(self._refresh_tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _ensure_refresh(self, app_id: str, db_name: str) -> None:
+        """Start the background refresh loop of a database if it is not running"""
+        key = (app_id, db_name)
+        if key not in self._refresh_tasks:
+            task = asyncio.ensure_future(self._refresh_loop(app_id, db_name))
+            self._refresh_tasks[key] = task
+            task.add_done_callback(lambda _: self._refresh_tasks.pop(key, None))
+
+    async def _refresh_loop(self, app_id: str, db_name: str) -> None:
+        """Reload a database's schema every refresh_interval seconds until it is idle"""
+        key = (app_id, db_name)
+        while time.time() - self._last_used.get(key, 0.0) <= self._idle_timeout:
+            try:
+                await self.refresh(app_id, db_name)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Keep serving the previous snapshot and retry on the next round
+                self._stats["failed_loads"] += 1
+                logger.warning(f"Schema load failed for {db_name} (app {app_id}): {e}")
+            await asyncio.sleep(self._refresh_interval)
+        self._snapshots.pop(key, None)
+        self._last_used.pop(key, None)
+        self._stats["evictions"] += 1
+        logger.info(f"Schema of {db_name} (app {app_id}) dropped after {self._idle_timeout}s without reads")
+
+    async def _load(self, app_id: str, db_name: str) -> SchemaSnapshot:
+        """Query all tables and columns and swap in a new snapshot"""
+        started = time.time()
+        tables_response, columns_response = await asyncio.gather(
+            self._data_provider.execute_sql(app_id, _TABLES_SQL, db_name),
+            self._data_provider.execute_sql(app_id, _COLUMNS_SQL, db_name)
+        )
+        snapshot = SchemaSnapshot.build(
+            app_id,
+            db_name,
+            _chart_rows(tables_response),
+            _chart_rows(columns_response),
+            self._ngram_size
+        )
+        self._snapshots[(app_id, db_name)] = snapshot
+        self._stats["loads"] += 1
+        logger.info(
+            f"Schema loaded for {db_name} (app {app_id}) in {time.time() - started:.2f}s: "
+            f"{len(snapshot.tables)} tables, {snapshot.column_count} columns"
+        )
+        return snapshot
+
+    def get_stats(self) -> dict:
+        """Get schema statistics"""
+        return {
+            **self._stats,
+            "databases": {
+                f"{app_id}/{db_name}": {
+                    "tables": len(snapshot.tables),
+                    "columns": snapshot.column_count,
+                    "age_seconds": round(time.time() - snapshot.built_at, 1)
+                }
+                for (app_id, db_name), snapshot in self._snapshots.items()
+            }
+        }
+
+
+def _chart_rows(response: dict) -> List[dict]:
+    """Rows of the output_standard_chart item of an execSql response"""
+    for item in response.get("data", []):
+        if isinstance(item, dict) and item.get("name") == "output_standard_chart":
+            return item.get("value") or []
+    return []
@@ -0,0 +1,134 @@
+"""Full-text index over API and category metadata"""
+from typing import Dict, Iterable, List, Optional
+from ..models import APIBasic, APIDetail, APISearchHit
+from ..utils.text_search import BM25Index
+
+# A match in the API name weighs most, then its category path
+API_FIELD_WEIGHTS = {"name": 3.0, "category": 2.0, "description": 1.5, "parameters": 1.0}
+
+
+class APISearchIndex:
+    """
+    Per-app BM25 index of API names, descriptions, category paths and parameters
+
+    Documents are keyed by API name and filled in piece by piece: category
+    listings contribute the category path, details contribute the description
+    and parameters. Unchanged documents are not re-indexed.
+    """
+
+    def __init__(self, ngram_size: int = 2):
+        """
+        Initialize search index
+
+        Args:
+            ngram_size: Character n-gram size for Chinese text
+        """
+        self._ngram_size = ngram_size
+        self._apps: Dict[str, BM25Index] = {}
+
+    def index_listing(
+        self,
+        app_id: str,
+        category_id: str,
+        apis: List[APIBasic],
+        category_path: Optional[str] = None
+    ) -> None:
+        """
+        Index the APIs of one category listing
+
+        Args:
+            app_id: Application identifier
+            category_id: Category identifier
+            apis: APIs of the category
+            category_path: Full category name (parent>child), if known
+        """
+        for api in apis:
+            update = {"category_id": category_id}
+            if category_path is not None:
+                update["category"] = category_path
+            self._update(app_id, api.name, update)
+
+    def index_details(self, app_id: str, details: List[APIDetail]) -> None:
+        """
+        Index descriptions and parameters of API details
+
+        Args:
+            app_id: Application identifier
+            details: API details
+        """
+        for api in details:
+            parameters = " ".join(
+                f"{param.name} {param.description}" for param in api.parameters
+            )
+            self._update(app_id, api.name, {
+                "description": api.description,
+                "parameters": parameters
+            })
+
+    def retain(self, app_id: str, names: Iterable[str]) -> None:
+        """
+        Drop every API of an app that is not in names
+
+        Args:
+            app_id: Application identifier
+            names: Every existing API name of the app
+        """
+        index = self._apps.get(app_id)
+        if index is None:
+            return
+        keep = set(names)
+        for name in index.doc_ids():
+            if name not in keep:
+                index.remove(name)
+
+    def search(self, app_id: str, query: str, limit: int = 10) -> List[APISearchHit]:
+        """
+        Search an app's APIs
+
+        Args:
+            app_id: Application identifier
+            query: Free-text query (Chinese or latin)
+            limit: Maximum number of hits
+
+        Returns:
+            Ranked hits
+        """
+        index = self._apps.get(app_id)
+        if index is None:
+            return []
+
+        hits = []
+        for name, score in index.search(query, limit):
+            fields = index.get_fields(name)
+            hits.append(APISearchHit(
+                name=name,
+                category_id=index.get_payload(name),
+                category=fields.get("category") or None,
+                description=fields.get("description") or None,
+                score=round(score, 4)
+            ))
+        return hits
+
+    def size(self, app_id: str) -> int:
+        """Number of indexed APIs of an app"""
+        index = self._apps.get(app_id)
+        return len(index) if index else 0
+
+    def _update(self, app_id: str, name: str, update: Dict[str, str]) -> None:
+        """Merge new field values into an API's document"""
+        index = self._apps.get(app_id)
+        if index is None:
+            index = self._apps[app_id] = BM25Index(API_FIELD_WEIGHTS, ngram_size=self._ngram_size)
+
+        category_id = update.pop("category_id", None) or index.get_payload(name)
+        fields = dict(index.get_fields(name) or {"name": name})
+        fields.update(update)
+        index.upsert(name, fields, payload=category_id)
+
+    def discard(self, app_id: str) -> None:
+        """Drop an app's whole index"""
+        self._apps.pop(app_id, None)
+
+    def get_stats(self) -> dict:
+        """Get index statistics"""
+        return {app_id: len(index) for app_id, index in self._apps.items()}
@@ -1,21 +1,111 @@
 """SQL service for database operations"""
 import asyncio
+import base64
+import json
 import logging
-from typing import List
+from typing import Dict, List, Literal, Optional, Tuple
+from ..cache import CacheProvider, ResultStore, SingleFlight
 from ..data_access import DataProvider
-from ..models import TableInfo, FieldInfo, TableFieldsInfo, SQLExecutionResult
+from ..models import TableInfo, FieldInfo, TableFieldsInfo, SchemaSearchHit, SQLExecutionResult
+from ..utils.columnar import to_columnar
+from ..utils.projection import compile_projection
+from ..utils.summarize import ResultSummarizer
+from ..utils.errors import InvalidContinuationTokenError
+from ..utils.sql_analysis import (
+    SelectShape, analyze_select, fingerprint, is_cacheable_read, literal_list,
+    quote_identifier, quote_literal, tokenize_sql, PUNCT, QUOTED_NAME, WORD
+)
+from .schema_service import SQLSchemaService
 
 logger = logging.getLogger(__name__)
 
+# Statements that change table or column definitions
+_DDL_WORDS = {"CREATE", "ALTER", "DROP", "RENAME"}
+
 
 class SQLService:
     """Service for SQL operations"""
 
-    def __init__(self, data_provider: DataProvider):
+    def __init__(
+        self,
+        data_provider: DataProvider,
+        result_store: Optional[ResultStore] = None,
+        cache: Optional[CacheProvider] = None,
+        schema_ttl: int = 600,
+        fields_batch_size: int = 100,
+        schema: Optional[SQLSchemaService] = None,
+        result_cache: Optional[CacheProvider] = None,
+        result_ttls: Optional[Dict[str, Optional[int]]] = None,
+        default_result_ttl: int = 60,
+        max_rows: Optional[int] = None,
+        summarizer: Optional[ResultSummarizer] = None,
+        summary_sample_rows: int = 5,
+        summary_max_rows: Optional[int] = 100000
+    ):
+        """
+        Initialize SQL service
+
+        Args:
+            data_provider: Data provider instance
+            result_store: Optional store paging large query results
+            cache: Optional cache for table lists and table fields
+            schema_ttl: Seconds table lists and table fields stay cached
+            fields_batch_size: Tables per information_schema.columns query
+            schema: Optional whole-database schema snapshots served before the cache
+            result_cache: Optional cache for results of read-only queries
+            result_ttls: Database name -> result TTL (None uses default_result_ttl)
+            default_result_ttl: Result TTL for databases without their own TTL
+            max_rows: Row limit injected into SELECTs without LIMIT (None = no limit)
+            summarizer: Computes summaries in summarize mode (default settings if None)
+            summary_sample_rows: Rows returned next to a summary
+            summary_max_rows: Row limit of summarized SELECTs without LIMIT (None = no limit)
+        """
         self._data_provider = data_provider
+        self._result_store = result_store
+        self._cache = cache
+        self._schema_ttl = schema_ttl
+        self._fields_batch_size = fields_batch_size
+        self._schema = schema
+        self._result_cache = result_cache
+        self._result_ttls = result_ttls or {}
+        self._default_result_ttl = default_result_ttl
+        self._max_rows = max_rows
+        self._summarizer = summarizer or ResultSummarizer()
+        self._summary_sample_rows = summary_sample_rows
+        self._summary_max_rows = summary_max_rows
+        self._inflight = SingleFlight()
+        # Bumped per (app_id, db_name) to invalidate all cached schema entries at once
+        self._generations: Dict[Tuple[str, str], int] = {}
+        # Bumped per (app_id, db_name) by every statement that is not a cacheable read
+        self._result_generations: Dict[Tuple[str, str], int] = {}
 
     async def get_tables(self, app_id: str, db_name: str) -> List[TableInfo]:
-        """Get table list using information_schema"""
+        """Get table list using information_schema, cached per (app_id, db_name)"""
+        snapshot = self._schema.get_snapshot(app_id, db_name) if self._schema else None
+        if snapshot:
+            return list(snapshot.tables)
+
+        try:
+            if not self._cache:
+                return await self._fetch_tables(app_id, db_name)
+
+            cache_key = self._schema_key("sql_tables", app_id, db_name)
+            cached = await self._cache.get(cache_key)
+            if cached:
+                return list(cached)
+
+            async def fetch() -> List[TableInfo]:
+                tables = await self._fetch_tables(app_id, db_name)
+                await self._cache.set(cache_key, tables, self._schema_ttl)
+                return tables
+
+            return list(await self._inflight.do(cache_key, fetch))
+        except Exception as e:
+            logger.error(f"Error getting tables: {e}")
+            return []
+
+    async def _fetch_tables(self, app_id: str, db_name: str) -> List[TableInfo]:
+        """Query the table list from information_schema"""
         sql = """
         SELECT table_name AS name, table_comment AS comment
         FROM information_schema.tables
@@ -23,59 +113,378 @@ class SQLService:
         ORDER BY table_name
         """
 
-        try:
-            response = await self._data_provider.execute_sql(app_id, sql, db_name)
-            data, _ = self._parse_sql_response(response.get("data", []))
-            return [TableInfo(**row) for row in data]
-        except Exception as e:
-            logger.error(f"Error getting tables: {e}")
-            return []
+        response = await self._data_provider.execute_sql(app_id, sql, db_name)
+        data, _ = self._parse_sql_response(response.get("data", []))
+        return [TableInfo(**row) for row in data]
 
     async def get_table_fields(
         self, app_id: str, db_name: str, table_names: List[str]
     ) -> List[TableFieldsInfo]:
-        """Get fields for multiple tables concurrently"""
-        tasks = [
-            self._get_single_table_fields(app_id, db_name, table)
-            for table in table_names
+        """
+        Get fields for multiple tables
+
+        Tables are served from the schema snapshot, then from the cache; the
+        others (including views, which the snapshot does not hold) are fetched
+        with one information_schema query per fields_batch_size tables.
+
+        Args:
+            app_id: Application identifier
+            db_name: Database name
+            table_names: Table names
+
+        Returns:
+            Fields of every requested table in request order (empty for
+            unknown tables and failed lookups)
+        """
+        names = list(dict.fromkeys(table_names))
+        found: Dict[str, TableFieldsInfo] = {}
+        snapshot = self._schema.get_snapshot(app_id, db_name) if self._schema else None
+        if snapshot:
+            for name in names:
+                fields = snapshot.fields(name)
+                if fields:
+                    found[name] = fields
+
+        # Views and tables created since the snapshot are looked up directly
+        if self._cache:
+            for name in names:
+                if name in found:
+                    continue
+                cached = await self._cache.get(self._schema_key("sql_fields", app_id, db_name, name))
+                if cached:
+                    found[name] = cached
+
+        missing = [name for name in names if name not in found]
+        chunks = [
+            missing[start:start + self._fields_batch_size]
+            for start in range(0, len(missing), self._fields_batch_size)
         ]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        return [r for r in results if isinstance(r, TableFieldsInfo)]
+        for fetched in await asyncio.gather(
+            *(self._get_fields_chunk(app_id, db_name, chunk) for chunk in chunks)
+        ):
+            found.update(fetched)
+
+        return [found.get(name) or TableFieldsInfo(table_name=name, fields=[]) for name in names]
+
+    async def _get_fields_chunk(
+        self, app_id: str, db_name: str, table_names: List[str]
+    ) -> Dict[str, TableFieldsInfo]:
+        """Fetch and cache the fields of a chunk of tables, empty on error"""
+        async def fetch() -> Dict[str, TableFieldsInfo]:
+            fields = await self._fetch_table_fields(app_id, db_name, table_names)
+            if self._cache:
+                for name, info in fields.items():
+                    key = self._schema_key("sql_fields", app_id, db_name, name)
+                    await self._cache.set(key, info, self._schema_ttl)
+            return fields
 
-    async def _get_single_table_fields(
-        self, app_id: str, db_name: str, table_name: str
-    ) -> TableFieldsInfo:
-        """Get fields for a single table"""
+        try:
+            # Identical concurrent requests share one query
+            flight_key = self._schema_key("sql_fields", app_id, db_name, ",".join(sorted(table_names)))
+            return await self._inflight.do(flight_key, fetch)
+        except Exception as e:
+            logger.error(f"Error getting fields for tables {table_names}: {e}")
+            return {}
+
+    async def _fetch_table_fields(
+        self, app_id: str, db_name: str, table_names: List[str]
+    ) -> Dict[str, TableFieldsInfo]:
+        """
+        Query the fields of several tables from information_schema in one statement
+
+        Args:
+            app_id: Application identifier
+            db_name: Database name
+            table_names: Table names (quoted as literals, never interpolated raw)
+
+        Returns:
+            Table name -> fields in ordinal order, for every requested table
+        """
         sql = f"""
-        SELECT column_name AS name, data_type AS type, column_comment AS comment,
-               is_nullable AS nullable, column_default AS default_value,
-               column_key AS key_type
+        SELECT table_name AS table_name, column_name AS name, data_type AS type,
+               column_comment AS comment, is_nullable AS nullable,
+               column_default AS default_value, column_key AS key_type
         FROM information_schema.columns
-        WHERE table_schema = DATABASE() AND table_name = '{table_name}'
-        ORDER BY ordinal_position
+        WHERE table_schema = DATABASE() AND table_name IN ({literal_list(table_names)})
+        ORDER BY table_name, ordinal_position
         """
 
-        try:
-            response = await self._data_provider.execute_sql(app_id, sql, db_name)
-            data, _ = self._parse_sql_response(response.get("data", []))
-            fields = [FieldInfo(**row) for row in data]
-            return TableFieldsInfo(table_name=table_name, fields=fields)
-        except Exception as e:
-            logger.error(f"Error getting fields for table {table_name}: {e}")
-            return TableFieldsInfo(table_name=table_name, fields=[])
+        response = await self._data_provider.execute_sql(app_id, sql, db_name)
+        data, _ = self._parse_sql_response(response.get("data", []))
+
+        # Table names compare case-insensitively on most MySQL setups
+        requested = {name.lower(): name for name in table_names}
+        grouped: Dict[str, List[FieldInfo]] = {name: [] for name in table_names}
+        for row in data:
+            row = dict(row)
+            table = str(row.pop("table_name", ""))
+            name = table if table in grouped else requested.get(table.lower())
+            if name is not None:
+                grouped[name].append(FieldInfo(**row))
+        return {
+            name: TableFieldsInfo(table_name=name, fields=fields)
+            for name, fields in grouped.items()
+        }
+
+    async def search_schema(
+        self, app_id: str, db_name: str, query: str, limit: int = 10
+    ) -> List[SchemaSearchHit]:
+        """
+        Search table and column names and comments of a database
+
+        Args:
+            app_id: Application identifier
+            db_name: Database name
+            query: Keywords (Chinese or latin)
+            limit: Maximum number of hits
+
+        Returns:
+            Ranked tables and columns
+        """
+        if not self._schema:
+            return []
+        snapshot = await self._schema.load(app_id, db_name)
+        return snapshot.search(query, limit)
+
+    async def invalidate_schema(
+        self, app_id: str, db_name: str, table_names: Optional[List[str]] = None
+    ) -> None:
+        """
+        Drop cached schema metadata
+
+        Args:
+            app_id: Application identifier
+            db_name: Database name
+            table_names: Tables whose fields are dropped along with the table
+                list (None = everything cached for the database)
+        """
+        if self._schema:
+            self._schema.invalidate(app_id, db_name)
+        if not self._cache:
+            return
+        if table_names is None:
+            # Entries under the old generation are never read again and expire by TTL
+            key = (app_id, db_name)
+            self._generations[key] = self._generations.get(key, 0) + 1
+            logger.info(f"Invalidated cached schema of {db_name} for app {app_id}")
+            return
+        await self._cache.delete(self._schema_key("sql_tables", app_id, db_name))
+        for table in table_names:
+            await self._cache.delete(self._schema_key("sql_fields", app_id, db_name, table))
+
+    def _schema_key(self, prefix: str, app_id: str, db_name: str, table: Optional[str] = None) -> str:
+        """Cache key of a schema entry under the database's current generation"""
+        generation = self._generations.get((app_id, db_name), 0)
+        key = f"{prefix}:{app_id}:{db_name}:{generation}"
+        return f"{key}:{table}" if table is not None else key
 
     async def execute_sql(
-        self, app_id: str, db_name: str, sql: str
+        self,
+        app_id: str,
+        db_name: str,
+        sql: str,
+        fields: Optional[List[str]] = None,
+        continuation_token: Optional[str] = None,
+        limit_rows: bool = True,
+        format: Literal["rows", "columnar"] = "rows",
+        summarize: bool = False
     ) -> SQLExecutionResult:
-        """Execute arbitrary SQL"""
+        """
+        Execute arbitrary SQL, optionally keeping only the given columns / field paths
+
+        Top-level SELECTs without LIMIT are limited to max_rows rows. When
+        more rows exist the result is marked truncated and carries a
+        continuation token that reads the next rows, by primary key when the
+        query reads a single table that has one, by offset otherwise.
+
+        Args:
+            app_id: Application identifier
+            db_name: Database name
+            sql: SQL text (ignored when continuation_token is given)
+            fields: Columns / field paths to keep
+            continuation_token: Token of a previous truncated result
+            limit_rows: Apply the automatic row limit
+            format: "rows" (data) or "columnar" (columnar: column names once,
+                one value array per column)
+            summarize: Return per-column statistics and a few sample rows instead of
+                all rows; the full result stays in the result store (page.next_cursor).
+                The row limit is summary_max_rows instead of max_rows.
+
+        Returns:
+            Execution result
+        """
         try:
-            response = await self._data_provider.execute_sql(app_id, sql, db_name)
-            data, schema = self._parse_sql_response(response.get("data", []))
-            return SQLExecutionResult(success=True, data=data, result_schema=schema)
+            page: Optional[dict] = None
+            if continuation_token:
+                page = self._decode_token(continuation_token)
+                sql = page["sql"]
+            elif limit_rows:
+                max_rows = self._summary_max_rows if summarize else self._max_rows
+                if max_rows:
+                    page = await self._plan_page(app_id, db_name, sql, max_rows)
+
+            truncated, next_token = False, None
+            if page:
+                data, schema = await self._query(app_id, db_name, self._page_sql(page))
+                if len(data) > page["n"]:
+                    data = data[:page["n"]]
+                    truncated = True
+                    next_token = self._next_token(page, data)
+            else:
+                data, schema = await self._query(app_id, db_name, sql)
+
+            if fields:
+                data = compile_projection(fields).apply(data)
+                schema = [col for col in schema if col.get("name") in fields]
+            page_info, summary = None, None
+            if summarize:
+                summary = await asyncio.to_thread(self._summarizer.summarize, data or [], schema)
+                paged = None
+                if self._result_store and data:
+                    paged = await self._result_store.offload(
+                        app_id, data, force=True, first_page_size=self._summary_sample_rows
+                    )
+                data, page_info = paged or ((data or [])[:self._summary_sample_rows], None)
+            elif self._result_store and data:
+                paged = await self._result_store.offload(app_id, data)
+                if paged:
+                    data, page_info = paged
+            columnar = None
+            if format == "columnar":
+                columnar, data = to_columnar(data or [], schema), None
+            return SQLExecutionResult(
+                success=True,
+                data=data,
+                columnar=columnar,
+                summary=summary,
+                result_schema=schema,
+                page=page_info,
+                truncated=truncated,
+                continuation_token=next_token
+            )
         except Exception as e:
             logger.error(f"Error executing SQL: {e}")
             return SQLExecutionResult(success=False, error=str(e))
 
+    async def _plan_page(self, app_id: str, db_name: str, sql: str, max_rows: int) -> Optional[dict]:
+        """
+        Decide how to limit a statement
+
+        Returns:
+            Page state for _page_sql, None if the statement is left unchanged
+        """
+        shape = analyze_select(sql)
+        if shape is None or shape.has_limit:
+            return None
+        page = {"sql": shape.body, "n": max_rows, "o": 0}
+
+        key = await self._keyset_column(app_id, db_name, shape)
+        if key:
+            page.update({"k": key, "a": None})
+        return page
+
+    async def _keyset_column(self, app_id: str, db_name: str, shape: SelectShape) -> Optional[str]:
+        """Single-column primary key to page by, None if keyset paging does not apply"""
+        if shape.table is None or shape.has_order_by:
+            return None
+        # Check the select list first, it needs no metadata query
+        columns = _plain_columns(shape.select_list)
+        if columns is None:
+            return None
+        fields = await self.get_table_fields(app_id, db_name, [shape.table])
+        primary = [field.name for field in fields[0].fields if field.key_type == "PRI"] if fields else []
+        if len(primary) != 1 or (columns and primary[0].lower() not in columns):
+            return None
+        return primary[0]
+
+    @staticmethod
+    def _page_sql(page: dict) -> str:
+        """Statement reading one page (one extra row tells whether more exist)"""
+        limit = page["n"] + 1
+        key = page.get("k")
+        if key:
+            column = f"_page.{quote_identifier(key)}"
+            where = ""
+            if page.get("a") is not None:
+                after = page["a"]
+                literal = str(after) if isinstance(after, (int, float)) else quote_literal(str(after))
+                where = f" WHERE {column} > {literal}"
+            return f"SELECT * FROM (\n{page['sql']}\n) AS _page{where} ORDER BY {column} LIMIT {limit}"
+        offset = f" OFFSET {page['o']}" if page["o"] else ""
+        # On a new line so a trailing line comment cannot swallow the limit
+        return f"{page['sql']}\nLIMIT {limit}{offset}"
+
+    @staticmethod
+    def _next_token(page: dict, rows: List[dict]) -> Optional[str]:
+        """Continuation token for the rows after this page"""
+        following = dict(page, o=page["o"] + len(rows))
+        key = page.get("k")
+        if key:
+            last = rows[-1] if rows and isinstance(rows[-1], dict) else {}
+            value = next((v for k, v in last.items() if k.lower() == key.lower()), None)
+            if value is not None:
+                following["a"] = value
+            else:
+                # Key value not in the rows: continue by offset in key order
+                following.pop("k")
+                following.pop("a", None)
+                column = f"_page.{quote_identifier(key)}"
+                following["sql"] = f"SELECT * FROM (\n{page['sql']}\n) AS _page ORDER BY {column}"
+        encoded = json.dumps(following, ensure_ascii=False, default=str).encode("utf-8")
+        return base64.urlsafe_b64encode(encoded).decode("ascii")
+
+    @staticmethod
+    def _decode_token(token: str) -> dict:
+        """Page state of a continuation token"""
+        try:
+            page = json.loads(base64.urlsafe_b64decode(token.encode("ascii")))
+            if not isinstance(page.get("sql"), str) or int(page["n"]) < 1 or int(page["o"]) < 0:
+                raise ValueError(token)
+            return page
+        except (ValueError, KeyError, TypeError, UnicodeError):
+            raise InvalidContinuationTokenError(token)
+
+    async def _query(self, app_id: str, db_name: str, sql: str) -> Tuple[List[dict], List[dict]]:
+        """
+        Run a statement, through the result cache when it is a deterministic read
+
+        Identical concurrent reads share one backend request. Any other
+        statement drops the database's cached results (and its cached schema
+        for DDL).
+
+        Args:
+            app_id: Application identifier
+            db_name: Database name
+            sql: SQL text
+
+        Returns:
+            (rows, output_json_schema); cached rows are shared, callers must not mutate them
+        """
+        if not self._result_cache or not is_cacheable_read(sql):
+            response = await self._data_provider.execute_sql(app_id, sql, db_name)
+            if self._result_cache:
+                key = (app_id, db_name)
+                self._result_generations[key] = self._result_generations.get(key, 0) + 1
+            if _is_ddl(sql):
+                await self.invalidate_schema(app_id, db_name)
+            return self._parse_sql_response(response.get("data", []))
+
+        generation = self._result_generations.get((app_id, db_name), 0)
+        cache_key = f"sql_result:{app_id}:{db_name}:{generation}:{fingerprint(sql).key}"
+        cached = await self._result_cache.get(cache_key)
+        if cached:
+            logger.debug(f"SQL result cache hit for {db_name}")
+            return cached
+
+        async def fetch() -> Tuple[List[dict], List[dict]]:
+            response = await self._data_provider.execute_sql(app_id, sql, db_name)
+            result = self._parse_sql_response(response.get("data", []))
+            ttl = self._result_ttls.get(db_name) or self._default_result_ttl
+            await self._result_cache.set(cache_key, result, ttl)
+            return result
+
+        return await self._inflight.do(cache_key, fetch)
+
     def _parse_sql_response(self, response_data: List[dict]) -> tuple:
         """Extract output_standard_chart and output_json_schema"""
         data, schema = [], []
@@ -87,3 +496,41 @@ class SQLService:
                     schema = item.get("value", [])
         return data, schema
 
+
+def _is_ddl(sql: str) -> bool:
+    """Whether any statement in sql changes table or column definitions (comments skipped)"""
+    tokens = tokenize_sql(sql)
+    return any(
+        token.kind == WORD and token.text.upper() in _DDL_WORDS
+        and (index == 0 or tokens[index - 1] == (PUNCT, ";"))
+        for index, token in enumerate(tokens)
+    )
+
+
+def _plain_columns(select_list: List[tuple]) -> Optional[List[str]]:
+    """
+    Lower-cased column names of a select list that can be wrapped as a derived
+    table (SELECT * FROM (...) AS _page)
+
+    Only a lone * (returned as an empty list) or a list of plain, distinct
+    columns qualifies; anything else (t.*, expressions, duplicate names) could
+    repeat a column name, which a derived table rejects, and returns None.
+    """
+    if list(select_list) == [(PUNCT, "*")]:
+        return []
+    items: List[List[tuple]] = [[]]
+    for token in select_list:
+        if token == (PUNCT, ","):
+            items.append([])
+        else:
+            items[-1].append(token)
+
+    names = []
+    for item in items:
+        # column or table.column
+        if len(item) == 3 and item[1] == (PUNCT, "."):
+            item = item[2:]
+        if len(item) != 1 or item[0][0] not in (WORD, QUOTED_NAME):
+            return None
+        names.append(item[0][1].strip("`").lower())
+    return names if len(set(names)) == len(names) else None
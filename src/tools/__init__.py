@@ -1,14 +1,31 @@
 from .categories import get_categories_tool
-from .apis import get_apis_by_category_tool, get_api_details_tool
-from .executor import execute_apis_tool
-from .sql import get_sql_tables_tool, get_sql_table_fields_tool, execute_sql_tool
+from .apis import (
+    get_apis_by_category_tool,
+    get_apis_by_categories_tool,
+    get_api_details_tool,
+    describe_category_tool
+)
+from .executor import execute_apis_tool, execute_api_sweep_tool
+from .sql import get_sql_tables_tool, get_sql_table_fields_tool, search_sql_schema_tool, execute_sql_tool
+from .jobs import submit_job_tool, get_job_status_tool, get_job_result_tool
+from .results import fetch_result_page_tool
+from .search import search_apis_tool
 
 __all__ = [
     "get_categories_tool",
     "get_apis_by_category_tool",
+    "get_apis_by_categories_tool",
     "get_api_details_tool",
+    "describe_category_tool",
     "execute_apis_tool",
+    "execute_api_sweep_tool",
     "get_sql_tables_tool",
     "get_sql_table_fields_tool",
+    "search_sql_schema_tool",
     "execute_sql_tool",
+    "submit_job_tool",
+    "get_job_status_tool",
+    "get_job_result_tool",
+    "fetch_result_page_tool",
+    "search_apis_tool",
 ]
@@ -1,13 +1,15 @@
 """API tools"""
-from typing import List
-from ..models import APIsResponse, APIDetailsResponse
+import json
+from typing import List, Optional
+from ..models import APIsResponse, APIDetailsResponse, CategoryDescriptionResponse
 from ..services import APIService
 
 
 async def get_apis_by_category_tool(
     app_id: str,
     api_service: APIService,
-    category_id: str
+    category_id: str,
+    recursive: bool = False
 ) -> APIsResponse:
     """
     Get all APIs in a specific category
@@ -16,11 +18,38 @@ async def get_apis_by_category_tool(
         app_id: Application identifier
         api_service: API service instance
         category_id: Category identifier
+        recursive: Also include the APIs of all descendant categories
 
     Returns:
         List of APIs with basic information
     """
-    apis = await api_service.get_apis_by_category(app_id, category_id)
+    if recursive:
+        apis = await api_service.get_apis_in_categories(app_id, [category_id])
+    else:
+        apis = await api_service.get_apis_by_category(app_id, category_id)
+
+    return APIsResponse(apis=apis)
+
+
+async def get_apis_by_categories_tool(
+    app_id: str,
+    api_service: APIService,
+    category_ids: List[str],
+    recursive: bool = True
+) -> APIsResponse:
+    """
+    Get the APIs of several categories in one call
+
+    Args:
+        app_id: Application identifier
+        api_service: API service instance
+        category_ids: Category identifiers
+        recursive: Also include the APIs of all descendant categories
+
+    Returns:
+        Merged, deduplicated list of APIs with basic information
+    """
+    apis = await api_service.get_apis_in_categories(app_id, category_ids, recursive)
 
     return APIsResponse(apis=apis)
 
@@ -39,8 +68,77 @@ async def get_api_details_tool(
         api_names: List of API names
 
     Returns:
-        Detailed API information including parameters
+        Detailed API information including parameters, plus suggestions for unknown names
     """
-    apis = await api_service.get_api_details(app_id, api_names)
+    unknown = await api_service.check_api_names(app_id, api_names)
+    apis = await api_service.get_api_details(
+        app_id, [name for name in api_names if name not in unknown]
+    )
+
+    found = {api.name for api in apis}
+    for name in api_names:
+        if name not in found and name not in unknown:
+            unknown[name] = api_service.suggest_api_names(app_id, name)
+
+    return APIDetailsResponse(apis=apis, unknown_apis=unknown)
+
+
+async def describe_category_tool(
+    app_id: str,
+    api_service: APIService,
+    category_id: str,
+    name_filter: Optional[str] = None,
+    recursive: bool = False,
+    max_apis: int = 30,
+    max_bytes: int = 64 * 1024
+) -> CategoryDescriptionResponse:
+    """
+    List a category's APIs and return their details in one call
+
+    Args:
+        app_id: Application identifier
+        api_service: API service instance
+        category_id: Category identifier
+        name_filter: Only APIs whose name contains this text (case-insensitive)
+        recursive: Also include the APIs of all descendant categories
+        max_apis: Maximum number of API details returned
+        max_bytes: Maximum JSON size of the returned details
+
+    Returns:
+        Details of the matching APIs, with the names left out by the size cap
+    """
+    if recursive:
+        apis = await api_service.get_apis_in_categories(app_id, [category_id])
+    else:
+        apis = await api_service.get_apis_by_category(app_id, category_id)
+
+    names = [api.name for api in apis]
+    if name_filter:
+        needle = name_filter.lower()
+        names = [name for name in names if needle in name.lower()]
+
+    details = {
+        api.name: api
+        for api in await api_service.get_api_details(app_id, names[:max_apis])
+    }
+
+    returned = []
+    size = 0
+    for name in names[:max_apis]:
+        detail = details.get(name)
+        if detail is None:
+            continue
+        size += len(json.dumps(detail.model_dump(), ensure_ascii=False, default=str))
+        if returned and size > max_bytes:
+            break
+        returned.append(detail)
 
-    return APIDetailsResponse(apis=apis)
+    included = {api.name for api in returned}
+    omitted = [name for name in names if name not in included]
+    return CategoryDescriptionResponse(
+        category_id=category_id,
+        total_apis=len(names),
+        apis=returned,
+        omitted_apis=omitted,
+        truncated=bool(omitted)
+    )
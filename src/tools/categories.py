@@ -1,24 +1,29 @@
 """Categories tool"""
+from typing import Optional
 from ..models import CategoriesResponse
 from ..services import CategoryService
 
 
 async def get_categories_tool(
     app_id: str,
-    category_service: CategoryService
+    category_service: CategoryService,
+    parent_id: Optional[str] = None,
+    depth: Optional[int] = None
 ) -> CategoriesResponse:
     """
-    Get all API categories for the current session
+    Get API categories for the current session
 
     Args:
         app_id: Application identifier
         category_service: Category service instance
+        parent_id: Only return categories below this one
+        depth: Levels to return (1 = direct children only)
 
     Returns:
         List of categories
     """
 
     # Get categories
-    categories = await category_service.get_categories(app_id)
+    categories = await category_service.get_categories(app_id, parent_id, depth)
 
     return CategoriesResponse(categories=categories)
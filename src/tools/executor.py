@@ -1,13 +1,15 @@
 """API execution tool"""
-from typing import List
-from ..models import ExecutionRequest, ExecutionResponse
+from typing import List, Optional
+from ..models import ExecutionRequest, ExecutionResponse, SweepRequest, SweepResponse
 from ..services import ExecutionService
+from ..services.execution_service import ResultCallback
 
 
 async def execute_apis_tool(
     app_id: str,
     execution_service: ExecutionService,
-    executions: List[ExecutionRequest]
+    executions: List[ExecutionRequest],
+    on_result: Optional[ResultCallback] = None
 ) -> ExecutionResponse:
     """
     Execute multiple API calls
@@ -16,10 +18,34 @@ async def execute_apis_tool(
         app_id: Application identifier
         execution_service: Execution service instance
         executions: List of API execution requests
+        on_result: Optional callback receiving each result as soon as it finishes
 
     Returns:
         Execution results for all APIs
     """
-    results = await execution_service.execute_apis(app_id, executions)
+    results = await execution_service.execute_apis(
+        app_id, executions, on_result=on_result
+    )
 
     return ExecutionResponse(results=results)
+
+
+async def execute_api_sweep_tool(
+    app_id: str,
+    execution_service: ExecutionService,
+    sweep: SweepRequest
+) -> SweepResponse:
+    """
+    Call one API over many parameter sets
+
+    Args:
+        app_id: Application identifier
+        execution_service: Execution service instance
+        sweep: Sweep request
+
+    Returns:
+        Columnar per-row results with an error mask
+    """
+    result = await execution_service.execute_sweep(app_id, sweep)
+
+    return SweepResponse(result=result)
@@ -0,0 +1,56 @@
+"""Asynchronous job tools"""
+import logging
+from typing import List, Optional
+from ..models import ExecutionRequest, JobKind, JobResponse, JobStatus
+from ..services import JobService
+
+logger = logging.getLogger(__name__)
+
+
+async def submit_job_tool(
+    app_id: str,
+    job_service: JobService,
+    kind: JobKind,
+    executions: Optional[List[ExecutionRequest]],
+    db_name: Optional[str],
+    sql: Optional[str],
+    wait_seconds: float
+) -> JobResponse:
+    """
+    Submit a long-running execute_apis batch or SQL query as a job
+
+    Args:
+        app_id: Application identifier
+        job_service: Job service instance
+        kind: "execute_apis" or "execute_sql"
+        executions: Execution requests (for execute_apis)
+        db_name: Database name (for execute_sql)
+        sql: SQL query (for execute_sql)
+        wait_seconds: How long to wait before returning partial results
+
+    Returns:
+        Job status with final or partial results
+    """
+    if kind == "execute_apis":
+        if not executions:
+            raise ValueError("executions is required for execute_apis jobs")
+        return await job_service.submit_execute_apis(app_id, executions, wait_seconds)
+
+    if kind == "execute_sql":
+        if not db_name:
+            raise ValueError("dbName not configured in request headers")
+        if not sql or not sql.strip():
+            raise ValueError("SQL query is empty")
+        return await job_service.submit_execute_sql(app_id, db_name, sql, wait_seconds)
+
+    raise ValueError(f"Unknown job kind: {kind} (expected execute_apis or execute_sql)")
+
+
+async def get_job_status_tool(app_id: str, job_service: JobService, job_id: str) -> JobStatus:
+    """Get status and progress of a job submitted by app_id"""
+    return job_service.get_status(app_id, job_id)
+
+
+async def get_job_result_tool(app_id: str, job_service: JobService, job_id: str) -> JobResponse:
+    """Get the result of a job submitted by app_id, or the results finished so far"""
+    return job_service.get_result(app_id, job_id)
@@ -0,0 +1,31 @@
+"""Result paging tools"""
+from typing import Optional
+from ..cache import ResultStore
+from ..models import ResultPageResponse
+
+
+async def fetch_result_page_tool(
+    app_id: str,
+    result_store: ResultStore,
+    cursor: str,
+    page_size: Optional[int] = None
+) -> ResultPageResponse:
+    """
+    Read the next slice of a large result stored server-side
+
+    Args:
+        app_id: Application identifier
+        result_store: Result store instance
+        cursor: Cursor from a previous page (page.next_cursor)
+        page_size: Rows per page (None = configured default; at least 1)
+
+    Returns:
+        Rows of the page plus paging information
+
+    Raises:
+        ValueError: If page_size is less than 1
+    """
+    if page_size is not None and page_size < 1:
+        raise ValueError(f"page_size must be at least 1, got {page_size}")
+    rows, page = await result_store.get_page(app_id, cursor, page_size)
+    return ResultPageResponse(rows=rows, page=page)
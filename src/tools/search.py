@@ -0,0 +1,27 @@
+"""Search tools"""
+from ..models import APISearchResponse
+from ..services import APIService
+
+
+async def search_apis_tool(
+    app_id: str,
+    api_service: APIService,
+    query: str,
+    limit: int = 10
+) -> APISearchResponse:
+    """
+    Find APIs by keywords in their names, descriptions, category paths and parameters
+
+    Args:
+        app_id: Application identifier
+        api_service: API service instance
+        query: Free-text query
+        limit: Maximum number of hits
+
+    Returns:
+        Ranked matching APIs; partial is set while the catalog is not fully indexed
+    """
+    results = await api_service.search_apis(app_id, query, limit)
+    return APISearchResponse(
+        query=query, results=results, partial=not api_service.is_search_complete(app_id)
+    )
@@ -1,7 +1,9 @@
 """SQL tools"""
 import logging
-from typing import List, Optional
-from ..models import TablesResponse, TableFieldsResponse, SQLExecutionResponse, SQLExecutionResult
+from typing import List, Literal, Optional
+from ..models import (
+    TablesResponse, TableFieldsResponse, SchemaSearchResponse, SQLExecutionResponse, SQLExecutionResult
+)
 from ..services import SQLService
 
 logger = logging.getLogger(__name__)
@@ -40,13 +42,45 @@ async def get_sql_table_fields_tool(
     return TableFieldsResponse(table_fields=table_fields)
 
 
+async def search_sql_schema_tool(
+    app_id: str,
+    sql_service: SQLService,
+    db_name: Optional[str],
+    query: str,
+    limit: int = 10
+) -> SchemaSearchResponse:
+    """
+    Find tables and columns by keywords in their names and comments
+
+    Args:
+        app_id: Application identifier
+        sql_service: SQL service instance
+        db_name: Database name
+        query: Free-text query
+        limit: Maximum number of hits
+
+    Returns:
+        Ranked matching tables and columns
+    """
+    if not db_name:
+        logger.warning("dbName not configured, returning no schema matches")
+        return SchemaSearchResponse(query=query, database_name=None, results=[])
+
+    results = await sql_service.search_schema(app_id, db_name, query, limit)
+    return SchemaSearchResponse(query=query, database_name=db_name, results=results)
+
+
 async def execute_sql_tool(
     app_id: str,
     sql_service: SQLService,
     db_name: Optional[str],
-    sql: str
+    sql: str,
+    fields: Optional[List[str]] = None,
+    continuation_token: Optional[str] = None,
+    format: Literal["rows", "columnar"] = "rows",
+    summarize: bool = False
 ) -> SQLExecutionResponse:
-    """Execute arbitrary SQL query"""
+    """Execute arbitrary SQL query, or continue a truncated one"""
     if not db_name:
         return SQLExecutionResponse(
             result=SQLExecutionResult(
@@ -55,7 +89,7 @@ async def execute_sql_tool(
             )
         )
 
-    if not sql or not sql.strip():
+    if (not sql or not sql.strip()) and not continuation_token:
         return SQLExecutionResponse(
             result=SQLExecutionResult(
                 success=False,
@@ -63,5 +97,7 @@ async def execute_sql_tool(
             )
         )
 
-    result = await sql_service.execute_sql(app_id, db_name, sql)
+    result = await sql_service.execute_sql(
+        app_id, db_name, sql, fields, continuation_token, format=format, summarize=summarize
+    )
     return SQLExecutionResponse(result=result)
@@ -0,0 +1,136 @@
+"""
+Offline analysis of the access log written by AccessRecorder
+
+Reads the JSON Lines access log and suggests cache TTLs per key prefix and
+prefetch settings from the observed tool-call sequences.
+
+Run from the repository root:
+    python -m src.utils.access_log_analyzer logs/access.jsonl [--top 20]
+"""
+import argparse
+import json
+import statistics
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional
+
+MIN_TTL = 60
+MAX_TTL = 24 * 3600
+
+
+def read_log(paths: Iterable[str]) -> List[dict]:
+    """Read log records from one or more files, skipping malformed lines"""
+    records = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+    records.sort(key=lambda record: record.get("t", 0))
+    return records
+
+
+def percentile(values: List[float], fraction: float) -> Optional[float]:
+    """Nearest-rank percentile"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def analyze_keys(records: List[dict], top: int) -> dict:
+    """
+    Per-prefix hit rate, reuse intervals and TTL suggestions
+
+    The suggested TTL covers 90% of the observed intervals between two
+    accesses of the same key, so most repeated lookups would hit.
+    """
+    last_seen: Dict[str, float] = {}
+    prefixes: Dict[str, dict] = defaultdict(lambda: {"accesses": 0, "hits": 0, "keys": set(), "reuse": []})
+    counts: Counter = Counter()
+
+    for record in records:
+        key = record.get("k")
+        if key is None:
+            continue
+        prefix = key.split(":", 1)[0]
+        stats = prefixes[prefix]
+        stats["accesses"] += 1
+        stats["hits"] += record.get("h", 0)
+        stats["keys"].add(key)
+        counts[key] += 1
+        if key in last_seen:
+            stats["reuse"].append(record["t"] - last_seen[key])
+        last_seen[key] = record["t"]
+
+    result = {}
+    for prefix, stats in sorted(prefixes.items()):
+        p90 = percentile(stats["reuse"], 0.9)
+        result[prefix] = {
+            "accesses": stats["accesses"],
+            "distinct_keys": len(stats["keys"]),
+            "hit_rate": round(stats["hits"] / stats["accesses"], 3),
+            "median_reuse_seconds": round(statistics.median(stats["reuse"]), 1) if stats["reuse"] else None,
+            "p90_reuse_seconds": round(p90, 1) if p90 is not None else None,
+            "suggested_ttl": int(min(MAX_TTL, max(MIN_TTL, p90 * 1.2))) if p90 is not None else None
+        }
+    return {"prefixes": result, "hot_keys": counts.most_common(top)}
+
+
+def analyze_tools(records: List[dict]) -> dict:
+    """
+    Tool-call transitions per session and prefetch suggestions
+
+    Prefetch pays off when get_apis_by_category is usually followed by
+    get_api_details; max_names is set to the typical number of names asked for.
+    """
+    previous: Dict[Optional[str], dict] = {}
+    transitions: Counter = Counter()
+    follow_sizes: List[int] = []
+    listings = 0
+
+    for record in records:
+        tool = record.get("tool")
+        if tool is None:
+            continue
+        session = record.get("s")
+        before = previous.get(session)
+        if before:
+            transitions[(before["tool"], tool)] += 1
+            if before["tool"] == "get_apis_by_category" and tool == "get_api_details":
+                follow_sizes.append(record.get("n") or 1)
+        if tool == "get_apis_by_category":
+            listings += 1
+        previous[session] = record
+
+    follow_rate = len(follow_sizes) / listings if listings else 0.0
+    return {
+        "transitions": [
+            {"from": a, "to": b, "count": n} for (a, b), n in transitions.most_common(15)
+        ],
+        "listing_followed_by_details": round(follow_rate, 3),
+        "suggested_prefetch": {
+            "enabled": follow_rate >= 0.5,
+            "max_names": int(statistics.median(follow_sizes)) if follow_sizes else 0
+        }
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Suggest cache TTLs and prefetch settings from an access log")
+    parser.add_argument("paths", nargs="+", help="Access log file(s), e.g. logs/access.jsonl logs/access.jsonl.1")
+    parser.add_argument("--top", type=int, default=20, help="Number of hot keys to list")
+    args = parser.parse_args()
+
+    records = read_log(args.paths)
+    report = {
+        "records": len(records),
+        "keys": analyze_keys(records, args.top),
+        "tools": analyze_tools(records)
+    }
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
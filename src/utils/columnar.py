@@ -0,0 +1,119 @@
+"""Column-oriented encoding of row results"""
+import math
+from decimal import Decimal, InvalidOperation
+from typing import Any, Dict, List, Optional, Tuple
+from ..models import ColumnarData
+
+# Lower-cased output_json_schema type names by value kind
+_NUMBER_TYPES = {
+    "number", "int", "integer", "long", "bigint", "smallint", "tinyint", "mediumint",
+    "decimal", "numeric", "double", "float", "real"
+}
+_BOOLEAN_TYPES = {"bool", "boolean", "bit(1)"}  # Plain "bit" only if every value is 0 / 1
+
+
+def to_columnar(rows: List[Any], schema: Optional[List[dict]] = None) -> ColumnarData:
+    """
+    Convert rows to column arrays
+
+    Columns come from the output_json_schema items ({"name", "type"}) in
+    schema order, followed by any other keys found in the rows. Values of
+    number and boolean columns are converted to JSON numbers / booleans
+    (the backend may send them as strings); a value that does not convert
+    exactly (e.g. a DECIMAL with more digits than a double holds, NaN or
+    infinity) is kept as it is. Missing keys and nulls are None and set in the column's
+    null mask.
+
+    Args:
+        rows: Result rows (dicts; other rows are ignored)
+        schema: output_json_schema items
+
+    Returns:
+        Columnar data
+    """
+    columns: Dict[str, str] = {}
+    for item in schema or []:
+        if isinstance(item, dict) and item.get("name") is not None:
+            columns.setdefault(str(item["name"]), str(item.get("type") or ""))
+    rows = [row for row in rows if isinstance(row, dict)]
+    for row in rows:
+        for key in row:
+            if key not in columns:
+                columns[key] = ""
+
+    values: List[List[Any]] = []
+    masks: List[Optional[List[bool]]] = []
+    types: List[str] = []
+    for name, declared in columns.items():
+        column = [row.get(name) for row in rows]
+        kind, declared = _column_kind(declared, column)
+        if kind == "number":
+            column = [_to_number(value) for value in column]
+        elif kind == "boolean":
+            column = [_to_boolean(value) for value in column]
+        mask = [value is None for value in column]
+        values.append(column)
+        masks.append(mask if any(mask) else None)
+        types.append(declared)
+
+    return ColumnarData(
+        columns=list(columns), types=types, values=values, null_mask=masks, row_count=len(rows)
+    )
+
+
+def _column_kind(declared: str, column: List[Any]) -> Tuple[str, str]:
+    """Value kind of a column and its type name, inferred from the values if undeclared"""
+    if declared:
+        lowered = declared.lower().replace(" ", "")
+        if lowered in _NUMBER_TYPES:
+            return "number", declared
+        if lowered in _BOOLEAN_TYPES:
+            return "boolean", declared
+        if lowered == "bit" and all(_is_bit_value(value) for value in column):
+            return "boolean", declared
+        return "other", declared
+
+    sample = next((value for value in column if value is not None), None)
+    if isinstance(sample, bool):
+        return "boolean", "Boolean"
+    if isinstance(sample, (int, float)):
+        return "number", "Number"
+    return "other", "String" if isinstance(sample, str) or sample is None else type(sample).__name__
+
+
+def _is_bit_value(value: Any) -> bool:
+    """Whether a value is null or a single bit (0 / 1)"""
+    if isinstance(value, str):
+        return value.strip() in ("0", "1")
+    return value is None or value in (0, 1)
+
+
+def _to_number(value: Any) -> Any:
+    """JSON number of a value, the value itself if it does not convert exactly"""
+    if value is None or isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    text = str(value).strip()
+    try:
+        exact = Decimal(text)
+    except (InvalidOperation, ValueError):
+        return value
+    if not exact.is_finite():
+        return value  # NaN / Infinity have no JSON number
+    if exact == exact.to_integral_value() and "." not in text and "e" not in text.lower():
+        return int(exact)
+    number = float(exact)
+    # Keep DECIMAL text whose digits a double cannot hold
+    if not math.isfinite(number) or Decimal(repr(number)) != exact:
+        return value
+    return number
+
+
+def _to_boolean(value: Any) -> Any:
+    """JSON boolean of a value, the value itself if it does not convert"""
+    if value is None or isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return bool(value)
+    if isinstance(value, str) and value.strip().lower() in ("1", "true", "yes", "0", "false", "no"):
+        return value.strip().lower() in ("1", "true", "yes")
+    return value
@@ -51,11 +51,14 @@ class CategoryNotFoundError(MCPDataAPIError):
 
 class APINotFoundError(MCPDataAPIError):
     """Raised when API is not found"""
-    def __init__(self, api_name: str):
+    def __init__(self, api_name: str, suggestions: list = None):
+        message = f"API not found: {api_name}"
+        if suggestions:
+            message += f". Did you mean: {', '.join(suggestions)}?"
         super().__init__(
             code="API_NOT_FOUND",
-            message=f"API not found: {api_name}",
-            details={"api_name": api_name}
+            message=message,
+            details={"api_name": api_name, "suggestions": suggestions or []}
         )
 
 
@@ -77,3 +80,63 @@ class ParameterValidationError(MCPDataAPIError):
             message=f"Parameter validation failed for {api_name}.{parameter}: {error}",
             details={"api_name": api_name, "parameter": parameter, "error": error}
         )
+
+
+class JobNotFoundError(MCPDataAPIError):
+    """Raised when a job id is unknown or its result has expired"""
+    def __init__(self, job_id: str):
+        super().__init__(
+            code="JOB_NOT_FOUND",
+            message=f"Job not found or expired: {job_id}",
+            details={"job_id": job_id}
+        )
+
+
+class JobQueueFullError(MCPDataAPIError):
+    """Raised when too many jobs are waiting for a worker"""
+    def __init__(self, max_queued: int):
+        super().__init__(
+            code="JOB_QUEUE_FULL",
+            message=f"Too many queued jobs (limit {max_queued}), retry later",
+            details={"max_queued": max_queued}
+        )
+
+
+class ResultNotFoundError(MCPDataAPIError):
+    """Raised when a result cursor is unknown or its stored result has expired"""
+    def __init__(self, cursor: str):
+        super().__init__(
+            code="RESULT_NOT_FOUND",
+            message=f"Result not found or expired for cursor: {cursor}",
+            details={"cursor": cursor}
+        )
+
+
+class ExecutionGraphError(MCPDataAPIError):
+    """Raised when $ref dependencies between executions are invalid"""
+    def __init__(self, error: str):
+        super().__init__(
+            code="EXECUTION_GRAPH_ERROR",
+            message=f"Invalid execution dependencies: {error}",
+            details={"error": error}
+        )
+
+
+class InvalidContinuationTokenError(MCPDataAPIError):
+    """Raised when an execute_sql continuation token cannot be decoded"""
+    def __init__(self, token: str):
+        super().__init__(
+            code="INVALID_CONTINUATION_TOKEN",
+            message=f"Invalid continuation token: {token[:40]}",
+            details={"token": token}
+        )
+
+
+class MissingDependencyError(MCPDataAPIError):
+    """Raised when a feature needs an optional package that is not installed"""
+    def __init__(self, package: str, feature: str):
+        super().__init__(
+            code="MISSING_DEPENDENCY",
+            message=f"{feature} needs the optional package '{package}' (pip install {package})",
+            details={"package": package, "feature": feature}
+        )
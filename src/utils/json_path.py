@@ -0,0 +1,138 @@
+"""Helpers for locating and replacing values inside nested JSON data"""
+import re
+from typing import Any, List, Optional, Tuple, Union
+
+PathToken = Union[str, int]
+
+# Wildcard token matching every element of a list ("rows[*].id")
+WILDCARD = "*"
+
+_TOKEN_PATTERN = re.compile(r"""
+    \.?(?P<key>[^.\[\]]+)           # .key or key
+  | \[(?P<index>-?\d+|\*)\]          # [0] or [*]
+  | \[["'](?P<quoted>[^"']*)["']\]   # ["key with dots"]
+""", re.VERBOSE)
+
+
+def parse_path(path: str) -> List[PathToken]:
+    """
+    Parse a dotted path such as data.rows[0].id or rows[*].name
+
+    Args:
+        path: Path expression
+
+    Returns:
+        Path tokens (str keys, int indexes, or WILDCARD)
+
+    Raises:
+        ValueError: If the path is empty or malformed
+    """
+    tokens: List[PathToken] = []
+    position = 0
+    text = path.strip()
+    while position < len(text):
+        match = _TOKEN_PATTERN.match(text, position)
+        if not match or match.end() == position:
+            raise ValueError(f"Invalid path '{path}' at position {position}")
+        if match.group("key") is not None:
+            tokens.append(match.group("key"))
+        elif match.group("quoted") is not None:
+            tokens.append(match.group("quoted"))
+        else:
+            index = match.group("index")
+            tokens.append(WILDCARD if index == WILDCARD else int(index))
+        position = match.end()
+
+    if not tokens:
+        raise ValueError("Path is empty")
+    return tokens
+
+
+def get_at(data: Any, tokens: List[PathToken]) -> Any:
+    """
+    Get the value at a path; a wildcard collects the rest of the path over a list
+
+    Args:
+        data: JSON-like data
+        tokens: Path tokens
+
+    Returns:
+        Value at the path
+
+    Raises:
+        ValueError: If the path does not exist in data
+    """
+    value = data
+    for position, token in enumerate(tokens):
+        if token == WILDCARD:
+            if not isinstance(value, list):
+                raise ValueError(f"'{format_path(tokens[:position])}' is not a list")
+            rest = tokens[position + 1:]
+            return [get_at(item, rest) for item in value]
+        try:
+            value = value[token]
+        except (KeyError, IndexError, TypeError):
+            raise ValueError(f"'{format_path(tokens[:position + 1])}' not found")
+    return value
+
+
+def format_path(tokens: List[PathToken]) -> str:
+    """Render path tokens as a dotted path, e.g. data.rows[0].id"""
+    text = ""
+    for token in tokens:
+        if isinstance(token, int):
+            text += f"[{token}]"
+        else:
+            text += f".{token}" if text else token
+    return text
+
+
+def find_largest_list(data: Any, max_depth: int = 3) -> Tuple[Optional[List[PathToken]], Optional[list]]:
+    """
+    Find the longest list in nested dicts (lists inside lists are not searched)
+
+    Args:
+        data: JSON-like data
+        max_depth: How many dict levels to descend
+
+    Returns:
+        (path tokens, list), or (None, None) if data holds no list
+    """
+    if isinstance(data, list):
+        return [], data
+
+    best_path, best = None, None
+    stack = [([], data, 0)]
+    while stack:
+        path, node, depth = stack.pop()
+        if not isinstance(node, dict) or depth >= max_depth:
+            continue
+        for key, value in node.items():
+            if isinstance(value, list):
+                if best is None or len(value) > len(best):
+                    best_path, best = path + [key], value
+            elif isinstance(value, dict):
+                stack.append((path + [key], value, depth + 1))
+    return best_path, best
+
+
+def replace_at(data: Any, tokens: List[PathToken], value: Any) -> Any:
+    """
+    Return a copy of data with the value at path replaced
+
+    Only the containers along the path are copied.
+
+    Args:
+        data: JSON-like data
+        tokens: Path tokens
+        value: Replacement value
+
+    Returns:
+        Updated copy of data
+    """
+    if not tokens:
+        return value
+    head, rest = tokens[0], tokens[1:]
+    copy = list(data) if isinstance(data, list) else dict(data)
+    copy[head] = replace_at(data[head], rest, value)
+    return copy
@@ -0,0 +1,40 @@
+"""Lightweight in-process runtime metrics"""
+from bisect import bisect_left
+from typing import List
+
+
+class Histogram:
+    """Fixed-bucket histogram with count, sum and max"""
+
+    def __init__(self, buckets: List[float]):
+        """
+        Initialize histogram
+
+        Args:
+            buckets: Upper bounds of the buckets; an overflow bucket is added automatically
+        """
+        self._bounds = sorted(buckets)
+        self._counts = [0] * (len(self._bounds) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record a single observation"""
+        self._counts[bisect_left(self._bounds, value)] += 1
+        self._count += 1
+        self._sum += value
+        if value > self._max:
+            self._max = value
+
+    def snapshot(self) -> dict:
+        """Get histogram statistics"""
+        buckets = {f"<={bound:g}": count for bound, count in zip(self._bounds, self._counts)}
+        buckets["+Inf"] = self._counts[-1]
+        return {
+            "count": self._count,
+            "sum": round(self._sum, 3),
+            "mean": round(self._sum / self._count, 3) if self._count else 0.0,
+            "max": round(self._max, 3),
+            "buckets": buckets
+        }
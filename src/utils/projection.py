@@ -0,0 +1,138 @@
+"""Server-side projection of result data to a list of field paths"""
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple, Union
+from .json_path import PathToken, WILDCARD, parse_path
+
+_MISSING = object()
+
+
+class _Node:
+    """Trie node of a compiled projection"""
+
+    __slots__ = ("children", "leaf")
+
+    def __init__(self):
+        self.children: Dict[PathToken, "_Node"] = {}
+        self.leaf = False
+
+
+class Projection:
+    """
+    Compiled projection spec
+
+    Paths are merged into a trie so shared prefixes are walked once. The
+    output keeps the shape of the input: dicts keep only the selected keys,
+    lists keep the selected elements. A key step applied to a list maps over
+    its elements, so "rows.id" and "rows[*].id" are equivalent.
+    """
+
+    def __init__(self, paths: Tuple[str, ...]):
+        """
+        Compile projection paths
+
+        Args:
+            paths: Field paths such as "total", "rows[*].id" or "data.items[0].name"
+
+        Raises:
+            ValueError: If a path is malformed
+        """
+        self.paths = paths
+        self._root = _Node()
+        for path in paths:
+            node = self._root
+            for token in parse_path(path):
+                node = node.children.setdefault(token, _Node())
+            node.leaf = True
+
+    def apply(self, data: Any) -> Any:
+        """
+        Project data
+
+        Args:
+            data: JSON-like data
+
+        Returns:
+            Projected copy of data (None if nothing matched)
+        """
+        projected = self._apply(self._root, data)
+        return None if projected is _MISSING else projected
+
+    def _apply(self, node: _Node, value: Any) -> Any:
+        if node.leaf:
+            return value
+
+        if isinstance(value, list):
+            return self._apply_list(node, value)
+
+        if isinstance(value, dict):
+            return self._apply_keys(node, value)
+
+        return _MISSING
+
+    def _apply_keys(self, node: _Node, value: Any) -> Any:
+        if not isinstance(value, dict):
+            return _MISSING
+        out = {}
+        for key, child in node.children.items():
+            if isinstance(key, str) and key != WILDCARD and key in value:
+                projected = self._apply(child, value[key])
+                if projected is not _MISSING:
+                    out[key] = projected
+        return out
+
+    def _apply_list(self, node: _Node, items: list) -> Any:
+        wildcard = node.children.get(WILDCARD)
+        has_keys = any(isinstance(key, str) and key != WILDCARD for key in node.children)
+        indexes = {}
+        for key in node.children:
+            if isinstance(key, int) and -len(items) <= key < len(items):
+                indexes.setdefault(key % len(items), []).append(node.children[key])
+
+        out = []
+        for i, item in enumerate(items):
+            parts = [self._apply(child, item) for child in indexes.get(i, [])]
+            if wildcard is not None:
+                parts.append(self._apply(wildcard, item))
+            if has_keys:
+                # Key steps on a list apply to every element
+                parts.append(self._apply_keys(node, item))
+
+            if wildcard is None and not has_keys and i not in indexes:
+                continue
+            merged = _MISSING
+            for part in parts:
+                merged = _merge(merged, part)
+            out.append(None if merged is _MISSING else merged)
+        return out
+
+
+def _merge(left: Any, right: Any) -> Any:
+    """Merge two projections of the same value"""
+    if left is _MISSING:
+        return right
+    if right is _MISSING:
+        return left
+    if isinstance(left, dict) and isinstance(right, dict):
+        merged = dict(left)
+        for key, value in right.items():
+            merged[key] = _merge(merged[key], value) if key in merged else value
+        return merged
+    return left
+
+
+@lru_cache(maxsize=256)
+def _compile(paths: Tuple[str, ...]) -> Projection:
+    return Projection(paths)
+
+
+def compile_projection(paths: Union[List[str], Tuple[str, ...]]) -> Projection:
+    """
+    Compile projection paths, reusing previously compiled specs
+
+    Args:
+        paths: Field paths
+
+    Returns:
+        Compiled projection
+    """
+    return _compile(tuple(paths))
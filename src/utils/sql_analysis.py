@@ -0,0 +1,369 @@
+"""Helpers for building and inspecting SQL text"""
+import hashlib
+import json
+import re
+from typing import Iterable, List, NamedTuple, Optional
+
+# Token kinds produced by tokenize_sql
+WORD, QUOTED_NAME, STRING, NUMBER, VARIABLE, PUNCT = "word", "name", "string", "number", "variable", "punct"
+EXECUTABLE_COMMENT = "executable"  # /*! ... */, which MySQL runs as part of the statement
+
+_TOKEN = re.compile(
+    r"""
+    (?P<space>\s+)
+    | (?P<executable>/\*!.*?(?:\*/|$))
+    | (?P<comment>--(?=\s|$)[^\n]*|\#[^\n]*|/\*.*?(?:\*/|$))
+    | (?P<string>'(?:[^'\\]|\\.|'')*'|"(?:[^"\\]|\\.|"")*")
+    | (?P<name>`(?:[^`]|``)*`)
+    | (?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?\b|0x[0-9a-fA-F]+)
+    | (?P<variable>@@?[\w.$]+|@`[^`]*`)
+    | (?P<word>[A-Za-z_$\u0080-￿][\w$\u0080-￿]*)
+    | (?P<punct><=>|<=|>=|<>|!=|\|\||&&|:=|\S)
+    """,
+    re.VERBOSE | re.DOTALL
+)
+
+# Statements whose results may be cached
+_READ_ONLY_STARTS = {"SELECT", "WITH", "SHOW", "DESC", "DESCRIBE", "EXPLAIN"}
+
+# Words that make a statement write, lock or export anywhere they appear
+_WRITE_WORDS = {
+    "INSERT", "UPDATE", "DELETE", "MERGE", "CREATE", "ALTER", "DROP", "TRUNCATE",
+    "RENAME", "GRANT", "REVOKE", "LOCK", "UNLOCK", "CALL", "HANDLER", "LOAD", "INTO",
+    "SHARE"
+}
+
+# Statements that change rows; never limited even inside WITH
+_DML_WORDS = {"INSERT", "UPDATE", "DELETE", "REPLACE"}
+
+# SHOW statements reporting server state rather than stored data
+_VOLATILE_SHOW_WORDS = {
+    "PROCESSLIST", "STATUS", "WARNINGS", "ERRORS", "PROFILE", "PROFILES", "ENGINE", "ENGINES",
+    "MASTER", "SLAVE", "REPLICA", "REPLICAS", "BINARY", "OPEN", "GRANTS"
+}
+
+# System tables and schemas whose rows change without any write
+_VOLATILE_TABLES = {
+    "PROCESSLIST", "INNODB_TRX", "INNODB_LOCKS", "INNODB_LOCK_WAITS", "INNODB_METRICS",
+    "GLOBAL_STATUS", "SESSION_STATUS", "GLOBAL_VARIABLES", "SESSION_VARIABLES",
+    "PERFORMANCE_SCHEMA"
+}
+
+# Functions (and niladic keywords) whose value changes between executions
+VOLATILE_FUNCTIONS = {
+    "NOW", "SYSDATE", "CURDATE", "CURTIME", "CURRENT_DATE", "CURRENT_TIME",
+    "CURRENT_TIMESTAMP", "LOCALTIME", "LOCALTIMESTAMP", "UTC_DATE", "UTC_TIME",
+    "UTC_TIMESTAMP", "UNIX_TIMESTAMP", "RAND", "RANDOM", "UUID", "UUID_SHORT",
+    "CONNECTION_ID", "LAST_INSERT_ID", "FOUND_ROWS", "ROW_COUNT", "SLEEP", "GET_LOCK",
+    "RELEASE_LOCK", "IS_FREE_LOCK", "BENCHMARK", "USER", "CURRENT_USER", "SESSION_USER",
+    "SYSTEM_USER"
+}
+
+# Words that make a SELECT read more than one table or row source
+_MULTI_TABLE_WORDS = {
+    "JOIN", "STRAIGHT_JOIN", "NATURAL", "CROSS", "INNER", "LEFT", "RIGHT", "OUTER", "LATERAL",
+    "UNION", "INTERSECT", "EXCEPT", "GROUP", "HAVING", "DISTINCT", "WINDOW"
+}
+
+# Keywords folded to upper case by fingerprint(); identifiers keep their case
+_KEYWORDS = {
+    "SELECT", "DISTINCT", "FROM", "WHERE", "AND", "OR", "NOT", "IN", "IS", "NULL", "AS",
+    "ON", "JOIN", "INNER", "LEFT", "RIGHT", "OUTER", "CROSS", "NATURAL", "USING", "GROUP",
+    "BY", "ORDER", "ASC", "DESC", "HAVING", "LIMIT", "OFFSET", "UNION", "ALL", "EXISTS",
+    "BETWEEN", "LIKE", "REGEXP", "CASE", "WHEN", "THEN", "ELSE", "END", "WITH", "RECURSIVE",
+    "OVER", "PARTITION", "ROWS", "RANGE", "TRUE", "FALSE", "INTERVAL", "DIV", "MOD", "XOR",
+    "COUNT", "SUM", "AVG", "MIN", "MAX", "CAST", "CONVERT", "IF", "IFNULL", "COALESCE",
+    "SHOW", "TABLES", "COLUMNS", "DESCRIBE", "EXPLAIN"
+}
+
+
+# Identifiers that need no quoting
+_PLAIN_NAME = re.compile(r"[A-Za-z_$\u0080-\uffff][\w$\u0080-\uffff]*")
+
+
+class SQLToken(NamedTuple):
+    """Lexical token of a SQL statement"""
+    kind: str
+    text: str
+
+
+class SelectShape(NamedTuple):
+    """Top-level structure of a SELECT statement, as far as row limiting needs it"""
+    body: str  # Statement without trailing semicolons and comments
+    has_limit: bool  # Top-level LIMIT present
+    has_order_by: bool  # Top-level ORDER BY present
+    table: Optional[str]  # The only table read (None for joins, subqueries, unions, grouping)
+    select_list: List[SQLToken]  # Tokens between SELECT and the top-level FROM
+
+
+class SQLFingerprint(NamedTuple):
+    """Normalized form of a statement"""
+    template: str  # Statement with literals replaced by ?
+    key: str  # Digest of the template and the literal values
+
+
+def tokenize_sql(sql: str) -> List[SQLToken]:
+    """
+    Split a statement into tokens, dropping whitespace and comments
+
+    "--" only starts a comment when followed by whitespace, and executable
+    /*! ... */ comments are returned as EXECUTABLE_COMMENT tokens, as MySQL
+    reads them.
+
+    Args:
+        sql: SQL text
+
+    Returns:
+        Tokens in statement order
+    """
+    tokens = []
+    for match in _TOKEN.finditer(sql):
+        kind = match.lastgroup
+        if kind in ("space", "comment"):
+            continue
+        tokens.append(SQLToken(kind, match.group()))
+    return tokens
+
+
+def strip_terminator(tokens: List[SQLToken]) -> List[SQLToken]:
+    """Tokens without trailing semicolons"""
+    end = len(tokens)
+    while end and tokens[end - 1] == (PUNCT, ";"):
+        end -= 1
+    return tokens[:end]
+
+
+def is_cacheable_read(sql: str) -> bool:
+    """
+    Whether a statement is a single deterministic read
+
+    Rejects multi-statement text, anything that is not SELECT / WITH / SHOW /
+    DESCRIBE / EXPLAIN, data or schema changes, locking reads, SELECT ... INTO,
+    variables, volatile functions such as NOW() and RAND(), server state
+    (SHOW PROCESSLIST / STATUS, information_schema.processlist, ...) and
+    executable /*! ... */ comments.
+
+    Args:
+        sql: SQL text
+
+    Returns:
+        True if the result only depends on the data it reads
+    """
+    tokens = strip_terminator(tokenize_sql(sql))
+    if not tokens or tokens[0].kind != WORD or tokens[0].text.upper() not in _READ_ONLY_STARTS:
+        return False
+    show = tokens[0].text.upper() == "SHOW"
+    for token in tokens:
+        if token.kind in (VARIABLE, EXECUTABLE_COMMENT) or token == (PUNCT, ";"):
+            return False
+        if token.kind == QUOTED_NAME and token.text[1:-1].upper() in _VOLATILE_TABLES:
+            return False
+        if token.kind == WORD:
+            word = token.text.upper()
+            if word in _WRITE_WORDS or word in VOLATILE_FUNCTIONS or word in _VOLATILE_TABLES:
+                return False
+            if show and word in _VOLATILE_SHOW_WORDS:
+                return False
+    return True
+
+
+def fingerprint(sql: str) -> SQLFingerprint:
+    """
+    Normalize a statement into a cache key
+
+    Whitespace and comments are dropped (executable /*! */ comments are
+    kept verbatim), keywords are upper-cased and literals are replaced by ?
+    in the template. Backticks are dropped only around plain identifiers,
+    so `orders` matches orders while `a b` never reads like the column a
+    aliased as b. The
+    literal values are part of the key, so statements that only differ in
+    formatting share a key while different values never do.
+
+    Args:
+        sql: SQL text
+
+    Returns:
+        Template and key
+    """
+    parts: List[str] = []
+    literals: List[str] = []
+    for kind, text in strip_terminator(tokenize_sql(sql)):
+        if kind == STRING:
+            parts.append("?")
+            literals.append("s:" + _unquote(text))
+        elif kind == NUMBER:
+            parts.append("?")
+            literals.append("n:" + text.lower())
+        elif kind == QUOTED_NAME:
+            parts.append(_normalize_quoted_name(text))
+        elif kind == WORD and text.upper() in _KEYWORDS:
+            parts.append(text.upper())
+        else:
+            parts.append(text)
+    template = " ".join(parts)
+    digest = hashlib.sha256(
+        json.dumps([template, literals], ensure_ascii=False).encode("utf-8")
+    ).hexdigest()
+    return SQLFingerprint(template, digest[:32])
+
+
+def _normalize_quoted_name(text: str) -> str:
+    """A backtick-quoted name without its quotes if it reads the same unquoted"""
+    name = text[1:-1]
+    match = _PLAIN_NAME.fullmatch(name)
+    if match and name.upper() not in _KEYWORDS:
+        return name
+    return text
+
+
+def analyze_select(sql: str) -> Optional[SelectShape]:
+    """
+    Inspect the top level of a SELECT statement
+
+    Args:
+        sql: SQL text
+
+    Returns:
+        Shape of the statement, None if it is not a single SELECT / WITH
+        statement whose rows can be limited (e.g. SELECT ... INTO, FOR UPDATE,
+        WITH ... UPDATE / DELETE)
+    """
+    matches = [m for m in _TOKEN.finditer(sql) if m.lastgroup not in ("space", "comment")]
+    while matches and matches[-1].group() == ";":
+        matches.pop()
+    if not matches:
+        return None
+    tokens = [SQLToken(m.lastgroup, m.group()) for m in matches]
+    if any(token.kind == EXECUTABLE_COMMENT for token in tokens):
+        return None  # Its contents may hold a LIMIT or INTO
+    first = tokens[0].text.upper() if tokens[0].kind == WORD else ""
+    if first == "WITH" and _statement_after_ctes(tokens) != "SELECT":
+        return None  # WITH ... UPDATE / DELETE
+    if first not in ("SELECT", "WITH"):
+        return None
+
+    depth = 0
+    has_limit = has_order_by = False
+    single_table = first == "SELECT"
+    from_index: Optional[int] = None
+    for index, token in enumerate(tokens):
+        if token.kind == PUNCT:
+            if token.text == "(":
+                depth += 1
+            elif token.text == ")":
+                depth -= 1
+            elif token.text == ";":
+                return None
+            elif token.text == "," and from_index is not None and depth == 0:
+                single_table = False  # FROM a, b
+            continue
+        if token.kind != WORD or depth:
+            continue
+        word = token.text.upper()
+        if word in ("INTO", "LOCK") or (word == "FOR" and from_index is not None):
+            return None
+        following = tokens[index + 1] if index + 1 < len(tokens) else None
+        if word in _DML_WORDS and following != (PUNCT, "("):  # not the REPLACE() / INSERT() functions
+            return None
+        if word == "LIMIT":
+            has_limit = True
+        elif word == "ORDER":
+            has_order_by = True
+        elif word == "FROM" and from_index is None:
+            from_index = index
+        elif word in _MULTI_TABLE_WORDS:
+            single_table = False
+
+    table = None
+    if single_table and from_index is not None and from_index + 1 < len(tokens):
+        name = tokens[from_index + 1]
+        rest = tokens[from_index + 2:from_index + 3]
+        # A plain table name, not a subquery or schema-qualified name
+        if name.kind in (WORD, QUOTED_NAME) and rest != [SQLToken(PUNCT, ".")]:
+            table = name.text[1:-1].replace("``", "`") if name.kind == QUOTED_NAME else name.text
+
+    return SelectShape(
+        body=sql[matches[0].start():matches[-1].end()],
+        has_limit=has_limit,
+        has_order_by=has_order_by,
+        table=table,
+        select_list=tokens[1:from_index] if from_index is not None else tokens[1:]
+    )
+
+
+def _statement_after_ctes(tokens: List[SQLToken]) -> str:
+    """Upper-cased first word after the CTE list of a WITH statement ("" if malformed)"""
+    index = 1
+    if index < len(tokens) and tokens[index].text.upper() == "RECURSIVE":
+        index += 1
+    while index < len(tokens):
+        index += 1  # CTE name
+        if index < len(tokens) and tokens[index] == (PUNCT, "("):
+            index = _skip_parens(tokens, index)  # Column list
+        if index >= len(tokens) or tokens[index].text.upper() != "AS":
+            return ""
+        index += 1
+        if index >= len(tokens) or tokens[index] != (PUNCT, "("):
+            return ""
+        index = _skip_parens(tokens, index)
+        if index < len(tokens) and tokens[index] == (PUNCT, ","):
+            index += 1
+            continue
+        break
+    if index < len(tokens) and tokens[index].kind == WORD:
+        return tokens[index].text.upper()
+    return ""
+
+
+def _skip_parens(tokens: List[SQLToken], index: int) -> int:
+    """Index after the parenthesized group opening at index"""
+    depth = 0
+    for position in range(index, len(tokens)):
+        if tokens[position] == (PUNCT, "("):
+            depth += 1
+        elif tokens[position] == (PUNCT, ")"):
+            depth -= 1
+            if depth == 0:
+                return position + 1
+    return len(tokens)
+
+
+def quote_identifier(name: str) -> str:
+    """Quote a MySQL identifier with backticks"""
+    return "`" + name.replace("`", "``") + "`"
+
+
+def _unquote(literal: str) -> str:
+    """Value of a quoted string literal"""
+    quote = literal[0]
+    body = literal[1:-1].replace(quote * 2, quote)
+    return re.sub(r"\\(.)", lambda m: {"n": "\n", "r": "\r", "t": "\t", "0": "\0"}.get(m.group(1), m.group(1)), body)
+
+
+def quote_literal(value: str) -> str:
+    """
+    Quote a value as a MySQL string literal
+
+    Backslashes, quotes and control characters are escaped, so the result
+    can be embedded in a statement without changing its structure.
+
+    Args:
+        value: Raw string value
+
+    Returns:
+        Quoted literal including the surrounding single quotes
+    """
+    escaped = (
+        value.replace("\\", "\\\\")
+        .replace("'", "''")
+        .replace("\0", "\\0")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+        .replace("\x1a", "\\Z")
+    )
+    return f"'{escaped}'"
+
+
+def literal_list(values: Iterable[str]) -> str:
+    """Comma-separated quoted literals for an IN (...) list"""
+    return ", ".join(quote_literal(value) for value in values)
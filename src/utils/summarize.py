@@ -0,0 +1,163 @@
+"""
+Server-side summaries of row results
+
+Needs NumPy, an optional dependency (pip install "mcp-data-api[summarize]");
+it is imported on first use so the server runs without it.
+"""
+import json
+import logging
+from typing import Any, List, Optional
+from ..models import ColumnSummary, Histogram, ResultSummary, ValueCount
+from .columnar import to_columnar
+from .errors import MissingDependencyError
+
+logger = logging.getLogger(__name__)
+
+# Integers beyond int64 are kept as Python ints in object arrays
+_INT64_MIN, _INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+
+def _import_numpy():
+    """Import NumPy on first use"""
+    try:
+        import numpy
+    except ImportError:
+        raise MissingDependencyError("numpy", "summarize")
+    return numpy
+
+
+class ResultSummarizer:
+    """
+    Computes per-column statistics of a result with NumPy
+
+    Every column gets its null count, distinct count and most frequent
+    values; numeric columns also get min / max / sum / mean / std,
+    quartiles and an equal-width histogram. Integer columns (e.g. 19-digit
+    IDs) are counted, compared and summed exactly rather than as float64.
+    """
+
+    def __init__(self, top_k: int = 5, histogram_bins: int = 10):
+        """
+        Initialize summarizer
+
+        Args:
+            top_k: Most frequent values listed per column
+            histogram_bins: Bins of numeric column histograms
+        """
+        self._top_k = top_k
+        self._histogram_bins = histogram_bins
+
+    def summarize(self, rows: List[Any], schema: Optional[List[dict]] = None) -> ResultSummary:
+        """
+        Summarize result rows
+
+        Args:
+            rows: Result rows (dicts; other rows are ignored)
+            schema: Optional output_json_schema items typing the columns
+
+        Returns:
+            Result summary
+
+        Raises:
+            MissingDependencyError: If NumPy is not installed
+        """
+        np = _import_numpy()
+        columnar = to_columnar(rows, schema)
+        columns = [
+            self._summarize_column(np, name, values)
+            for name, values in zip(columnar.columns, columnar.values)
+        ]
+        return ResultSummary(row_count=columnar.row_count, columns=columns)
+
+    def _summarize_column(self, np, name: str, values: List[Any]) -> ColumnSummary:
+        """Statistics of one column"""
+        present = [value for value in values if value is not None]
+        kind = _value_kind(present)
+
+        integral = kind == "number" and all(isinstance(value, int) for value in present)
+        if kind == "number":
+            array = _integer_array(np, present) if integral else np.asarray(present, dtype=np.float64)
+            distinct, counts = np.unique(array, return_counts=True)
+            labels = [_number(value, integral) for value in distinct]
+        else:
+            # Compare non-scalar values by their JSON text
+            keys = np.asarray([
+                value if isinstance(value, str)
+                else json.dumps(value, ensure_ascii=False, sort_keys=True, default=str)
+                for value in present
+            ], dtype=object)
+            distinct, first, counts = np.unique(keys, return_index=True, return_counts=True)
+            labels = [present[index] for index in first]
+
+        summary = ColumnSummary(
+            name=name,
+            type=kind,
+            count=len(present),
+            null_count=len(values) - len(present),
+            distinct_count=len(distinct),
+            top_values=[
+                ValueCount(value=labels[index], count=int(counts[index]))
+                for index in np.argsort(-counts, kind="stable")[:self._top_k]
+            ]
+        )
+        if kind == "number" and present:
+            self._add_numeric_stats(np, summary, array, integral)
+        return summary
+
+    def _add_numeric_stats(self, np, summary: ColumnSummary, array, integral: bool) -> None:
+        """Vectorized statistics of a numeric column"""
+        summary.min = _number(array.min(), integral)
+        summary.max = _number(array.max(), integral)
+        if integral:
+            # Spread statistics are taken on offsets from the minimum, which float64
+            # holds exactly even when the values themselves do not fit
+            summary.sum = int(array.astype(object).sum())
+            summary.mean = summary.sum / len(array)
+            origin = summary.min
+            values = (array.astype(object) - origin).astype(np.float64)
+        else:
+            summary.sum = float(array.sum())
+            summary.mean = float(array.mean())
+            origin, values = 0.0, array
+        summary.std = float(values.std())
+
+        try:
+            p25, p50, p75 = np.quantile(values, [0.25, 0.5, 0.75])
+            summary.quantiles = {
+                "p25": origin + float(p25), "p50": origin + float(p50), "p75": origin + float(p75)
+            }
+        except (ValueError, ArithmeticError) as e:
+            logger.debug(f"No quantiles for column {summary.name}: {e}")
+        try:
+            bins = max(1, min(self._histogram_bins, summary.distinct_count))
+            counts, edges = np.histogram(values, bins=bins)
+            summary.histogram = Histogram(
+                edges=[origin + float(edge) for edge in edges], counts=[int(count) for count in counts]
+            )
+        except (ValueError, ArithmeticError) as e:
+            logger.debug(f"No histogram for column {summary.name}: {e}")
+
+
+def _integer_array(np, values: List[int]):
+    """int64 array of integers, an object array of Python ints if any exceeds int64"""
+    if all(_INT64_MIN <= value <= _INT64_MAX for value in values):
+        return np.asarray(values, dtype=np.int64)
+    return np.asarray(values, dtype=object)
+
+
+def _value_kind(values: List[Any]) -> str:
+    """number, boolean, string or mixed"""
+    if not values:
+        return "string"
+    if all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in values):
+        return "number"
+    if all(isinstance(value, bool) for value in values):
+        return "boolean"
+    if all(isinstance(value, str) for value in values):
+        return "string"
+    return "mixed"
+
+
+def _number(value: Any, integral: bool) -> Any:
+    """NumPy scalar as a JSON number, an int for integral columns"""
+    return int(value) if integral else float(value)
@@ -0,0 +1,172 @@
+"""Small in-process BM25 full-text index with n-gram tokenization for CJK text"""
+import math
+import re
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+# CJK ideographs are split into character n-grams, latin/digit runs are kept as words
+_TOKEN_RUN = re.compile(r"[㐀-䶿一-鿿豈-﫿]+|[a-z0-9]+")
+
+
+def tokenize(text: str, ngram_size: int = 2) -> List[str]:
+    """
+    Tokenize text for indexing and querying
+
+    Chinese has no word boundaries, so runs of CJK characters become
+    overlapping character n-grams ("开户行" -> "开户", "户行"). Latin letters
+    and digits are split on everything else, so get_user_info becomes
+    get, user, info.
+
+    Args:
+        text: Text to tokenize
+        ngram_size: Character n-gram size for CJK runs
+
+    Returns:
+        Tokens in text order
+    """
+    tokens: List[str] = []
+    for run in _TOKEN_RUN.findall(text.lower()):
+        if run.isascii() or len(run) <= ngram_size:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i:i + ngram_size] for i in range(len(run) - ngram_size + 1))
+    return tokens
+
+
+class BM25Index:
+    """
+    Inverted index over multi-field documents ranked with BM25
+
+    Term frequencies are weighted per field (a match in a name counts more
+    than one in a description). Documents can be added, replaced and removed
+    at any time; re-adding identical fields is a no-op.
+    """
+
+    def __init__(
+        self,
+        field_weights: Dict[str, float],
+        k1: float = 1.2,
+        b: float = 0.75,
+        ngram_size: int = 2
+    ):
+        """
+        Initialize index
+
+        Args:
+            field_weights: Field name -> weight of its term frequencies
+            k1: BM25 term frequency saturation
+            b: BM25 document length normalization
+            ngram_size: Character n-gram size for CJK text
+        """
+        self._field_weights = field_weights
+        self._k1 = k1
+        self._b = b
+        self._ngram_size = ngram_size
+
+        self._fields: Dict[str, Dict[str, str]] = {}
+        self._payloads: Dict[str, Any] = {}
+        self._terms: Dict[str, Dict[str, float]] = {}
+        self._lengths: Dict[str, float] = {}
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._total_length = 0.0
+
+    def upsert(self, doc_id: str, fields: Dict[str, str], payload: Any = None) -> bool:
+        """
+        Add or replace a document
+
+        Args:
+            doc_id: Document identifier
+            fields: Field name -> text (unknown fields get weight 1)
+            payload: Arbitrary data returned with search hits
+
+        Returns:
+            True if the index changed
+        """
+        self._payloads[doc_id] = payload
+        if self._fields.get(doc_id) == fields:
+            return False
+
+        self.remove(doc_id, keep_payload=True)
+        terms: Dict[str, float] = {}
+        for field, text in fields.items():
+            weight = self._field_weights.get(field, 1.0)
+            for token in tokenize(text or "", self._ngram_size):
+                terms[token] = terms.get(token, 0.0) + weight
+
+        self._fields[doc_id] = dict(fields)
+        self._terms[doc_id] = terms
+        length = sum(terms.values())
+        self._lengths[doc_id] = length
+        self._total_length += length
+        for term, frequency in terms.items():
+            self._postings.setdefault(term, {})[doc_id] = frequency
+        return True
+
+    def remove(self, doc_id: str, keep_payload: bool = False) -> None:
+        """
+        Remove a document if present
+
+        Args:
+            doc_id: Document identifier
+            keep_payload: Keep the stored payload (used when replacing)
+        """
+        terms = self._terms.pop(doc_id, None)
+        if not keep_payload:
+            self._payloads.pop(doc_id, None)
+        if terms is None:
+            return
+        self._fields.pop(doc_id, None)
+        self._total_length -= self._lengths.pop(doc_id, 0.0)
+        for term in terms:
+            posting = self._postings.get(term)
+            if posting is None:
+                continue
+            posting.pop(doc_id, None)
+            if not posting:
+                del self._postings[term]
+
+    def get_fields(self, doc_id: str) -> Optional[Dict[str, str]]:
+        """Get the indexed fields of a document"""
+        return self._fields.get(doc_id)
+
+    def get_payload(self, doc_id: str) -> Any:
+        """Get the payload stored with a document"""
+        return self._payloads.get(doc_id)
+
+    def doc_ids(self) -> List[str]:
+        """Identifiers of all indexed documents"""
+        return list(self._terms)
+
+    def search(self, query: str, limit: int = 10) -> List[Tuple[str, float]]:
+        """
+        Rank documents against a query
+
+        Args:
+            query: Free-text query
+            limit: Maximum number of hits
+
+        Returns:
+            (doc_id, score) pairs, best first
+        """
+        count = len(self._terms)
+        if not count:
+            return []
+        average_length = self._total_length / count or 1.0
+
+        scores: Dict[str, float] = {}
+        for term, query_frequency in Counter(tokenize(query, self._ngram_size)).items():
+            posting = self._postings.get(term)
+            if not posting:
+                continue
+            idf = math.log(1 + (count - len(posting) + 0.5) / (len(posting) + 0.5))
+            for doc_id, frequency in posting.items():
+                norm = self._k1 * (1 - self._b + self._b * self._lengths[doc_id] / average_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + query_frequency * idf * (
+                    frequency * (self._k1 + 1) / (frequency + norm)
+                )
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return ranked[:limit]
+
+    def __len__(self) -> int:
+        return len(self._terms)
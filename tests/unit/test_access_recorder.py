@@ -0,0 +1,41 @@
+"""
+Unit tests for access recording and refresh-ahead
+"""
+import pytest
+from src.cache import AccessRecorder, CountMinSketch, MemoryCache, RecordingCache
+from src.services import RefreshAheadScheduler
+
+
+class TestAccessRecorder:
+    """Test cases for the decaying sketch and the refresh-ahead scheduler"""
+
+    def test_sketch_decay(self):
+        """Estimates never undercount and halve on decay"""
+        sketch = CountMinSketch(width=64, depth=3)
+        for _ in range(10):
+            sketch.add("hot")
+        sketch.add("cold")
+        assert sketch.estimate("hot") >= 10
+        sketch.decay()
+        assert 5 <= sketch.estimate("hot") < 10
+
+    @pytest.mark.asyncio
+    async def test_refreshes_hot_keys_about_to_expire(self):
+        """Only hot keys within the lead time are reloaded, batched per app"""
+        recorder = AccessRecorder(top_k=10)
+        cache = RecordingCache(MemoryCache(), recorder)
+        await cache.set("api_detail:app:a", 1, ttl=30)
+        await cache.set("api_detail:app:b", 1, ttl=30)
+        await cache.set("api_detail:app:c", 1, ttl=3600)
+        for key in ("api_detail:app:a", "api_detail:app:b", "api_detail:app:c"):
+            await cache.get(key)
+
+        calls = []
+
+        async def refresh_details(app_id, names):
+            calls.append((app_id, sorted(names)))
+
+        scheduler = RefreshAheadScheduler(cache, recorder, qps=100, lead_time=60)
+        scheduler.register("api_detail", refresh_details, batch=True)
+        assert await scheduler.run_once() == 2
+        assert calls == [("app", ["a", "b"])]
@@ -0,0 +1,99 @@
+"""
+Unit tests for APIService multi-category listings
+"""
+import logging
+import pytest
+from pydantic import ValidationError
+from src.cache import MemoryCache
+from src.config import BackendSettings
+from src.data_access import MockDataProvider
+from src.models import APIBasic
+from src.services import APINameIndex, APISearchIndex, APIService, CategoryService
+from src.utils.errors import CategoryNotFoundError
+
+
+class NestedProvider(MockDataProvider):
+    """Mock provider with a nested category tree; api_shared is in two categories"""
+
+    LISTINGS = {
+        "1": ["api_credit"], "2": ["api_limit", "api_shared"], "4": ["api_quota"],
+        "3": ["api_loan", "api_shared"], "5": ["api_fund"],
+    }
+
+    def __init__(self):
+        super().__init__()
+        self.listed = []
+
+    async def get_category_tree(self, app_id):
+        return [
+            {"id": 1, "name": "credit", "children": [
+                {"id": 2, "name": "limit", "children": [{"id": 4, "name": "quota"}]},
+                {"id": 3, "name": "loan", "children": None},
+            ]},
+            {"id": 5, "name": "fund", "children": []},
+        ]
+
+    async def get_apis_by_category(self, app_id, category_id):
+        self.listed.append(category_id)
+        return [APIBasic(name=name, category_id=category_id) for name in self.LISTINGS[category_id]]
+
+
+class TestAPIServiceListings:
+    """Test cases for get_apis_in_categories"""
+
+    @pytest.fixture
+    def provider(self):
+        return NestedProvider()
+
+    @pytest.mark.asyncio
+    async def test_subtree_expanded_and_deduplicated(self, provider):
+        """A recursive listing covers every descendant and returns each API once"""
+        cache = MemoryCache()
+        service = APIService(provider, cache, category_service=CategoryService(provider, cache))
+
+        apis = await service.get_apis_in_categories("app", ["1", "2"])
+        assert [api.name for api in apis] == ["api_credit", "api_limit", "api_shared", "api_quota", "api_loan"]
+        assert sorted(provider.listed) == ["1", "2", "3", "4"]
+
+        apis = await service.get_apis_in_categories("app", ["2"], recursive=False)
+        assert [api.name for api in apis] == ["api_limit", "api_shared"]
+
+        with pytest.raises(CategoryNotFoundError):
+            await service.get_apis_in_categories("app", ["99"])
+
+    @pytest.mark.asyncio
+    async def test_recursive_without_category_service_warns(self, provider, caplog):
+        """Without a category service a recursive listing says it only covers the given categories"""
+        service = APIService(provider, MemoryCache())
+
+        with caplog.at_level(logging.WARNING):
+            apis = await service.get_apis_in_categories("app", ["2"])
+        assert [api.name for api in apis] == ["api_limit", "api_shared"]
+        assert "needs a category service" in caplog.text
+
+    def test_listing_concurrency_must_be_positive(self):
+        """A zero listing concurrency would deadlock the semaphore"""
+        with pytest.raises(ValidationError):
+            BackendSettings(listing_concurrency=0)
+
+
+class TestAPIServiceRefresh:
+    """Test cases for refresh-ahead reloads"""
+
+    @pytest.mark.asyncio
+    async def test_refresh_updates_name_and_search_indexes(self):
+        """Refreshed listings and details reach the indexes like normal loads"""
+        provider = NestedProvider()
+        name_index, search_index = APINameIndex(), APISearchIndex()
+        service = APIService(provider, MemoryCache(), name_index=name_index, search_index=search_index)
+
+        await service.get_apis_by_category("app", "5")
+        provider.LISTINGS = dict(provider.LISTINGS, **{"5": ["api_fund", "api_pension"]})
+        await service.refresh_listings("app", ["5"])
+
+        assert name_index.is_known("app", "api_pension") is True
+        assert "api_pension" in [hit.name for hit in search_index.search("app", "api_pension")]
+
+        await service.refresh_details("test_app", ["get_user_info"])
+        assert name_index.is_known("test_app", "get_user_info") is True
+        assert search_index.search("test_app", "get_user_info")[0].name == "get_user_info"
@@ -0,0 +1,126 @@
+"""
+Unit tests for CatalogService
+"""
+import asyncio
+import pytest
+from src.cache import MemoryCache
+from src.data_access import MockDataProvider
+from src.services import APINameIndex, APISearchIndex, APIService, CatalogService
+from src.tools import search_apis_tool
+
+
+class TreeProvider(MockDataProvider):
+    """Mock provider with change markers on its category tree"""
+
+    def __init__(self):
+        super().__init__()
+        self.versions = {"user_management": 1, "order_management": 1, "product_catalog": 1}
+        self.listed = []
+        self.failing = set()
+        self.tree_delay = 0.0
+
+    async def get_category_tree(self, app_id):
+        await asyncio.sleep(self.tree_delay)
+        return [
+            {"id": category_id, "name": category_id, "children": None,
+             "updateAt": version, "totalNumber": 2}
+            for category_id, version in self.versions.items()
+        ]
+
+    async def get_apis_by_category(self, app_id, category_id):
+        self.listed.append(category_id)
+        if category_id in self.failing:
+            raise RuntimeError("backend unavailable")
+        return await super().get_apis_by_category(app_id, category_id)
+
+
+class TestCatalogService:
+    """Test cases for catalog snapshots"""
+
+    @pytest.mark.asyncio
+    async def test_sync_refetches_only_changed_categories(self):
+        """A re-sync only lists categories whose change marker moved"""
+        provider = TreeProvider()
+        index = APINameIndex()
+        catalog = CatalogService(provider, name_index=index)
+
+        snapshot = await catalog.refresh("test_app")
+        assert sorted(provider.listed) == sorted(provider.versions)
+        assert "get_user_info" in snapshot.details
+        assert index.is_known("test_app", "get_usr_info") is False
+
+        provider.listed.clear()
+        provider.versions["order_management"] = 2
+        snapshot = await catalog.refresh("test_app")
+        assert provider.listed == ["order_management"]
+        assert "get_user_info" in snapshot.details
+        await catalog.close()
+
+    @pytest.mark.asyncio
+    async def test_api_service_served_from_snapshot(self):
+        """APIService answers from the snapshot without backend calls"""
+        provider = TreeProvider()
+        catalog = CatalogService(provider)
+        await catalog.load("test_app")
+        service = APIService(provider, MemoryCache(), catalog=catalog)
+
+        provider.listed.clear()
+        apis = await service.get_apis_by_category("test_app", "user_management")
+        details = await service.get_api_details("test_app", [api.name for api in apis])
+        assert provider.listed == []
+        assert {api.name for api in details} == {api.name for api in apis}
+        await catalog.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_listing_leaves_name_index_incomplete(self):
+        """Names of a category that could not be listed are not rejected"""
+        provider = TreeProvider()
+        provider.failing.add("order_management")
+        index = APINameIndex()
+        catalog = CatalogService(provider, name_index=index)
+
+        await catalog.refresh("test_app")
+        assert index.is_known("test_app", "get_user_info") is True
+        assert index.is_known("test_app", "get_orders") is None
+        assert not index.is_complete("test_app")
+
+        provider.failing.clear()
+        await catalog.refresh("test_app")
+        assert index.is_known("test_app", "get_orders") is True
+        assert index.is_complete("test_app")
+        await catalog.close()
+
+    @pytest.mark.asyncio
+    async def test_idle_app_is_dropped(self):
+        """An app that is not read stops syncing and leaves memory"""
+        provider = TreeProvider()
+        index = APINameIndex()
+        catalog = CatalogService(provider, sync_interval=0.01, name_index=index, idle_timeout=0.05)
+
+        assert catalog.get_snapshot("test_app") is None
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if catalog.get_stats()["evictions"]:
+                break
+        assert catalog.get_stats()["evictions"] == 1
+        assert catalog.get_stats()["apps"] == {}
+        assert index.is_known("test_app", "get_user_info") is None
+        await catalog.close()
+
+    @pytest.mark.asyncio
+    async def test_first_search_waits_bounded_and_reports_partial(self):
+        """A slow first sync does not block search_apis past search_wait"""
+        provider = TreeProvider()
+        provider.tree_delay = 0.3
+        index = APISearchIndex()
+        catalog = CatalogService(provider, search_index=index)
+        service = APIService(provider, MemoryCache(), catalog=catalog, search_index=index, search_wait=0.05)
+
+        response = await asyncio.wait_for(search_apis_tool("test_app", service, "get_user_info"), 0.2)
+        assert response.partial and response.results == []
+
+        await asyncio.sleep(0.4)
+        response = await search_apis_tool("test_app", service, "get_user_info")
+        assert not response.partial
+        assert response.results[0].name == "get_user_info"
+        await catalog.close()
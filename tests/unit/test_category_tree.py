@@ -0,0 +1,40 @@
+"""
+Unit tests for CategoryTree
+"""
+from src.data_access import CategoryTree
+
+RAW_TREE = [
+    {"id": 1, "name": "信用业务", "children": [
+        {"id": 2, "name": "授信", "children": [{"id": 4, "name": "额度"}]},
+        {"id": 3, "name": "放款", "children": None},
+    ]},
+    {"id": 5, "name": "资金", "children": []},
+]
+
+
+class TestCategoryTree:
+    """Test cases for the category node table"""
+
+    def test_flatten_keeps_preorder_and_full_names(self):
+        """Full listing matches the previous recursive flattening"""
+        categories = CategoryTree.build(RAW_TREE).to_categories()
+        assert [c.name for c in categories] == [
+            "信用业务", "信用业务>授信", "信用业务>授信>额度", "信用业务>放款", "资金"
+        ]
+        assert categories[1].parent_id == "1" and categories[0].child_count == 2
+
+    def test_lazy_expansion(self):
+        """parent_id/depth return only the requested part of the tree"""
+        tree = CategoryTree.build(RAW_TREE)
+        assert [c.id for c in tree.expand(depth=1)] == ["1", "5"]
+        assert [c.id for c in tree.expand("1", 1)] == ["2", "3"]
+        assert [c.id for c in tree.expand("1")] == ["2", "4", "3"]
+
+    def test_deep_tree_does_not_recurse(self):
+        """Trees deeper than the recursion limit can be built"""
+        root = node = {"id": 0, "name": "n"}
+        for i in range(1, 3000):
+            node["children"] = [{"id": i, "name": "n"}]
+            node = node["children"][0]
+        tree = CategoryTree.build([root])
+        assert len(tree) == 3000 and tree.depths[-1] == 3000
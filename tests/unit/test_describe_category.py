@@ -0,0 +1,90 @@
+"""
+Unit tests for the describe_category tool
+"""
+import json
+import pytest
+from src.cache import MemoryCache
+from src.data_access import MockDataProvider
+from src.models import APIBasic, APIDetail
+from src.services import APIService
+from src.tools import describe_category_tool
+
+NAMES = ["get_order", "list_orders", "get_user", "list_users", "get_order_items"]
+
+
+class CategoryProvider(MockDataProvider):
+    """Mock provider with one category of equally sized APIs"""
+
+    def __init__(self):
+        super().__init__()
+        self.requested = []
+
+    async def get_apis_by_category(self, app_id, category_id):
+        return [APIBasic(name=name, category_id=category_id) for name in NAMES]
+
+    async def get_api_details(self, app_id, api_names):
+        self.requested.append(list(api_names))
+        return [make_detail(name) for name in api_names]
+
+
+def make_detail(name):
+    return APIDetail(
+        name=name, category_id="orders", description="x" * 100, parameters=[], response_schema={}
+    )
+
+
+def detail_size(name):
+    return len(json.dumps(make_detail(name).model_dump(), ensure_ascii=False))
+
+
+class TestDescribeCategory:
+    """Test cases for describe_category_tool"""
+
+    @pytest.fixture
+    def provider(self):
+        return CategoryProvider()
+
+    @pytest.fixture
+    def api_service(self, provider):
+        return APIService(provider, MemoryCache())
+
+    @pytest.mark.asyncio
+    async def test_returns_all_details_within_limits(self, api_service):
+        """A small category is described in full"""
+        response = await describe_category_tool("app", api_service, "orders")
+
+        assert response.total_apis == 5
+        assert [api.name for api in response.apis] == NAMES
+        assert response.omitted_apis == [] and not response.truncated
+
+    @pytest.mark.asyncio
+    async def test_max_apis_limits_fetched_details(self, api_service, provider):
+        """Only the first max_apis details are fetched; the rest are listed as omitted"""
+        response = await describe_category_tool("app", api_service, "orders", max_apis=2)
+
+        assert [api.name for api in response.apis] == ["get_order", "list_orders"]
+        assert response.omitted_apis == ["get_user", "list_users", "get_order_items"]
+        assert response.truncated and response.total_apis == 5
+        assert sorted(sum(provider.requested, [])) == ["get_order", "list_orders"]
+
+    @pytest.mark.asyncio
+    async def test_max_bytes_truncates_details(self, api_service):
+        """Details stop at the byte cap, but at least one is always returned"""
+        budget = detail_size("get_order") + detail_size("list_orders")
+        response = await describe_category_tool("app", api_service, "orders", max_bytes=budget)
+
+        assert [api.name for api in response.apis] == ["get_order", "list_orders"]
+        assert response.omitted_apis == ["get_user", "list_users", "get_order_items"]
+
+        response = await describe_category_tool("app", api_service, "orders", max_bytes=1)
+        assert [api.name for api in response.apis] == ["get_order"]
+        assert len(response.omitted_apis) == 4
+
+    @pytest.mark.asyncio
+    async def test_name_filter_is_case_insensitive(self, api_service):
+        """name_filter keeps matching APIs and total_apis counts only those"""
+        response = await describe_category_tool("app", api_service, "orders", name_filter="ORDER", max_apis=2)
+
+        assert response.total_apis == 3
+        assert [api.name for api in response.apis] == ["get_order", "list_orders"]
+        assert response.omitted_apis == ["get_order_items"]
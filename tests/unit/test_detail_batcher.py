@@ -0,0 +1,87 @@
+"""
+Unit tests for APIDetailBatcher
+"""
+import asyncio
+import pytest
+from src.data_access import MockDataProvider
+from src.services import APIDetailBatcher
+
+
+class CountingProvider(MockDataProvider):
+    """Mock provider that records get_api_details calls"""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    async def get_api_details(self, app_id, api_names):
+        self.calls.append(list(api_names))
+        return await super().get_api_details(app_id, api_names)
+
+
+class TestAPIDetailBatcher:
+    """Test cases for detail micro-batching"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_call(self):
+        """Concurrent lookups are merged and deduplicated"""
+        provider = CountingProvider()
+        batcher = APIDetailBatcher(provider, min_window_ms=5)
+
+        results = await asyncio.gather(
+            batcher.load("test_app", ["get_user_info"]),
+            batcher.load("test_app", ["get_user_info", "create_user"]),
+            batcher.load("test_app", ["get_orders"]),
+        )
+
+        assert len(provider.calls) == 1
+        assert sorted(provider.calls[0]) == ["create_user", "get_orders", "get_user_info"]
+        assert [[d.name for d in r] for r in results] == [
+            ["get_user_info"],
+            ["get_user_info", "create_user"],
+            ["get_orders"],
+        ]
+        assert batcher.get_stats()["batch_size"]["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_backend_calls_never_exceed_max_batch_size(self):
+        """Oversized requests are split and a merge that would not fit opens a new batch"""
+        provider = CountingProvider()
+        batcher = APIDetailBatcher(provider, min_window_ms=5, max_batch_size=2)
+
+        single, merged = await asyncio.gather(
+            batcher.load("test_app", ["get_user_info", "create_user", "get_orders"]),
+            batcher.load("test_app", ["get_user_info", "get_orders"]),
+        )
+
+        assert all(len(call) <= 2 for call in provider.calls)
+        assert [d.name for d in single] == ["get_user_info", "create_user", "get_orders"]
+        assert sorted(d.name for d in merged) == ["get_orders", "get_user_info"]
+
+    @pytest.mark.asyncio
+    async def test_idle_apps_are_forgotten(self):
+        """Arrival statistics of apps without recent requests are dropped"""
+        batcher = APIDetailBatcher(CountingProvider(), idle_timeout=0.05)
+        await batcher.load("test_app", ["get_user_info"])
+        await batcher.load("test_app", ["get_orders"])
+        assert batcher.get_stats()["tracked_apps"] == 1
+
+        await asyncio.sleep(0.1)
+        await batcher.load("demo_app", ["demo_api"])
+        assert batcher.get_stats()["tracked_apps"] == 1
+        assert "test_app" not in batcher._interarrival
+
+    @pytest.mark.asyncio
+    async def test_failure_is_isolated_per_caller(self):
+        """A bad name only fails the caller that asked for it"""
+        provider = CountingProvider()
+        batcher = APIDetailBatcher(provider, min_window_ms=5)
+
+        good, bad = await asyncio.gather(
+            batcher.load("test_app", ["get_user_info"]),
+            batcher.load("test_app", ["no_such_api"]),
+            return_exceptions=True,
+        )
+
+        assert [d.name for d in good] == ["get_user_info"]
+        assert isinstance(bad, Exception)
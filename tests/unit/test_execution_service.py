@@ -0,0 +1,194 @@
+"""
+Unit tests for ExecutionService
+"""
+import asyncio
+import pytest
+from src.cache import BoundedMemoryCache, MemoryCache
+from src.data_access import MockDataProvider
+from src.models import ExecutionRequest, ExecutionResult, SweepRequest
+from src.services import ExecutionService
+from src.utils.errors import ExecutionGraphError
+
+
+class CountingProvider(MockDataProvider):
+    """Mock provider counting backend calls, each taking a little while"""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    async def execute_api(self, app_id, execution):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return await super().execute_api(app_id, execution)
+
+
+class FlakyProvider(MockDataProvider):
+    """Mock provider failing for users listed in fail_users"""
+
+    def __init__(self, fail_users):
+        super().__init__()
+        self.fail_users = set(fail_users)
+
+    async def execute_api(self, app_id, execution):
+        user_id = execution.parameters.get("user_id")
+        if user_id in self.fail_users:
+            return ExecutionResult(api_name=execution.api_name, success=False, error=f"no user {user_id}")
+        return await super().execute_api(app_id, execution)
+
+
+class ConcurrencyProvider(MockDataProvider):
+    """Mock provider recording the most calls in flight at once"""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = self.active = self.peak = 0
+
+    async def execute_api(self, app_id, execution):
+        self.calls += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return await super().execute_api(app_id, execution)
+
+
+class TestExecutionService:
+    """Test cases for API execution"""
+
+    @pytest.fixture
+    def service(self):
+        return ExecutionService(MockDataProvider())
+
+    @pytest.mark.asyncio
+    async def test_ref_uses_result_of_referenced_execution(self, service):
+        """A $ref parameter is replaced with a value from another execution's result"""
+        results = await service.execute_apis("test_app", [
+            ExecutionRequest(
+                api_name="get_orders",
+                parameters={"user_id": {"$ref": "user.data.user_id"}}
+            ),
+            ExecutionRequest(id="user", api_name="get_user_info", parameters={"user_id": "u42"}),
+        ])
+
+        assert [r.api_name for r in results] == ["get_orders", "get_user_info"]
+        assert all(r.success for r in results)
+        assert results[0].data["orders"][0]["user_id"] == "u42"
+
+    @pytest.mark.asyncio
+    async def test_unresolvable_ref_fails_only_dependent(self, service):
+        """A missing path fails the dependent execution, not the batch"""
+        results = await service.execute_apis("test_app", [
+            ExecutionRequest(id="user", api_name="get_user_info", parameters={"user_id": "u42"}),
+            ExecutionRequest(api_name="get_orders", parameters={"user_id": {"$ref": "user.data.missing"}}),
+        ])
+
+        assert results[0].success
+        assert not results[1].success
+        assert "user.data.missing" in results[1].error
+
+    @pytest.mark.asyncio
+    async def test_cycle_is_rejected(self, service):
+        """Cyclic references are rejected before anything runs"""
+        with pytest.raises(ExecutionGraphError):
+            await service.execute_apis("test_app", [
+                ExecutionRequest(id="a", api_name="get_user_info", parameters={"user_id": {"$ref": "b.data"}}),
+                ExecutionRequest(id="b", api_name="get_user_info", parameters={"user_id": {"$ref": "a.data"}}),
+            ])
+
+    @pytest.mark.asyncio
+    async def test_fields_projection(self, service):
+        """Only the requested field paths are returned"""
+        results = await service.execute_apis("test_app", [
+            ExecutionRequest(api_name="get_orders", parameters={"user_id": "u1"}, fields=["orders[*].order_id"]),
+        ])
+
+        assert results[0].data == {"orders": [{"order_id": "order_1"}, {"order_id": "order_2"}]}
+
+    @pytest.mark.asyncio
+    async def test_identical_cacheable_executions_hit_backend_once(self):
+        """Concurrent identical calls share one request and later calls are served from cache"""
+        provider = CountingProvider()
+        service = ExecutionService(provider, result_cache=MemoryCache(), cacheable_apis={"get_orders": None})
+        request = ExecutionRequest(api_name="get_orders", parameters={"user_id": "u1"})
+
+        results = await service.execute_apis("test_app", [request] * 3)
+        results += await service.execute_apis("test_app", [request])
+
+        assert provider.calls == 1
+        assert all(r.success and r.data == results[0].data for r in results)
+
+    @pytest.mark.asyncio
+    async def test_mutating_cached_result_does_not_corrupt_cache(self):
+        """Callers get their own copy of nested result data"""
+        provider = CountingProvider()
+        service = ExecutionService(provider, result_cache=MemoryCache(), cacheable_apis={"get_orders": None})
+        request = ExecutionRequest(api_name="get_orders", parameters={"user_id": "u1"})
+
+        first, second = await service.execute_apis("test_app", [request, request])
+        first.data["orders"].clear()
+        second.data["orders"][0]["order_id"] = "changed"
+        (third,) = await service.execute_apis("test_app", [request])
+
+        assert provider.calls == 1
+        assert [o["order_id"] for o in third.data["orders"]] == ["order_1", "order_2"]
+
+    @pytest.mark.asyncio
+    async def test_bounded_result_cache_evicts(self):
+        """With a bounded cache, results beyond its memory cap are evicted and fetched again"""
+        provider = CountingProvider()
+        cache = BoundedMemoryCache(max_bytes=1000, max_entry_bytes=1000)
+        service = ExecutionService(provider, result_cache=cache, cacheable_apis={"get_user_info": None})
+        requests = [
+            ExecutionRequest(api_name="get_user_info", parameters={"user_id": f"u{i}"}) for i in range(10)
+        ]
+
+        await service.execute_apis("test_app", requests)
+        await service.execute_apis("test_app", requests[:1])
+
+        assert provider.calls == 11
+        assert cache.get_stats()["evictions"] > 0
+
+    @pytest.mark.asyncio
+    async def test_sweep_with_mixed_success_and_failure(self):
+        """Failed rows are masked and reported by index while the others keep their data"""
+        service = ExecutionService(FlakyProvider({"u2", "u4"}))
+        sweep = SweepRequest(
+            api_name="get_orders",
+            base_parameters={"status": "paid"},
+            vary={"user_id": ["u1", "u2", "u3", "u4"]},
+            fields=["orders[0].user_id"],
+            concurrency=2
+        )
+
+        result = await service.execute_sweep("test_app", sweep)
+
+        assert (result.count, result.succeeded) == (4, 2)
+        assert result.error_mask == [False, True, False, True]
+        assert result.errors == {1: "no user u2", 3: "no user u4"}
+        assert result.data == [
+            {"orders": [{"user_id": "u1"}]}, None, {"orders": [{"user_id": "u3"}]}, None
+        ]
+
+    @pytest.mark.asyncio
+    async def test_sweep_limits(self):
+        """Requested concurrency is capped and sweeps with too many rows are rejected"""
+        provider = ConcurrencyProvider()
+        service = ExecutionService(provider, sweep_max_concurrency=3, sweep_max_rows=10)
+
+        users = [f"u{i}" for i in range(11)]
+        sweep = SweepRequest(api_name="get_user_info", vary={"user_id": users[:10]}, concurrency=100)
+        result = await service.execute_sweep("test_app", sweep)
+        assert result.succeeded == 10 and provider.peak == 3
+
+        sweep = SweepRequest(api_name="get_user_info", vary={"user_id": users})
+        with pytest.raises(ValueError, match="at most 10"):
+            await service.execute_sweep("test_app", sweep)
+        assert provider.calls == 10
+
+    @pytest.mark.asyncio
+    async def test_sweep_rejects_uneven_columns(self, service):
+        """Vary columns of different lengths cannot be zipped into rows"""
+        sweep = SweepRequest(api_name="get_orders", vary={"user_id": ["u1", "u2"], "status": ["paid"]})
+        with pytest.raises(ValueError):
+            await service.execute_sweep("test_app", sweep)
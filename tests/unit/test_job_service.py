@@ -0,0 +1,157 @@
+"""
+Unit tests for JobService
+"""
+import asyncio
+import pytest
+from src.data_access import MockDataProvider
+from src.models import ExecutionRequest, SQLExecutionResult
+from src.services import ExecutionService, JobService
+from src.utils.errors import JobNotFoundError, JobQueueFullError
+
+
+class SlowProvider(MockDataProvider):
+    """Mock provider delaying named APIs"""
+
+    def __init__(self, delays=None):
+        super().__init__()
+        self.delays = delays or {}
+
+    async def execute_api(self, app_id, execution):
+        await asyncio.sleep(self.delays.get(execution.api_name, 0))
+        return await super().execute_api(app_id, execution)
+
+
+class FakeSQLService:
+    """SQL service returning one row, or failing for statements containing FAIL"""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = []
+
+    async def execute_sql(self, app_id, db_name, sql, limit_rows=True):
+        self.calls.append((sql, limit_rows))
+        await asyncio.sleep(self.delay)
+        if "FAIL" in sql:
+            raise RuntimeError("database is down")
+        return SQLExecutionResult(success=True, data=[{"n": 1}])
+
+
+def user_request(api_name="get_user_info"):
+    return ExecutionRequest(api_name=api_name, parameters={"user_id": "u1"})
+
+
+class TestJobService:
+    """Test cases for background jobs"""
+
+    @pytest.mark.asyncio
+    async def test_lifecycle_and_partial_results(self):
+        """A job reports partial results while running and the full result once done"""
+        provider = SlowProvider({"get_orders": 0.2})
+        jobs = JobService(ExecutionService(provider), FakeSQLService())
+
+        response = await jobs.submit_execute_apis(
+            "app", [user_request(), user_request("get_orders")], wait_seconds=0.05
+        )
+        job_id = response.job.job_id
+        assert response.job.status == "running" and response.partial
+        assert [r["index"] for r in response.result["results"]] == [0]
+        assert jobs.get_status("app", job_id).progress == 1
+
+        await asyncio.sleep(0.3)
+        response = jobs.get_result("app", job_id)
+        assert response.job.status == "succeeded" and not response.partial
+        assert response.job.progress == 2 and response.job.finished_at >= response.job.started_at
+        assert [r["api_name"] for r in response.result["results"]] == ["get_user_info", "get_orders"]
+
+    @pytest.mark.asyncio
+    async def test_sql_job_keeps_row_limit_and_reports_failures(self):
+        """SQL jobs keep the automatic row limit; an exception fails the job with its message"""
+        sql_service = FakeSQLService()
+        jobs = JobService(ExecutionService(MockDataProvider()), sql_service)
+
+        response = await jobs.submit_execute_sql("app", "db", "SELECT 1", wait_seconds=1)
+        assert response.job.status == "succeeded"
+        assert response.result["result"]["data"] == [{"n": 1}]
+        assert sql_service.calls == [("SELECT 1", True)]
+
+        response = await jobs.submit_execute_sql("app", "db", "SELECT FAIL", wait_seconds=1)
+        assert response.job.status == "failed"
+        assert response.job.error == "database is down"
+
+    @pytest.mark.asyncio
+    async def test_queue_limit_and_unknown_jobs(self):
+        """Unfinished jobs beyond max_queued are refused; unknown or other apps' ids are not found"""
+        jobs = JobService(
+            ExecutionService(MockDataProvider()), FakeSQLService(delay=0.1), max_workers=1, max_queued=2
+        )
+
+        first = await jobs.submit_execute_sql("app", "db", "SELECT 1")
+        await jobs.submit_execute_sql("app", "db", "SELECT 2")
+        await asyncio.sleep(0.01)
+        assert jobs.get_status("app", first.job.job_id).status == "running"
+        assert jobs.get_stats()["jobs"] == {"running": 1, "queued": 1}
+        with pytest.raises(JobQueueFullError):
+            await jobs.submit_execute_sql("app", "db", "SELECT 3")
+
+        with pytest.raises(JobNotFoundError):
+            jobs.get_status("app", "missing")
+        with pytest.raises(JobNotFoundError):
+            jobs.get_result("other_app", first.job.job_id)
+
+        await asyncio.sleep(0.25)
+        await jobs.submit_execute_sql("app", "db", "SELECT 3")
+
+    @pytest.mark.asyncio
+    async def test_finished_jobs_expire_by_ttl(self):
+        """Finished jobs are dropped once result_ttl has passed"""
+        jobs = JobService(ExecutionService(MockDataProvider()), FakeSQLService(), result_ttl=0.05)
+
+        response = await jobs.submit_execute_sql("app", "db", "SELECT 1", wait_seconds=1)
+        assert jobs.get_status("app", response.job.job_id).status == "succeeded"
+        await asyncio.sleep(0.1)
+        with pytest.raises(JobNotFoundError):
+            jobs.get_result("app", response.job.job_id)
+        assert jobs.get_stats() == {"jobs": {}, "result_bytes": 0}
+
+    @pytest.mark.asyncio
+    async def test_memory_cap_evicts_oldest_results(self):
+        """Over max_result_bytes the oldest finished results are evicted first"""
+        probe = JobService(ExecutionService(MockDataProvider()), FakeSQLService())
+        await probe.submit_execute_sql("app", "db", "SELECT 1", wait_seconds=1)
+        size = probe.get_stats()["result_bytes"]
+
+        jobs = JobService(
+            ExecutionService(MockDataProvider()), FakeSQLService(), max_result_bytes=int(size * 1.5)
+        )
+        first = await jobs.submit_execute_sql("app", "db", "SELECT 1", wait_seconds=1)
+        second = await jobs.submit_execute_sql("app", "db", "SELECT 1", wait_seconds=1)
+
+        with pytest.raises(JobNotFoundError):
+            jobs.get_status("app", first.job.job_id)
+        assert jobs.get_status("app", second.job.job_id).status == "succeeded"
+        assert jobs.get_stats()["result_bytes"] == size
+
+    @pytest.mark.asyncio
+    async def test_oversized_result_fails_job(self):
+        """A result larger than max_result_bytes is not kept; its job fails instead"""
+        jobs = JobService(ExecutionService(MockDataProvider()), FakeSQLService(), max_result_bytes=10)
+
+        response = await jobs.submit_execute_sql("app", "db", "SELECT 1", wait_seconds=1)
+
+        assert response.job.status == "failed" and response.result is None
+        assert response.job.error.startswith("Result too large")
+        assert jobs.get_stats()["result_bytes"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_job_is_finished(self):
+        """Cancelling a job's task leaves it failed rather than running forever"""
+        jobs = JobService(ExecutionService(MockDataProvider()), FakeSQLService(delay=1))
+        response = await jobs.submit_execute_sql("app", "db", "SELECT 1", wait_seconds=0.01)
+
+        task = jobs._jobs[response.job.job_id].task
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+        status = jobs.get_status("app", response.job.job_id)
+        assert status.status == "failed" and status.error == "Job was cancelled"
+        assert status.finished_at is not None
@@ -0,0 +1,35 @@
+"""
+Unit tests for JSON path helpers
+"""
+from src.utils.json_path import find_largest_list, format_path, get_at, parse_path, replace_at
+
+
+class TestJsonPath:
+    """Test cases for locating and replacing nested values"""
+
+    def test_find_largest_list(self):
+        """The longest list is found in nested dicts, up to max_depth levels"""
+        data = {"meta": {"tags": [1, 2]}, "data": {"page": {"rows": [1, 2, 3]}}, "ids": []}
+        path, rows = find_largest_list(data)
+        assert path == ["data", "page", "rows"] and rows == [1, 2, 3]
+        assert format_path(path) == "data.page.rows"
+
+        assert find_largest_list(data, max_depth=2) == (["meta", "tags"], [1, 2])
+        assert find_largest_list([4, 5]) == ([], [4, 5])
+        assert find_largest_list({"total": 3}) == (None, None)
+
+    def test_replace_at_copies_only_the_path(self):
+        """replace_at leaves the original data untouched"""
+        data = {"data": {"rows": [1, 2, 3], "total": 3}, "other": {"x": 1}}
+        updated = replace_at(data, ["data", "rows"], [1])
+
+        assert updated == {"data": {"rows": [1], "total": 3}, "other": {"x": 1}}
+        assert data["data"]["rows"] == [1, 2, 3]
+        assert updated["other"] is data["other"]
+        assert replace_at(data, [], "all") == "all"
+
+    def test_parse_and_get(self):
+        """Paths with keys, indexes and wildcards resolve against the data"""
+        data = {"rows": [{"id": 1}, {"id": 2}]}
+        assert get_at(data, parse_path("rows[1].id")) == 2
+        assert get_at(data, parse_path("rows[*].id")) == [1, 2]
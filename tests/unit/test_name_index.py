@@ -0,0 +1,52 @@
+"""
+Unit tests for APINameIndex and fail-fast API name checks
+"""
+import asyncio
+import pytest
+from src.cache import MemoryCache
+from src.data_access import MockDataProvider
+from src.services import APINameIndex, APIService, CategoryService
+
+
+class TestAPINameIndex:
+    """Test cases for the API name index"""
+
+    def test_unknown_only_when_complete(self):
+        """A name is reported missing only once the app's index is complete"""
+        index = APINameIndex()
+        index.add("app", ["get_user_info"])
+        assert index.is_known("app", "get_user_info") is True
+        assert index.is_known("app", "get_usr_info") is None
+
+        index.replace("app", ["get_user_info", "get_orders"])
+        assert index.is_known("app", "get_usr_info") is False
+        assert index.suggest("app", "get_usr_info")[0] == "get_user_info"
+
+    def test_stale_index_does_not_reject(self):
+        """Past max_age a complete index no longer proves a name missing"""
+        index = APINameIndex()
+        index.replace("app", ["get_user_info"])
+        assert index.is_known("app", "get_new_api", max_age=60) is False
+
+        index._apps["app"].built_at -= 120
+        assert index.is_known("app", "get_new_api", max_age=60) is None
+        assert index.is_known("app", "get_user_info", max_age=60) is True
+
+    @pytest.mark.asyncio
+    async def test_service_builds_index_in_background(self):
+        """check_api_names reports invented names after the background build"""
+        provider = MockDataProvider()
+        cache = MemoryCache()
+        service = APIService(
+            provider,
+            cache,
+            category_service=CategoryService(provider, cache),
+            name_index=APINameIndex()
+        )
+
+        assert await service.check_api_names("test_app", ["get_usr_info"]) == {}
+        await asyncio.sleep(0.05)
+
+        unknown = await service.check_api_names("test_app", ["get_user_info", "get_usr_info"])
+        assert list(unknown) == ["get_usr_info"]
+        assert "get_user_info" in unknown["get_usr_info"]
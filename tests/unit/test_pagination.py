@@ -0,0 +1,81 @@
+"""
+Unit tests for automatic pagination
+"""
+import asyncio
+import pytest
+from pydantic import ValidationError
+from src.models import ExecutionRequest, ExecutionResult, PaginationSpec
+from src.services.pagination import execute_paginated
+
+
+def paged_backend(total_rows, report_total=True, fail_page=None, delay=0.0):
+    """Executor serving total_rows ids in pages of parameters["ps"] rows"""
+    calls, cancelled = [], []
+
+    async def execute(request: ExecutionRequest) -> ExecutionResult:
+        page, size = request.parameters["cp"], request.parameters["ps"]
+        calls.append(page)
+        if page == fail_page:
+            return ExecutionResult(api_name=request.api_name, success=False, error="backend down")
+        if page != 1:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                cancelled.append(page)
+                raise
+        rows = [{"id": i} for i in range((page - 1) * size, min(page * size, total_rows))]
+        data = {"list": rows, "total": total_rows} if report_total else {"list": rows}
+        return ExecutionResult(api_name=request.api_name, success=True, data=data)
+
+    return execute, calls, cancelled
+
+
+def request(**spec):
+    return ExecutionRequest(api_name="list_orders", parameters={"ps": 10}, paginate=PaginationSpec(**spec))
+
+
+class TestPagination:
+    """Test cases for execute_paginated"""
+
+    @pytest.mark.asyncio
+    async def test_total_known_fetches_remaining_pages_at_once(self):
+        """With a total, exactly the needed pages are fetched and merged in order"""
+        execute, calls, _ = paged_backend(45)
+        result = await execute_paginated(request(), execute)
+
+        assert result.success
+        assert [row["id"] for row in result.data["list"]] == list(range(45))
+        assert sorted(calls) == [1, 2, 3, 4, 5]
+
+        execute, calls, _ = paged_backend(45)
+        result = await execute_paginated(request(max_rows=15), execute)
+        assert len(result.data["list"]) == 15 and sorted(calls) == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_total_unknown_fetches_waves_until_short_page(self):
+        """Without a total, waves of pages are fetched until a page comes back short"""
+        execute, calls, _ = paged_backend(45, report_total=False)
+        result = await execute_paginated(request(concurrency=2), execute)
+
+        assert [row["id"] for row in result.data["list"]] == list(range(45))
+        assert sorted(calls) == [1, 2, 3, 4, 5]
+
+        execute, calls, _ = paged_backend(1000, report_total=False)
+        result = await execute_paginated(request(concurrency=3, max_pages=4), execute)
+        assert len(result.data["list"]) == 40 and sorted(calls) == [1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_failed_page_fails_result_and_cancels_other_pages(self):
+        """A failing page returns an error result and cancels the pages still running"""
+        execute, _, cancelled = paged_backend(50, fail_page=2, delay=1.0)
+        result = await asyncio.wait_for(execute_paginated(request(), execute), 0.5)
+
+        assert not result.success
+        assert "page 2 failed: backend down" in result.error
+        assert sorted(cancelled) == [3, 4, 5]
+
+    def test_concurrency_and_max_pages_must_be_positive(self):
+        """Zero concurrency or max_pages is rejected before anything runs"""
+        for spec in ({"concurrency": 0}, {"max_pages": 0}, {"page_size": 0}):
+            with pytest.raises(ValidationError):
+                PaginationSpec(**spec)
@@ -0,0 +1,131 @@
+"""
+Unit tests for ParameterValidator
+"""
+import pytest
+from src.cache import MemoryCache
+from src.data_access import MockDataProvider
+from src.models import APIDetail, ExecutionRequest, Parameter
+from src.services import APIService, ParameterValidator
+from src.utils.errors import ParameterValidationError
+
+
+def make_detail(**types):
+    """API detail with one parameter per keyword; names ending in _opt are optional"""
+    return APIDetail(
+        name="search_orders",
+        category_id="cat_1",
+        parameters=[
+            Parameter(name=name, type=kind, required=not name.endswith("_opt"), description="")
+            for name, kind in types.items()
+        ],
+        response_schema={}
+    )
+
+
+class TestParameterValidator:
+    """Test cases for pre-flight parameter validation"""
+
+    @pytest.fixture
+    def cache(self):
+        return MemoryCache()
+
+    @pytest.fixture
+    def api_service(self, cache):
+        return APIService(MockDataProvider(), cache)
+
+    async def cache_detail(self, cache, detail):
+        await cache.set(f"api_detail:app:{detail.name}", detail)
+
+    @pytest.mark.asyncio
+    async def test_coerce_mode_converts_values(self, cache, api_service):
+        """Exactly reversible conversions to the declared types are applied in coerce mode"""
+        detail = make_detail(limit="integer", ratio="double", active="boolean", code="string")
+        await self.cache_detail(cache, detail)
+        validator = ParameterValidator(api_service, coerce=True)
+        execution = ExecutionRequest(
+            api_name="search_orders",
+            parameters={"limit": "10", "ratio": "0.5", "active": "true", "code": 42, "extra": "kept"}
+        )
+
+        checked = await validator.validate("app", execution)
+
+        assert checked.parameters == {
+            "limit": 10, "ratio": 0.5, "active": True, "code": "42", "extra": "kept"
+        }
+        assert execution.parameters["limit"] == "10"
+
+    @pytest.mark.asyncio
+    async def test_valid_parameters_are_returned_unchanged(self, cache, api_service):
+        """A request that needs no conversion is passed through as is"""
+        await self.cache_detail(cache, make_detail(limit="integer", code_opt="string"))
+        validator = ParameterValidator(api_service)
+        execution = ExecutionRequest(api_name="search_orders", parameters={"limit": 10})
+
+        assert await validator.validate("app", execution) is execution
+
+    @pytest.mark.asyncio
+    async def test_reject_mode_reports_every_problem(self, cache, api_service):
+        """Reject mode lists missing parameters and wrong types in one error"""
+        await self.cache_detail(cache, make_detail(user_id="string", limit="integer", active="boolean"))
+        validator = ParameterValidator(api_service, coerce=False)
+        execution = ExecutionRequest(api_name="search_orders", parameters={"limit": "10", "active": True})
+
+        with pytest.raises(ParameterValidationError) as exc_info:
+            await validator.validate("app", execution)
+
+        details = exc_info.value.details
+        assert details["parameter"] == "user_id, limit"
+        assert details["error"] == "user_id: missing required parameter; limit: expected number, got str '10'"
+
+    @pytest.mark.asyncio
+    async def test_lossy_conversions_are_rejected_in_coerce_mode(self, cache, api_service):
+        """Values whose conversion would change them are rejected even when coercing"""
+        await self.cache_detail(cache, make_detail(limit_opt="integer", active_opt="boolean"))
+        validator = ParameterValidator(api_service)
+
+        for parameters in (
+            {"limit_opt": "00123"}, {"limit_opt": " 10 "}, {"limit_opt": "1e3"},
+            {"limit_opt": "inf"}, {"limit_opt": "nan"}, {"active_opt": "yes"}, {"active_opt": 2},
+        ):
+            execution = ExecutionRequest(api_name="search_orders", parameters=parameters)
+            with pytest.raises(ParameterValidationError, match="expected"):
+                await validator.validate("app", execution)
+
+    @pytest.mark.asyncio
+    async def test_placeholder_types_are_not_checked(self, cache, api_service):
+        """A type the backend did not declare does not reject any value"""
+        detail = make_detail(filter="string")
+        detail.parameters[0].type_declared = False
+        await self.cache_detail(cache, detail)
+        validator = ParameterValidator(api_service, coerce=False)
+        execution = ExecutionRequest(api_name="search_orders", parameters={"filter": {"status": ["paid"]}})
+
+        assert await validator.validate("app", execution) is execution
+        assert "type_declared" not in detail.model_dump()["parameters"][0]
+
+    @pytest.mark.asyncio
+    async def test_uncached_api_is_not_checked(self, api_service):
+        """Without a cached detail the request passes through unchecked"""
+        validator = ParameterValidator(api_service, coerce=False)
+        execution = ExecutionRequest(api_name="search_orders", parameters={"limit": "ten"})
+
+        assert await validator.validate("app", execution) is execution
+
+    @pytest.mark.asyncio
+    async def test_recompiles_when_parameter_definitions_change(self, cache, api_service):
+        """A changed detail is recompiled; an equal one keeps the compiled validator"""
+        validator = ParameterValidator(api_service, coerce=False)
+        execution = ExecutionRequest(api_name="search_orders", parameters={"limit": "10"})
+
+        await self.cache_detail(cache, make_detail(limit="string"))
+        assert await validator.validate("app", execution) is execution
+        compiled = validator._compiled[("app", "search_orders")][1]
+
+        await self.cache_detail(cache, make_detail(limit="string"))
+        await validator.validate("app", execution)
+        assert validator._compiled[("app", "search_orders")][1] is compiled
+
+        await self.cache_detail(cache, make_detail(limit="integer"))
+        with pytest.raises(ParameterValidationError, match="expected number"):
+            await validator.validate("app", execution)
+        assert validator._compiled[("app", "search_orders")][1] is not compiled
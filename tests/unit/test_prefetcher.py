@@ -0,0 +1,91 @@
+"""
+Unit tests for DetailPrefetcher
+"""
+import asyncio
+import pytest
+from pydantic import ValidationError
+from src.cache import MemoryCache
+from src.config import PrefetchSettings
+from src.data_access import MockDataProvider
+from src.services import APIService, DetailPrefetcher
+
+
+class Warmer:
+    """Warm function recording its batches"""
+
+    def __init__(self, delay=0.0):
+        self.batches = []
+        self.delay = delay
+
+    async def __call__(self, names):
+        self.batches.append(list(names))
+        await asyncio.sleep(self.delay)
+        return list(names)
+
+
+class TestDetailPrefetcher:
+    """Test cases for speculative detail prefetching"""
+
+    @pytest.mark.asyncio
+    async def test_popular_names_warmed_first_in_batches(self):
+        """max_names names are warmed, most requested first, batch_size at a time"""
+        prefetcher = DetailPrefetcher(max_names=3, rate=1000, batch_size=2)
+        prefetcher.record_request("app", ["d", "c", "d"], set())
+        warm = Warmer()
+
+        prefetcher.schedule("app", ["a", "b", "c", "d"], warm)
+        await asyncio.sleep(0.05)
+        assert warm.batches == [["d", "c"], ["a"]]
+        assert prefetcher.get_stats()["prefetched"] == 3
+
+    @pytest.mark.asyncio
+    async def test_newer_listing_cancels_pending_prefetch(self):
+        """Scheduling again for an app cancels its pending prefetch and frees its rate slot"""
+        prefetcher = DetailPrefetcher(max_names=4, rate=10, batch_size=2)
+        warm = Warmer()
+
+        prefetcher.schedule("app", ["a", "b", "c", "d"], warm)
+        await asyncio.sleep(0.05)  # First batch taken, second waits for its slot at 0.2s
+        prefetcher.schedule("app", ["x", "y"], warm)
+        await asyncio.sleep(0.25)
+
+        # x, y take over the cancelled batch's slot instead of queueing behind it (0.4s)
+        assert warm.batches == [["a", "b"], ["x", "y"]]
+        assert prefetcher.get_stats()["cancelled"] == 1
+        await prefetcher.close()
+        assert prefetcher.get_stats()["pending"] == 0
+
+    @pytest.mark.asyncio
+    async def test_waits_for_foreground_fetches(self):
+        """A batch does not start while a foreground fetch is in flight"""
+        prefetcher = DetailPrefetcher(max_names=2, rate=1000, max_idle_wait=5)
+        warm = Warmer()
+
+        with prefetcher.foreground():
+            prefetcher.schedule("app", ["a"], warm)
+            await asyncio.sleep(0.05)
+            assert warm.batches == []
+        await asyncio.sleep(0.05)
+        assert warm.batches == [["a"]]
+
+    @pytest.mark.asyncio
+    async def test_hit_rate_counts_prefetched_details_served_from_cache(self):
+        """Requests for prefetched names count as hits; the rest as misses"""
+        provider = MockDataProvider()
+        prefetcher = DetailPrefetcher(max_names=1, rate=1000)
+        service = APIService(provider, MemoryCache(), prefetcher=prefetcher)
+
+        apis = await service.get_apis_by_category("test_app", "user_management")
+        await asyncio.sleep(0.05)
+        await service.get_api_details("test_app", [apis[0].name])
+        stats = prefetcher.get_stats()
+        assert (stats["prefetched"], stats["hits"], stats["misses"]) == (1, 1, 0)
+        assert stats["hit_rate"] == 1.0
+
+    def test_rate_and_batch_size_must_be_positive(self):
+        """Zero rate or batch size is rejected up front"""
+        for settings in ({"rate": 0}, {"batch_size": 0}):
+            with pytest.raises(ValidationError):
+                PrefetchSettings(**settings)
+            with pytest.raises(ValueError):
+                DetailPrefetcher(**settings)
@@ -0,0 +1,85 @@
+"""
+Unit tests for ResultStore and fetch_result_page
+"""
+import pytest
+from src.cache import ResultStore
+from src.tools import fetch_result_page_tool
+from src.utils.errors import ResultNotFoundError
+
+ROWS = [{"id": i, "name": f"row {i}"} for i in range(25)]
+
+
+class TestResultStore:
+    """Test cases for server-side result paging"""
+
+    @pytest.mark.asyncio
+    async def test_small_results_are_not_stored(self):
+        """Results under the page size and byte threshold are returned as is"""
+        store = ResultStore(page_size=100)
+        assert await store.offload("app", ROWS) is None
+        assert await store.offload("app", ROWS, force=True) is not None
+
+    @pytest.mark.asyncio
+    async def test_cursor_reads_every_row_once(self):
+        """Following next_cursor returns all rows in order"""
+        store = ResultStore(threshold_bytes=10, page_size=10)
+        rows, page = await store.offload("app", ROWS)
+        assert (page.offset, page.returned_rows, page.total_rows) == (0, 10, 25)
+
+        seen = list(rows)
+        while page.next_cursor:
+            rows, page = await store.get_page("app", page.next_cursor, 7)
+            seen += rows
+        assert seen == ROWS
+
+    @pytest.mark.asyncio
+    async def test_page_size_is_validated_and_capped(self):
+        """page_size below 1 is rejected; large ones are capped"""
+        store = ResultStore(threshold_bytes=10, page_size=10, max_page_size=20)
+        _, page = await store.offload("app", ROWS)
+
+        for page_size in (0, -5):
+            with pytest.raises(ValueError):
+                await store.get_page("app", page.next_cursor, page_size)
+            with pytest.raises(ValueError):
+                await fetch_result_page_tool("app", store, page.next_cursor, page_size)
+
+        response = await fetch_result_page_tool("app", store, page.next_cursor, 1000)
+        assert response.page.returned_rows == 15
+        assert response.rows == ROWS[10:]
+
+    @pytest.mark.asyncio
+    async def test_cursor_of_other_app_or_malformed_is_rejected(self):
+        """A cursor is only readable by the app that stored the result"""
+        store = ResultStore(threshold_bytes=10, page_size=10)
+        _, page = await store.offload("app", ROWS)
+
+        for app_id, cursor in (("other", page.next_cursor), ("app", "missing:10"), ("app", "x")):
+            with pytest.raises(ResultNotFoundError):
+                await store.get_page(app_id, cursor)
+
+    @pytest.mark.asyncio
+    async def test_result_over_memory_cap(self, tmp_path):
+        """A result larger than the memory cap is spilled, or truncated to its first page"""
+        store = ResultStore(threshold_bytes=10, page_size=10, max_bytes=1000)
+        _, small = await store.offload("app", ROWS[:12])
+        rows, page = await store.offload("app", ROWS * 4)
+        assert rows == ROWS[:10] and page.truncated and page.next_cursor is None
+        assert page.total_rows == 100
+        assert store.get_stats()["results"] == 1
+        assert (await store.get_page("app", small.next_cursor))[0] == ROWS[10:12]
+
+        store = ResultStore(threshold_bytes=10, page_size=10, max_bytes=1000, spill_dir=str(tmp_path))
+        _, page = await store.offload("app", ROWS * 4)
+        assert not page.truncated and page.next_cursor
+        assert store.get_stats()["spilled_results"] == 1
+
+    @pytest.mark.asyncio
+    async def test_spilled_results_stay_readable(self, tmp_path):
+        """Results over the memory cap are spilled to disk and paged from there"""
+        store = ResultStore(threshold_bytes=10, page_size=10, max_bytes=1, spill_dir=str(tmp_path))
+        _, page = await store.offload("app", ROWS)
+        assert list(tmp_path.iterdir())
+
+        rows, _ = await store.get_page("app", page.next_cursor, 5)
+        assert rows == ROWS[10:15]
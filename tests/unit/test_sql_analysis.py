@@ -0,0 +1,37 @@
+"""
+Unit tests for SQL analysis helpers
+"""
+from src.utils.sql_analysis import fingerprint, is_cacheable_read
+
+
+class TestSQLAnalysis:
+    """Test cases for result cache fingerprints"""
+
+    def test_fingerprint_ignores_formatting_only(self):
+        """Formatting and plain comments do not change the key; values do"""
+        key = fingerprint("SELECT * FROM orders WHERE id = 1").key
+        assert fingerprint("select *\n  from `orders` where id=1; -- by id").key == key
+        assert fingerprint("SELECT * FROM orders /* note */ WHERE id = 1").key == key
+        assert fingerprint("SELECT * FROM orders WHERE id = 2").key != key
+
+    def test_quoted_names_stay_distinct(self):
+        """A quoted name with a space is not the same statement as a column and its alias"""
+        assert fingerprint("SELECT `a b` FROM t").key != fingerprint("SELECT a b FROM t").key
+        assert fingerprint("SELECT `select` FROM t").key != fingerprint("SELECT select FROM t").key
+
+    def test_comments_read_as_mysql_reads_them(self):
+        """'--' needs whitespace to start a comment and /*! */ is executed"""
+        assert fingerprint("SELECT 1--1").key != fingerprint("SELECT 1").key
+        assert fingerprint("SELECT * FROM t /*! WHERE id=1 */").key != fingerprint("SELECT * FROM t").key
+        assert not is_cacheable_read("SELECT /*! SLEEP(5) */ 1")
+
+    def test_server_state_is_not_cacheable(self):
+        """Statements reading server state instead of stored data are never cached"""
+        for sql in (
+            "SHOW PROCESSLIST", "SHOW FULL PROCESSLIST", "SHOW GLOBAL STATUS", "SHOW STATUS",
+            "SELECT * FROM information_schema.processlist",
+            "SELECT * FROM `performance_schema`.`threads`",
+        ):
+            assert not is_cacheable_read(sql), sql
+        for sql in ("SHOW TABLES", "SELECT status FROM orders", "DESCRIBE orders"):
+            assert is_cacheable_read(sql), sql
@@ -0,0 +1,317 @@
+"""
+Unit tests for SQLService
+"""
+import asyncio
+import re
+import pytest
+from src.cache import BoundedMemoryCache, MemoryCache, ResultStore
+from src.data_access import MockDataProvider
+from src.services import SQLSchemaService, SQLService
+from src.utils.columnar import to_columnar
+
+
+class SchemaProvider(MockDataProvider):
+    """Mock provider answering information_schema queries and counting them"""
+
+    def __init__(self):
+        super().__init__()
+        self.queries = []
+        self.columns = None
+
+    async def execute_sql(self, app_id, sql, source_name):
+        self.queries.append(sql)
+        await asyncio.sleep(0.01)
+        if "information_schema.tables" in sql:
+            rows = [{"name": "orders", "comment": "订单"}, {"name": "users", "comment": "用户"}]
+        elif "information_schema.columns" in sql and self.columns is not None:
+            rows = self.columns
+        elif "information_schema.columns" in sql:
+            rows = [
+                {"table_name": table, "name": column, "type": "bigint", "comment": "",
+                 "nullable": column != "id", "default_value": None,
+                 "key_type": "PRI" if column == "id" else ""}
+                for table in ("ORDERS", "users") if f"'{table.lower()}'" in sql.lower()
+                for column in ("id", f"{table.lower()}_no")
+            ]
+        else:
+            rows = []
+        return {"data": [{"name": "output_standard_chart", "value": rows},
+                         {"name": "output_json_schema", "value": []}]}
+
+
+class TestSQLService:
+    """Test cases for SQL schema metadata"""
+
+    @pytest.mark.asyncio
+    async def test_schema_metadata_cached_and_shared(self):
+        """Concurrent and repeated lookups hit the backend once per key"""
+        provider = SchemaProvider()
+        service = SQLService(provider, cache=MemoryCache())
+
+        first, second = await asyncio.gather(
+            service.get_tables("app", "db"), service.get_tables("app", "db")
+        )
+        assert [t.name for t in first] == ["orders", "users"] == [t.name for t in second]
+        await service.get_table_fields("app", "db", ["orders"])
+        await service.get_table_fields("app", "db", ["orders"])
+        assert len(provider.queries) == 2
+
+    @pytest.mark.asyncio
+    async def test_ddl_invalidates_schema(self):
+        """DDL through execute_sql drops the cached metadata of the database"""
+        provider = SchemaProvider()
+        service = SQLService(provider, cache=MemoryCache())
+
+        await service.get_tables("app", "db")
+        await service.execute_sql("app", "db", "ALTER TABLE orders ADD COLUMN note varchar(64)")
+        await service.get_tables("app", "db")
+        assert sum("information_schema.tables" in q for q in provider.queries) == 2
+
+        await service.execute_sql("app", "db", "/* migration */ -- step 2\nDROP TABLE users")
+        await service.get_tables("app", "db")
+        assert sum("information_schema.tables" in q for q in provider.queries) == 3
+
+    @pytest.mark.asyncio
+    async def test_fields_fetched_in_one_query(self):
+        """Fields of several tables come from one safely quoted IN query"""
+        provider = SchemaProvider()
+        service = SQLService(provider, cache=MemoryCache())
+
+        result = await service.get_table_fields("app", "db", ["orders", "users", "x' OR '1'='1"])
+        assert len(provider.queries) == 1
+        assert "'x'' OR ''1''=''1'" in provider.queries[0]
+        assert [info.table_name for info in result] == ["orders", "users", "x' OR '1'='1"]
+        assert [f.name for f in result[0].fields] == ["id", "orders_no"]
+        assert result[2].fields == []
+
+        await service.get_table_fields("app", "db", ["users"])
+        assert len(provider.queries) == 1
+
+    @pytest.mark.asyncio
+    async def test_schema_snapshot_search(self):
+        """The snapshot loads the whole schema in two queries and ranks by comment"""
+        provider = SchemaProvider()
+        provider.columns = [
+            {"table_name": "orders", "name": "id", "type": "bigint", "comment": "主键",
+             "nullable": "NO", "default_value": None, "key_type": "PRI"},
+            {"table_name": "orders", "name": "invoice_amount", "type": "decimal",
+             "comment": "发票金额", "nullable": "YES", "default_value": None, "key_type": ""},
+            {"table_name": "users", "name": "bank_name", "type": "varchar",
+             "comment": "开户行", "nullable": "YES", "default_value": None, "key_type": ""},
+        ]
+        schema = SQLSchemaService(provider)
+        service = SQLService(provider, cache=MemoryCache(), schema=schema)
+
+        hits = await service.search_schema("app", "db", "开户行")
+        assert (hits[0].table_name, hits[0].column_name) == ("users", "bank_name")
+        assert len(provider.queries) == 2
+
+        fields = await service.get_table_fields("app", "db", ["ORDERS"])
+        assert [f.name for f in fields[0].fields] == ["id", "invoice_amount"]
+        assert schema.get_snapshot("app", "db").primary_key("orders") == ["id"]
+        assert len(provider.queries) == 2
+        await schema.close()
+
+    @pytest.mark.asyncio
+    async def test_fields_outside_snapshot_and_idle_databases(self):
+        """Views are looked up past the snapshot; unread databases are dropped"""
+        provider = SchemaProvider()
+        provider.columns = [
+            {"table_name": table, "name": "id", "type": "bigint", "comment": "", "nullable": "NO",
+             "default_value": None, "key_type": "PRI" if table == "orders" else ""}
+            for table in ("orders", "v_orders")
+        ]
+        schema = SQLSchemaService(provider, refresh_interval=0.01, idle_timeout=0.05)
+        service = SQLService(provider, cache=MemoryCache(), schema=schema)
+        await schema.load("app", "db")
+
+        fields = await service.get_table_fields("app", "db", ["orders", "v_orders"])
+        assert [len(info.fields) for info in fields] == [1, 1]
+        assert any("IN ('v_orders')" in sql for sql in provider.queries)
+
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if schema.get_stats()["evictions"]:
+                break
+        assert schema.get_stats()["databases"] == {}
+        await schema.close()
+
+    @pytest.mark.asyncio
+    async def test_read_only_results_cached_by_fingerprint(self):
+        """Equivalent reads share one backend call; volatile reads and writes do not"""
+        provider = SchemaProvider()
+        service = SQLService(provider, result_cache=BoundedMemoryCache())
+
+        await asyncio.gather(
+            service.execute_sql("app", "db", "select * from orders where id = 1"),
+            service.execute_sql("app", "db", "SELECT *\n  FROM `orders` WHERE id=1;")
+        )
+        assert len(provider.queries) == 1
+        await service.execute_sql("app", "db", "SELECT * FROM orders WHERE id = 2")
+        await service.execute_sql("app", "db", "SELECT NOW()")
+        await service.execute_sql("app", "db", "SELECT NOW()")
+        assert len(provider.queries) == 4
+
+        await service.execute_sql("app", "db", "UPDATE orders SET note = 'x' WHERE id = 1")
+        await service.execute_sql("app", "db", "SELECT * FROM orders WHERE id = 1")
+        assert len(provider.queries) == 6
+
+    @pytest.mark.asyncio
+    async def test_row_limit_and_continuation(self):
+        """Unbounded SELECTs are limited and continued by primary key or offset"""
+        provider = SchemaProvider()
+        rows = [{"id": i, "orders_no": f"NO{i}"} for i in range(1, 8)]
+
+        async def execute_sql(app_id, sql, source_name):
+            provider.queries.append(sql)
+            if "information_schema" in sql:
+                return await SchemaProvider.execute_sql(provider, app_id, sql, source_name)
+            after = re.search(r"> (\d+)", sql)
+            limit, offset = re.search(r"LIMIT (\d+)(?: OFFSET (\d+))?", sql).groups()
+            selected = [r for r in rows if not after or r["id"] > int(after.group(1))]
+            selected = selected[int(offset or 0):][:int(limit)]
+            return {"data": [{"name": "output_standard_chart", "value": selected}]}
+
+        provider.execute_sql = execute_sql
+        service = SQLService(provider, cache=MemoryCache(), max_rows=3)
+
+        for sql in ("SELECT * FROM orders", "SELECT o.id FROM orders o JOIN users u ON o.id = u.id"):
+            seen, result = [], await service.execute_sql("app", "db", sql)
+            while True:
+                seen += [row["id"] for row in result.data]
+                if not result.continuation_token:
+                    break
+                assert result.truncated
+                result = await service.execute_sql("app", "db", "", continuation_token=result.continuation_token)
+            assert seen == list(range(1, 8))
+        assert "_page.`id` > 3" in "".join(provider.queries)
+
+        result = await service.execute_sql("app", "db", "SELECT * FROM orders LIMIT 50")
+        assert len(result.data) == 7 and not result.truncated
+
+    @pytest.mark.asyncio
+    async def test_row_limit_skips_writes_and_duplicate_columns(self):
+        """CTE writes are never limited; select lists a derived table rejects page by offset"""
+        provider = SchemaProvider()
+        service = SQLService(provider, cache=MemoryCache(), max_rows=3)
+
+        for sql in (
+            "WITH x AS (SELECT id FROM orders) DELETE FROM orders WHERE id IN (SELECT id FROM x)",
+            "WITH RECURSIVE x (id) AS (SELECT 1) UPDATE orders SET orders_no = '' WHERE id IN (SELECT id FROM x)"
+        ):
+            await service.execute_sql("app", "db", sql)
+            assert provider.queries[-1] == sql
+
+        for sql in ("SELECT id, o.* FROM orders o", "SELECT *, id FROM orders", "SELECT id, orders_no, orders_no FROM orders"):
+            await service.execute_sql("app", "db", sql)
+            assert provider.queries[-1] == f"{sql}\nLIMIT 4"
+
+        await service.execute_sql("app", "db", "SELECT `id`, orders.orders_no FROM orders")
+        assert "AS _page ORDER BY _page.`id`" in provider.queries[-1]
+
+    @pytest.mark.asyncio
+    async def test_row_limit_pages_joins_by_offset(self):
+        """Every join form pages by offset, and non-wrappable select lists skip the key lookup"""
+        provider = SchemaProvider()
+        service = SQLService(provider, cache=MemoryCache(), max_rows=3)
+
+        for sql in (
+            "SELECT * FROM orders STRAIGHT_JOIN users ON orders.id = users.id",
+            "SELECT * FROM orders NATURAL JOIN users",
+            "SELECT * FROM orders CROSS JOIN users",
+        ):
+            await service.execute_sql("app", "db", sql)
+            assert provider.queries[-1] == f"{sql}\nLIMIT 4"
+
+        await service.execute_sql("app", "db", "SELECT id, id FROM orders")
+        assert not any("information_schema" in q for q in provider.queries)
+
+    @pytest.mark.asyncio
+    async def test_columnar_format(self):
+        """Columnar results hold typed column arrays and a null mask"""
+        provider = SchemaProvider()
+
+        async def execute_sql(app_id, sql, source_name):
+            rows = [{"id": "1", "amount": "2.50", "note": None}, {"id": "2", "amount": 3, "note": "x"}]
+            schema = [{"name": "id", "type": "Number"}, {"name": "amount", "type": "Number"}]
+            return {"data": [{"name": "output_standard_chart", "value": rows},
+                             {"name": "output_json_schema", "value": schema}]}
+
+        provider.execute_sql = execute_sql
+        service = SQLService(provider)
+
+        result = await service.execute_sql("app", "db", "SELECT * FROM orders", format="columnar")
+        assert result.data is None
+        columnar = result.columnar
+        assert columnar.columns == ["id", "amount", "note"]
+        assert columnar.types == ["Number", "Number", "String"]
+        assert columnar.values == [[1, 2], [2.5, 3], [None, "x"]]
+        assert columnar.null_mask == [None, None, [True, False]]
+        assert columnar.row_count == 2
+
+    def test_columnar_keeps_values_that_do_not_convert_exactly(self):
+        """High-precision decimals, NaN and multi-bit BIT values are not coerced"""
+        rows = [
+            {"price": "12345678901234567.89", "rate": "0.10", "score": "NaN", "flags": 5, "active": "1"},
+            {"price": "1.5", "rate": "inf", "score": "2", "flags": 0, "active": "0"},
+        ]
+        schema = [
+            {"name": "price", "type": "decimal"}, {"name": "rate", "type": "decimal"},
+            {"name": "score", "type": "double"}, {"name": "flags", "type": "bit"},
+            {"name": "active", "type": "bit"},
+        ]
+        columnar = to_columnar(rows, schema)
+        assert columnar.values == [
+            ["12345678901234567.89", 1.5], [0.1, "inf"], ["NaN", 2], [5, 0], [True, False]
+        ]
+
+    @pytest.mark.asyncio
+    async def test_summarize_mode(self):
+        """Summaries cover every row; data holds a sample and the rest stays in the store"""
+        pytest.importorskip("numpy")
+        provider = SchemaProvider()
+
+        async def execute_sql(app_id, sql, source_name):
+            rows = [{"id": i, "city": "sh" if i % 3 else "bj", "amount": None if i == 10 else i * 1.5}
+                    for i in range(1, 11)]
+            return {"data": [{"name": "output_standard_chart", "value": rows},
+                             {"name": "output_json_schema", "value": []}]}
+
+        provider.execute_sql = execute_sql
+        service = SQLService(provider, ResultStore(), max_rows=3, summary_sample_rows=2)
+
+        result = await service.execute_sql("app", "db", "SELECT * FROM orders", summarize=True)
+        assert [row["id"] for row in result.data] == [1, 2]
+        assert result.page.total_rows == 10 and result.page.next_cursor
+        summary = result.summary
+        assert summary.row_count == 10
+        ids, city, amount = summary.columns
+        assert (ids.min, ids.max, ids.sum, ids.distinct_count) == (1, 10, 55, 10)
+        assert ids.quantiles["p50"] == 5.5
+        assert sum(ids.histogram.counts) == 10
+        assert city.type == "string" and city.top_values[0].value == "sh" and city.top_values[0].count == 7
+        assert amount.null_count == 1 and amount.max == 13.5
+
+    @pytest.mark.asyncio
+    async def test_summarize_large_integer_ids(self):
+        """19-digit IDs are summarized exactly instead of failing the query"""
+        pytest.importorskip("numpy")
+        provider = SchemaProvider()
+
+        async def execute_sql(app_id, sql, source_name):
+            rows = [{"order_id": 1790000000000000001 + i, "wide": 2 ** 70 + i % 2} for i in range(20)]
+            return {"data": [{"name": "output_standard_chart", "value": rows},
+                             {"name": "output_json_schema", "value": []}]}
+
+        provider.execute_sql = execute_sql
+        service = SQLService(provider)
+
+        result = await service.execute_sql("app", "db", "SELECT * FROM orders", summarize=True)
+        assert result.success
+        ids, wide = result.summary.columns
+        assert ids.distinct_count == 20
+        assert (ids.min, ids.max) == (1790000000000000001, 1790000000000000020)
+        assert ids.sum == sum(1790000000000000001 + i for i in range(20))
+        assert ids.top_values[0].value == 1790000000000000001
+        assert sum(ids.histogram.counts) == 20
+        assert wide.distinct_count == 2 and wide.max == 2 ** 70 + 1
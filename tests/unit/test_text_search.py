@@ -0,0 +1,32 @@
+"""
+Unit tests for the BM25 text index
+"""
+from src.utils.text_search import BM25Index, tokenize
+
+
+class TestTextSearch:
+    """Test cases for tokenization and ranking"""
+
+    def test_tokenize_mixed_text(self):
+        """Chinese runs become bigrams, latin runs become words"""
+        assert tokenize("开户行 get_user_info") == ["开户", "户行", "get", "user", "info"]
+
+    def test_ranking_prefers_weighted_fields(self):
+        """A name match outranks a description match"""
+        index = BM25Index({"name": 3.0, "description": 1.0})
+        index.upsert("a", {"name": "发票查询", "description": "查询报销单"})
+        index.upsert("b", {"name": "报销单查询", "description": "含发票信息"})
+        index.upsert("c", {"name": "银行开户行", "description": "开户行列表"})
+
+        assert [doc_id for doc_id, _ in index.search("发票")] == ["a", "b"]
+        assert index.search("开户行")[0][0] == "c"
+
+    def test_upsert_and_remove(self):
+        """Replaced and removed documents leave no stale postings"""
+        index = BM25Index({"name": 1.0})
+        index.upsert("a", {"name": "orders"})
+        assert index.upsert("a", {"name": "orders"}) is False
+        index.upsert("a", {"name": "users"})
+        assert index.search("orders") == []
+        index.remove("a")
+        assert len(index) == 0 and index.search("users") == []